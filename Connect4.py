@@ -1,13 +1,15 @@
 import sys
-import math
-import random
+import time
+import argparse
+import functools
 import os
+import io
 import base64
-import tempfile
+
+STARTUP_TIME = time.perf_counter()
 
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide" # Hide "Hello from pygame community" text
 try:
-	import numpy
 	import pygame
 	from pygame import gfxdraw
 except ImportError:
@@ -19,9 +21,9 @@ except ImportError:
 		if os.name == 'nt': # Windows
 			import ctypes
 			MessageBox = ctypes.windll.user32.MessageBoxW
-			result = MessageBox(None, "Missing required modules, do you want to install these?\nThis will take a minute", "Missing Pygame/Numpy", 4)
+			result = MessageBox(None, "Missing required modules, do you want to install these?\nThis will take a minute", "Missing Pygame", 4)
 		else: # Assume POSIX
-			print("Install missing numpy/pygame libraries? [(Y)es/No]")
+			print("Install missing pygame library? [(Y)es/No]")
 			if input().lower() in {'yes','ye', 'y', ''}:
 				result = 6 # Same as MessageBoxW yes on Win32
 			else:
@@ -31,7 +33,6 @@ except ImportError:
 			print("Please wait a moment while modules are being installed")
 			# https://pip.pypa.io/en/latest/user_guide/#using-pip-from-your-program
 			subprocess.check_call([sys.executable, "-m", "pip", "install", "pygame"])
-			subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy"])
 			print("Done")
 			print("-------------")
 			subprocess.check_call([sys.executable, sys.argv[0]])
@@ -39,11 +40,13 @@ except ImportError:
 
 	checkRequirements()
 
+from engine import Position, TrackedPosition, NUM_ROWS, NUM_COLUMNS, addBoardArguments, checkBoardArguments
+from search import DEFAULT_BUDGET_MS # The AI modules themselves are imported on first use, see getAIPlayer()
+import perf
+from record import RecordWriter, DEFAULT_RECORD_PATH, ONLINE
+
 # Free Sans Font
 FONT_ENCODED = b'AAEAAAARAQAABAAQR0RFRhYyF2QAAGzYAAAAxEdQT1Oy47qzAABtnAAADmhHU1VC0XH4fgAAfAQAAAIKT1MvMmyHGDcAAExEAAAAVmNtYXCVsthkAABMnAAAAaBjdnQgAzYCuwAAUPgAAAAMZnBnbQ+0L6cAAE48AAACZWdhc3AAHgAJAABsyAAAABBnbHlmiWOTZQAAARwAAELQaGVhZO8Xm0oAAEasAAAANmhoZWEFpQM7AABMIAAAACRobXR4lVszHgAARuQAAAU8bG9jYeoz+xoAAEQMAAACoG1heHAC2wI1AABD7AAAACBuYW1lPN7JtQAAUQQAABSXcG9zdKMH+9EAAGWcAAAHKXByZXBckW5jAABQpAAAAFIAAgBYAAACZALZAAMABwAAMxEhESUhESFYAgz+RwFm/poC2f0nSAJJAAIAfAAAANAC2QAFAAkAABMRByMnERMVIzXQFicWU1QC2f6u398BUv2PaGgAAgA0AdABMQLFAAUACwAAEzMVByMnNzMVByMnNF0bJxugXRsnGwLFb4aGb2+GhgAAAgAO/+wCHgK5ABsAHwAAAQczFSMHMxUjByM3IwcjNyM1MzcjNTM3MwczNwMjBzMB5SRdah9pdSdMJnwnTCZlch9seSRMJH0jMHwgfQK5xESuRNPT09NErkTExMT++K4AAwAh/4ICBgMCAC4ANAA7AAAlFAYHFSM1LgE9ATMeBxcRJicmNTQ2NzUzFR4BFSMuAScVHgYlNQ4BFRQTPgE1NCYnAgZvaTtlbU8CAQYHDRIaJBZdIUdlYDtbZ08BQDIENBwzHyIQ/u04PK9DQzlNw2BzB2dnB25hERQNJQ8eDxILAwEQHBgzX1VnDDY2B2lVN0YC+QEOChYbJzix8Ag+MVr+eghKNzE2FwAFAB3/7ANbAsUACQAVABkAJAAwAAATMhYVFAYiJjQ2FyIGFRQWMzI2NTQmJTMBIwEyFhUUBiMiJjQ2FyIGFRQWMzI2NTQmx0hjZIxlZEYpPDwqKTw7AW9C/nVCAdpIY2VFR2RkRik8PCopPDsCrWRJRWRljGVGOyopPDspKzte/ScBVmRIRWRljGRGOykqOzsoKzsAAwA0/+kCfQLFAB4AKgAzAAAlBgcGIyImNTQ2Ny4BNTQ2MhYVFAYHFzY9ATMUBxcjAz4BNTQmIyIGFRQWEycOARUUFjMyAdIyIDtEXHFFXS8iZI5cPE6FH1A6em3zOywxJicvGbKgRDZNNklOMRIibVpEWzY7RSNCW1hFNkwsozc8BF5ZlwGvJTQiJTAvJxsr/qbIK0UqNUsAAAEAMAHQAI4CxQAFAAATMxUHIycwXhsoGwLFb4aGAAEASf8sASMC2QAKAAATMwYVFBcjJgI0Nuw3iYk3S1hYAtnd+fjfYgD/7P4AAQAm/ywBAALZAAoAABcjNjU0JzMeARQGXTeJiTdLWFjU3fn432L/7P4AAQAoAbkBVwLZAA4AABMzBzcXBxcHJwcnNyc3F6A/BWoTbEYzPj8yRWwTagLZcCY7HlkkXV0kWR47JgAAAQAy//YCFgHaAAsAAAEVIxUjNSM1MzUzFQIWz0bPz0YBC0bPz0bPzwAAAQBX/20AwABoAAoAADczFRQjNT4BPQEjV2lpIxk8aHiDJgEmNBIAAAEALgDwARwBOAADAAABFSM1ARzuAThISAAAAQBXAAAAvwBoAAMAADcVIzW/aGhoaAAAAf/4/+wBHALZAAMAABMzAyPlN+03Atn9EwACACv/6QH7AsUADQAVAAATND4DMzIRFAYjIiYAIBEQMzI2NSseLkA7Ieh3cXJ2AXb+5IxKRgFXWYhNMBD+jK+5uwHT/t/+3JCXAAEAZgAAAVsCxQAIAAABIzU+ATczESMBA51mPhc6WAH5Pw0uUv07AAABACIAAAH/AsUAGQAAEzYzMhYVFA8BDgEHIRUhPgE/ATY1NCYjIgcyB+NlfpZkQTgHAXX+KAZSb1xgUDyFCgHP9nRchFI2I0ItV3V/PzQ3VTlMqQABACD/6QH6AsUAJAAAASIGByM2MzIWFRQHHgEVFAYjIiczHgEzMjY1NCMHIzU+ATU0JgEOTDkCWAXZZXNjQDiDbdoQWAVISEVOkyULX09DAnhTReVoW2wnFk9EZXjlTUpLQ4EBSwIsQThBAAACABwAAAIIAsUACgANAAAlITUBMxEzFSMVIzURAwFH/tUBQkFpaVjeql0Bvv40T6r5ATb+ygABACP/6QIBAsUAIQAAARUhBzYzMhYVFAYjIi4FJzMWMzI2NTQmIyIGByMTAdz+2Rw7SGZ/iGspRS0lExEEA1gfckhTVEcpOh9RNQLFV8Yrg2lwjhIZKR8vEhF3WExPWx0lAYIAAgAr/+kCAQLFABkAJQAAEzQ+AzMyFhcjLgEjIgYHNjMyFhUUBiMiEyIGFRQWMzI2NTQmKyIzRz8jUWsNWAs+LkxRATppX3qDZe7yQVJSPj1QSgFDXo9SMxBiVzM4i4JPfmNohwGCU0JEW1dDR1MAAAEALgAAAggCxQAKAAABFQYCByM2EjchNQIIeIsdXih8f/6BAsVKoP7Pqq8BCrVXAAMAJf/pAgECxQATAB4AKAAAARYVFAYiJjU0Ny4BNTQ2MhYVFAYmIgYVFBYzMjY1NAYiBhQWMzI2NTQBh3qF0oV5Nip3vHcqc3BDQzg3RDmEUlFBQ1MBdTp3YXp7YXY6IkAxU2pqUzJA4T0zMj08MjTsTXxOTT8+AAIAJv/pAf0CxQAYACMAAAEUDgMjIiYnMx4BMzI2NwYiJjU0NjMyByIGFRQWMjY1NCYB/SIzR0AjUWsNWAs+LkxRAULAeoNl7/A9UEqAU1IBa16PUjMQYlczOIuCT35jaIdNWENHU1RBRVsAAAIAbgAAANYCDAADAAcAADcVIzUTFSM11mhoaGhoaAGkaGgAAAIAbv9tANcCDAADAA4AABMVIzUDMxUUIzU+AT0BI9doAWlpIxk8AgxoaP5ceIMmASY0EgABAC3/9wIWAdoABgAANzUlFQ0BFS0B6f52AYrGRc9PoaRPAAACADIAbwIWAWEAAwAHAAABFSE1BRUhNQIW/hwB5P4cAWFGRqxGRgAAAQAy//cCGwHaAAYAAAEVBTUtATUCG/4XAYr+dgELRc9PoaRPAAACAE0AAAH9AuUAGwAfAAABFA4DHQEjNTQ+AzU0JiMiBhUjNDYzMhYDFSM1Af0lNDUlWiU1NCVGOkk4VW9sYXSzWgIlLkoxLTkgLzclQjAwPSMzP1JKc3do/etoaAAAAgAi/3IDtwLlADUAQQAAATMDBhUUFjMyNjU0JiMiBhUUFjMyNxcGIyIuATU0Njc+ATMyFhUUBwYjIicGIyImNTQ2MzIXAzI2NTQmIyIGFRQWAplTWgweFEBo0Y+e69ifT3IccHJ80nlUSkKyWa/7VkxuYA5CTEZdnGVUJr5BWzYoP2I6AfX+6CMPEhqOWH226p2PwyBDKmu4bWK9QzxF3Jh7ZFlNSGlObahX/sumTCY0glQxRQACABEAAAKNAtkABwAKAAAlIQcjATMBIwsCAdr+501jAQR4AQBoZXB429sC2f0nASkBTP60AAADAE8AAAJvAtkADwAVAB8AACUUBiMhESEyHgIVFAceASY0KwEVMxMyPgE1NCYrARUCb3Zh/rcBKD1aLRRlRj99krS0LzE+FEQ/49BecgLZJDs7H3AvG1SN6Oj+sys0HjlF+wAAAQAw/+kCpQLlAB0AABM0PgMzMhcjLgEjIgYVFBYzMjY3MwIhIi4DMBEwR3lM7itfEF5XanuAbVpgEWAh/vVLd0cvEQFkMmJqTzTuTk6ijImhZWr+3zNOaWAAAgBZAAACmwLZAAcAEAAAMxEhMhYQBiMnMzI2NTQmKwFZARmLnp+KvKxscHBsrALZwv6sw1KQiouQAAEAWgAAAmUC2QALAAATFSEVIREhFSEVIRW3Aa799QH5/mQBjQFM+lIC2VLpUgABAFoAAAJDAtkACQAAExEjESEVIRUhFbddAen+dAFcAUz+tALZUulSAAABACz/6QLFAuUAJAAAExQeAzMyNj0BIzUhESMnBiMiJjU0PgMzMhYXIy4BIyIGiQ4kOV48ZIHeATA7F2iRlLoSMkt/UH2hE18PcVN0jAFqJk1UPyl+YhRS/nthdNSoMGFqUDV6b0ZRowAAAQBTAAAChALZAAsAAAEhESMRMxEhETMRIwIn/oldXQF3XV0BTP60Atn+xQE7/ScAAQBkAAAAwgLZAAMAABMRIxHCXgLZ/ScC2QABABH/6QGqAtkAEQAANzI2NREzERQGIyImPQEzFRQW3UAwXW9fXm1fODdUTQIB/d1fbmhZQC9ARAAAAQBPAAACkgLZAAsAABMVIxEzEQEzCQEjAaxdXQFreP7XASxu/v8A//8C2f6PAXH+1/5QAXYAAQBQAAACFQLZAAUAABMRIRUhEa0BaP47Atn9eVIC2QABAEsAAAL5AtkADAAAISMDESMRMxsBMxEjEQHUYs9YgdjUgVgCY/2dAtn9hQJ7/ScCYwAAAQBMAAAChgLZAAkAAAERIwERIxEzAREChmn+h1hlAX0C2f0nAk/9sQLZ/awCVAAAAgAm/+kC5gLlAAoAFAAAARQGIyImEDYzMhYlIgYQFjI2NTQmAubAoJ7Cwp2gwf6fdI6P6I+OAWGi1tMBVtPUgqX+8qWkhIqmAAACAFsAAAJpAtkACgASAAABFAYrAREjESEyFgUzMjY0JisBAmlxW+VdAS1sdf5PwkNLS0PCAgNdcf7LAtlv40R4RAACACb/xQLmAuUADgAcAAAFBycGIyImEDYzMhYVFAcnFzY1NCYiBhAWMzI3JwLdL2lWaZ7Cwp6dw2eeWU+P6I+OdDw8SgE6VzPTAVbT0qqscYFJWYuGpaX+8qUcPgAAAgBdAAACpwLZAB0AJgAAAR4DFRQGFRQWFxUjJj0BNCYrAREjESEyFhUUBic0JisBFTMyNgIYICsTBgESGnEUOj7wXQFQa3M2K0xD4eFKRQFoDiYwKh0JIggpOBIXLklBQz/+xgLZZV4+UoNINvs8AAEAMP/pAm0C5QAwAAAlMj4CNTQvASY1NDYzMhYXIy4BIyIGFRQWHwEeARUUDgMjIi4DJzMVFB4CAVY4TiUPhrWPi3h+jAFYAV5XSlk2QrdKUQ8oPmdBKUtOOCUBWBMrVTsaKikXUyMwJYVjc3drR01ENyowEjEUYEMdOT0uHg0jN1w8BR82NB8AAAEAFQAAAlEC2QAHAAABESMRIzUhFQFiXfACPAKH/XkCh1JSAAEAVf/pAoUC2QARAAABMxEUBiMiJjURMxEUFjMyNjUCKF2ZgIKVXWVVWGQC2f4AboKBbwIA/gBPT1RKAAEAHgAAAoUC2QAGAAAhIwEzGwEzAYhk/vpk1spjAtn9lwJpAAEAFgAAA6EC2QAMAAAhIwsBIwMzGwEzGwEzAuhmqKNmu2iJomSmhmgCV/2pAtn9sAJQ/bACUAAAAQAWAAACiQLZAAsAAAkBIwsBIwEDMxsBMwGHAQJzx8hxAQLycbu8bwF2/ooBMP7QAXYBY/7iAR4AAAEADQAAApUC2QAIAAABESMRATMbATMBg13+53PW0G8BHv7iAR4Bu/6dAWMAAQAcAAACRwLZAAkAAAEVASEVITUBITUCRf5MAbb91QG2/mYC2VT9zVJSAjVSAAEAQP8sAPoC2QAHAAATFSMRMxUjEfpnZ7oC2Uj840gDrQAB//j/7AEcAtkAAwAAGwEjAy/tN+0C2f0TAu0AAQAW/ywA0ALZAAcAABc1MxEjNTMRFmdnutRIAx1I/FMAAAEALAFJAakCxQAGAAATMxMjCwEjxUmbRXp5RQLF/oQBLP7UAAH/6v9QAkL/ggADAAAFFSE1AkL9qH4yMgAAAQAWAlAA5wLkAAMAABMXIyeHYDyVAuSUlAACACr/6QIXAhsAKQA0AAATNjMyFhURFDMyNxUGIyImJwYjIiY1ND4HNz4BPQE0JiMiBgcTMjY9AQ4DFBZBBsxhZC0JCSMWKCkFVF5PXQkLHBMtGDwcJDEmPTg6PAVTRVgZZUo8NgFxqklG/swpAj8JJShNVEcXJh0ZEA8HCgQFBhoaFiYoLTD+wUkqXgwQDC1QLAAAAgA2/+kCCwLZAA4AGQAAEzMRNjMyFhUUBiMiJxUjEyIGFBYzMjY1NCY2UzlpaHh8aGs7S+VCUFBCRFVTAtn+7FaUf4KdWkMBzW+4b29ZXnAAAAEAH//pAd0CGwAYAAABIy4BIyIGFRQWMzI3Mw4BIyImNTQ2MzIWAddUCEA0RE1ORWsVVAhwXmt9f2pbbQFcNztvYl1qfmBrlX+CnGIAAAIAGv/pAe8C2QAPABsAAAERIzUOASMiJjU0NjMyFxEDIgYVFBYzMjY1NCYB70oiTzZqentmbDWTRFRURUJQUALZ/SdFMSuZhX2XUQEP/vRwW1xvbltebwACACj/6QIBAhsAFAAdAAAlIRYXFjMyNzMOASMiJhA2MzIWFxYFITY1NCYjIgYCAf5+ARsrU2YjVBB2Wm6Ag21KcRkV/oABJgFUPT9S6kgoRGlWYJUBAptKQDcsAgRBWVcAAAEAEgAAAQIC3AAUAAABFSMRIxEjNTM1NDYzMhcVJiMiHQEBAldTRkZBOhcYEwo6AgxE/jgByERZOD8FRQE1UgACAB3/JgHpAhsAHAAoAAAXIiY1NDYzMhc1MxEUDgIjIiYnMxYzMjY9AQ4BAyIGFRQWMzI2NTQm9Vx8e2RiPk0SMF9JXG4HVQ5xVD4jSyFDTk5EQkxLF5d9gJ5bTP5KS2VWKlRKWF9hGzIsAeVuXl9ta15ibQAAAQBGAAAB5gLZABMAAAE0JiMiBhURIxEzET4BMzIWFREjAZNDKUBOU1MlSzhMWVMBazcwYVD+3wLZ/uswJ01C/nQAAgBCAAAAlgLZAAMABwAAExEjETcVIzWWU1NUAgz99AIMzWlpAAAC/+7/JgCZAtkADAAQAAATMxEUIyInNRYzMjY1ExUjNUZTjw0PDAskHVNTAgz9h20DRwIfJwMlaWkAAQA6AAAB9gLZAAsAABMRNzMHEyMDBxUjEY3ea7bWZ7FRUwLZ/lXetf6pARxQzALZAAABAEQAAACYAtkAAwAAExEjEZhUAtn9JwLZAAEARgAAAvoCGwAhAAATMxU+ATMyFz4BMzIWFREjETQmIyIGFREjETQmIyIGFREjRk0iSzRhLCVINElPVDMuM0hUMy4zSFQCDEovKlAsJEtH/ncBaTI3UDn+twFpMjdQOf63AAABAEYAAAHnAhsAEwAAEzMVPgEzMhYVESMRNCYjIgYVESNGTSNROkxaUzoyQE5UAgxYNzBOQf50AWsvOGFQ/t8AAgAk/+kB/gIbAAoAFQAAATIWFRQGIyImEDYXIgYUFjMyNjU0JgEQcX1/bnB9fm9GUFBGRVFPAhuViIGUlQEIlU1tvm1tXGFuAAACADb/JgILAhsADgAZAAAXETMVNjMyFhUUBiMiJxETIgYUFjMyNjU0JjZNO2xoeXtlYUCSQlBQQkRUU9oC5k9emoR9l07+7wKnb7hvb1lecAAAAgAa/yYB7wIbAA4AGgAABSMRBiMiJjU0NjMyFzUzByIGFRQWMzI2NTQmAe9TOWloeHxoazxK5UVUVEVCUE/aARZTlH+CnVVGP3BbXG9uWl5wAAEARQAAAUECGwANAAABDgEVESMRMxU+ATMyFwFBVFRUTSRDKAsVAcMCSmf+8AIMXzszAwABACL/6QHLAhsAJAAANx4BMzI2NTQmLwEuATU0NjIWFyMmIyIGFRQWHwEeARUUBiMiJ3oGNUU3QyYrTl1JbrZiAVgDZjM8LjNQTkZ1Y8sGnC83LSUdIgoTFkM+SVdUTVQrJBwjDBMTRTpMWrMAAAEADv/pAP4CnAAVAAATFSMRFBYzMjcVBiMiJjURIzUzNTMV/lYTGxkPJx0xNEdHUwIMRP6ZHBMERgcrKAGMRJCQAAEAQf/pAeICDAATAAAhIzUOASMiJjURMxEUFjMyNjURMwHiSyVQOkxbUzoyQU5TSTQsTkEBlP6NLzhhUAEpAAABAAoAAAHmAgwABgAAISMDMxsBMwEdW7hejJReAgz+VwGpAAABAAYAAALEAgwADAAAISMLASMDMxsBMxsBMwIqX2plXphca2RmZ2heAZv+ZQIM/mgBmP5oAZgAAAEAEQAAAdkCDAALAAABEyMnByMTAzMXNzMBJLVhg4Vfua9ffn5eAQ/+8cnJAQsBAb6+AAABABT/JgHeAgwAEAAAATMDBiMiJzUWMzI2PwEDMxMBhFrpKV4fGRsRGh4LILFZhgIM/YZsDUsGFxxTAg7+aAAAAQAfAAAByQIMAAkAAAEVASEVITUBITUBu/7JAUX+VgE5/twCDEr+h0lLAXhJAAEAK/8sARQC2QAhAAABFSMiBh0BFAYHFh0BFBY7ARUjIiY9ATQmJzU+AT0BNDYzARQPJRokLlIaJQ8uNDkiLCwiOTQC2UEcJ7VFRhImeLUnHEFFPqdFPAlFCTtGpz5FAAEAZP8sAKAC2QADAAATMxEjZDw8Atn8UwAAAQAd/ywBBgLZACAAABc1MzI2PQE0NyY9ATQmKwE1MzIWHQEUFhcVDgEdARQGIx0QJRtSUhslEC80OiErKyE6NNRBHCe1eCUmeLUnHEFFPqdFPAlFCTxFpz5FAAABAEsBDAH8AbYAFQAAEyIHIz4BMzIfARYzMjY1MxQjIi8BJrUvBjUENzEbG3UcFh4VNWknKmIXAXNORksQRRElJo8aPw7//wAAAAAAAAAAEAIAAwAA//8Aev8zAM4CDBAPAAQBSgIMwAAAAgA0/4gB/gJ0ABkAHwAAARE2NzMOAQcVIzUuATU0Njc1MxUeARcjLgEDEQYVFBYBOGASVAVqVypldXVlKlhjBVQFOViDRQHO/mcLdFptBGFiCZN3epgLWlkGY1YyPP5tAZYYuFVnAAABABr/6QIXAtkANQAAExQeARczFSMWFRQGBzYzMhYzMjcXBiMiJiMiByc+ATU0JyM1My4BNTQ2MzIeAxcjJiMiBpMPJgagiA8zQzs/IWgYKCsqOUorhiM1ODBFOBhuUSITiWUdNT4sHwFYBIRATQILHCw+DTcrHCdSRCcfHkI4LiVCO1YuJig3OTEhW3sJHjFXOZpGAAACAEMAhQHpAicAGwAmAAAlBycGIyInByc3JjU0Nyc3FzYzMhc3FwcWFRQHJyIGFBYzMjY1NCYB5To1KDw1KTM4MCAgNjg3LDU6KDs5NxodnSw+PywrPz6+NjUeGTM5MSs7OS03NTcaHDU6Nyk0Mi/JPlY9PSosPgABAAsAAAIhAsUAFgAAARUjFTMVIxUjNSM1MzUjNTMDMxsBMwMB76qqqlisrKyXzVW5s1XJAWIzTTOvrzNNMwFj/r4BQv6dAAACAGT/LACgAtkAAwAHAAATMxEjFTMRI2Q8PDw8Atn+b4v+bwACACv/KwH6AtkANAA/AAAXFBYzMjY1NC8BLgE1NDY3JjU0NjIWHQEjNTQmIyIGFRQWHwEeARUUBx4BFRQGIyIuAzU3FzY1NC8BDgEUFqI9KSs1N6oxKzI3LGucYVQ1LCYzGSCSPTBtHhdrUBguNCcZb6ZJSaEnIBoORTUwJjImdSJKMTJHHTMzRWBiTxwaLzcwJRYiFV4nSjZzKSI0IEhgCBsqSjDzeyc/PTNtGi08KAD//wAZAmQBNALMECYAzFkAEAYAzKYAAAP/8//qAu8C5gAaACUAMAAAAQ4EIyImNTQ2MzIXIy4BIyIGFRQWMzI3ACAWFRQGIyImNTQkIAYVFBYzMjY1NAIoBgcbIUAoVmxtWIMjRw0tKDlERThWFP7yATzg4aKa3wIA/vy4t3+FuQE4GxxAJB+BZmmCmzIrXU9IYnwBrt+eoN/inJ6ivISDvbuGgwADACUBLwFNAuYAAwAjAC0AAAEVITUlFQYjIicGIyImNTQ2Nz4BPQE0IyIGByM2MzIdARQzMicOAhUUMzI2NQFA/usBIhAQLwgxODA4RFkcFUMiHQU7A356FwRUE1MuOSU2AWIzM18sBisrNCwxMQcCDhENLBggbF6zF3oIChcdLygaAAACAC0AagGSAbYABgANAAA3NTcVBxcVNzU3FQcXFS2Yamo1mGpq41l6U1NTU3lZelNTU1MAAQAoAFYCIAF3AAUAABMhESM1ISgB+Eb+TgF3/t/bAAABAC4A8AEcATgAAwAAARUjNQEc7gE4SEgAAAT/8//qAu8C5gAbACMALgA5AAABHgEVFAYVFBcVIyY1NDU3NCYrARUjETMyFRQGJzMyNTQmKwEmIBYVFAYjIiY1NCQgBhUUFjMyNjU0Ae8bEwEXTw8BHiKGRs6NF/6BSyMogT0BPODhoprfAgD+/Li3f4W5AWgSLyAGGQUtERkjJQIDKCQguQG9fiIqBUMjINzfnqDf4pyeoryEg727hoMAAAEAHAJ3AS4CvQADAAABFSE1AS7+7gK9RkYAAgCXAX8BxgKuAAoAFQAAATIWFRQGIyImNDYWIgYVFBYzMjY1NAEvPllZQD1ZWWZOODcmKDgCrlk+QFhafFk5OCYnODcoJwAAAgAy//UCFgJvAAsADwAAARUjFSM1IzUzNTMVExUhNQIWz0bPz0bP/hwBoEbPz0bPz/6bRkYAAQATARwBRgLFABwAABMiDgIHIzYzMhYVFA8BDgEHMxUhPgE/ATY1NCayGiQRBwE+BJNAUmA/IR8J5f7QBDNIOjsxApASIB0UmEY4Ui8gESMcOklMJh8gLyArAAABABABDgFCAsUAJQAAEyIGFSM2MzIWFRQHFhUUBiMiJjUzHgEzMjY1NCYnJiM1MjY1NCapLiM/A41ASzlHVUZITz4CLC0qMCAaDzNALikCkC0sjkA4OxoYTD1JSkQuKysmGycEAjMaIyAkAAABAFwCUAEtAuQAAwAAEzMHI7xxlTwC5JQAAAEAQf8kAiACDAAaAAAlFQYjIicGIyInFSMRMxEUFjMyNjURMxEUMzICICEYUwM7aDYkU1M6MUFOUy0IMT8JU1Ma3wLo/o0vOGFQASn+TCkAAQAw/08CCgLZAA8AAAEuATU0NjsBFSMRIxEjESMA/2Fugl76OUBSQAEDBYNeZYtA/LYDSvy2AP//AFcA4wC/AUsQAwDM/+T+fwABACf/KgEfAAAAGgAAFx4DMzI2NTQjIgcnNzMHNjMyFhUUBiMiJzwJIREaDRcfLg8QDComFw0PJilCOS9OjAQQBwYaEyUIB1w4AiMgKzIiAAEARQEcAOYCxQAJAAATIzU3PgE3MxEjqGMPNiQNKz4CRC4BBR0w/lcAAAMAKAEvAUQC5gADAA4AGQAAARUhNRMyFhUUBiImNTQ2FyIGFRQWMjY1NCYBOv75g0RKS4ZLS0MnLS1OLSwBYjMzAYRaVE9aWlJRWjRANzhAPzc5QAD//wAuAGoBkwG2EA8AbQHAAiDAAAAEAD3/7ANRAsUACQANABgAGwAAEyM1Nz4BNzMRIwEzASMlIzUTMxEzFSMVIz0BB6BjDzYkDSs+AeM6/jw6AhG8zC5DQz6BAkQuAQUdMP5XAan9J3g7AQr+8DVkmaqqAAADAD3/7ANMAsUACQANACoAABMjNTc+ATczESMBMwEjASIOAgcjNjMyFhUUDwEOAQczFSE+AT8BNjU0JqBjDzYkDSs+Acs6/jw6AhEaJBEHAT4Ek0BSYD8hHwnl/tAEM0g6OzECRC4BBR0w/lcBqf0nAYgSIB0UmEY4Ui8gESMcOklMJh8gLyArAAAEABr/7ANEAsUAJQApADQANwAAEyIGFSM2MzIWFRQHFhUUBiMiJjUzHgEzMjY1NCYnJiM1MjY1NCYlMwEjJSM1EzMRMxUjFSM9AQezLiM/A41ASzlHVUZITz4CLC0qMCAaDzNALikBqjr+PDoCB7zMLkNDPoECkC0sjkA4OxoYTD1JSkQuKysmGycEAjMaIyAkNf0neDsBCv7wNWSZqqr//wBg/ycCEAIMEA8AIgJdAgzAAP//ABEAAAKNA5wQIwDLAKgAuBICACQAAP//ABEAAAKNA5wQIwDKALYAuBICACQAAP//ABEAAAKNA58QIwDJAKwAuhICACQAAP//ABEAAAKNA3cQIwDOAK8AqhICACQAAP//ABEAAQKNA3EQIwBqAK4ApRICACQAAf//ABEAAAKNA8YQIwDNAKgAwhICACQAAAACAAsAAAO2AtkADwATAAAlIQcjASEVIRUhFSEVIRUhGQEjAwHU/vNVZwErAm7+jQFg/qABhf4eZIrW1gLZUulS+lIBKAFf/qEAAAEAMP8qAqUC5QA3AAAlMjY3MwIhBzYzMhYVFAYjIic3HgMzMjY1NCMiByc3LgEnLgE1ND4DMzIXIy4BIyIGFRQWAXpaXxJgIf73DQ0PJilCOTBNFQcfEhwOFx8uDxALHzg8IURMETBHeUzuK18QXFhre4A6ZGz+3yECIyArMiIoAw8IBxoTJQgHRQgVFzGsajJiak807k1PooyJogD//wBaAAACZQOZECMAywC5ALUSAgAoAAD//wBaAAACZQOdECMAygCyALkSAgAoAAD//wBaAAACZQOeECMAyQC1ALkSAgAoAAD//wBaAAACZQN0ECMAagC0AKgSAgAoAAD//wAAAAAA0QOdECMAy//qALkSAgAsAAD//wBHAAABGAOdECMAyv/rALkSAgAsAAD/////AAABHgOdECMAyf/rALgSAgAsAAD//wAJAAABJANyECMAav/wAKYSAgAsAAAAAgAUAAACmwLZAAsAFwAAEyM1MxEhMhYQBiMhExEzMjYQJisBFTMVWUVFARqKnp6K/uZdrWtwcGutqwFTQwFDwv6swwFT/v+QARaP8UP//wBMAAAChgNmECMAzgDHAJkSAgAxAAD//wAm/+kC5gOaECMAywDgALYSAgAyAAD//wAm/+kC5gObECMAygDlALcSAgAyAAD//wAm/+kC5gOgECMAyQDjALsSAgAyAAD//wAm/+kC5gNyECMAzgDjAKUSAgAyAAD//wAm/+kC5gN0ECMAagDiAKgSAgAyAAAAAQBfACIB6AGrAAsAAAEXBxcHJwcnNyc3FwG2MZKTMpOSMpOSMZIBqzKSkzKTkjGTkjGRAAMAHv/pAugC8wATABsAIwAAPwEmNTQ2MzIXNxcHFhUUBiMiJwc3ASYjIgYVFAkBFjMyNjU0HlFMw52JXVcoWVTDnZBhTWkBgElidI8B0f59Smt0jxNZapKq01FfJGFqnqrTWlTBAaNApYZoASr+W0qlhnL//wBV/+kChQOcECMAywDHALgSAgA4AAD//wBV/+kChQOcECMAygDHALgSAgA4AAD//wBV/+kChQOdECMAyQDKALgSAgA4AAD//wBV/+kChQNxEiIAOAAAEAMAagDKAKX//wANAAAClQObECMAygCxALcSAgA8AAAAAgBbAAACaALZAAwAFAAANxUjETMVMzIWFRQGIyczMjY0JisBuF1d0Gh4clnlwkFJSUHCvb0C2XhxY1t1UkR4RAAAAQBD//ECOwLYACUAAAEyNTQmIyIGFREjETQ2MhYVFA4CBx4BFRQGIyInNRYzMjU0KwEBJptPSVA+WHncgREhEQ80QIpyFCEWFqqqEAGrcTM9SEb+AgIUWWtiUiI2JA4KDmYyf3oHSwOWjAD//wAq/+kCFwLYECIAy3P0EgIARAAA//8AKv/pAhcC2BAiAMpz9BICAEQAAP//ACr/6QIXAtcQIgDJcPISAgBEAAD//wAq/+kCFwLFECIAznH4EgIARAAA//8AKv/pAhcC1xAiAGpwCxICAEQAAP//ACr/6QIXAwQQIgDNbAASAgBEAAAAAwAq/+kDVQIbAC8AOwBCAAAlHgMzMjczDgEjIicmNQ4BIyImNTQ+BT0BNCMiByM2MzIXPgEzMhYXFhUFMjY9AQ4DFRQWJSE0JiMiBgHTAR4wMRplJVQQdlmIOAI4ZTtMXBoqRkdmJHZwClQGyoAvG1w2SXAaFf2QRloeZ0c4NgEeASZQQD9S6jRLJRBpVWFrAgE6NFRHJjkkGAwIGh0WTl2qUiYsSkA3cLhRGmUNEQosKCct/EdZVwAAAQAf/yoB3QIbADUAABcuBDU0NjMyFhcjLgEjIgYVFBYzMjczDgEjBzYzMhYVFAYjIic3HgMzMjY1NCMiByfhNU4mFQR/alttB1QIQDRETU5FaxVUBXRcDQ4OJSpCOS9OFQcfER0OFx8uDxAMFQo4PVAsF4KcYl03O29jXWp/Xm0hAiMgKzIhKQMPCAcaEyUIB///ACj/6QIBAtoQIgDLdvYSAgBIAAD//wAo/+kCAQLaECIAynj2EgIASAAA//8AKP/pAgEC1xAiAMl78hICAEgAAP//ACj/6QIBAtcQIgBqdQsSAgBIAAD//wAAAAAA0QLaECIAy+r2EgIAwgAA//8AKQAAAPoC2hAiAMrN9hICAMIAAP////kAAAEYAtkQIgDJ5fQSAgDCAAD////wAAABCwLYECIAatcMEgIAwgAAAAIAJP/pAf4C5wAfACoAABM0PgMzMhcmJwcnNyYnNxYXNxcHHgQVFAYiJhMiBhQWMzI2NTQmJB0tPDgcGCcnO2EkVR40LCVKYShaHipGKyJ84nztRlBQRkVRTwECQGU8Jw8NKDEtJygXHSwQLy0lKRcjTUxzPoeTkwFSbb5tbVxhbv//AEYAAAHnAsIQIgDOdPUSAgBRAAD//wAk/+kB/gLZECIAy231EgIAUgAA//8AJP/pAf4C2hAiAMpu9hICAFIAAP//ACT/6QH+AtoQIgDJbvUSAgBSAAD//wAk/+kB/gLEECIAzm73EgIAUgAA//8AJP/pAf4C2RAiAGptDRICAFIAAAADADIAAAIWAdgAAwAHAAsAAAEVITUFFSM1ExUjNQIW/hwBJmhoaAEPRkanaGgBcGhoAAMAEv/iAhECGwATABsAIwAAAQcWFRQGIyInByc3JjU0NjMyFzcHAxYzMjY1NAUTJiMiBhUUAhE/LH1vZzw9IEIwfm9lQTpc7is/RlD+6e8pRUZQAf9HSW2ElT5FHEpHc4SVQUGo/vMwbV9CtwENNG1fRAD//wBB/+kB4gLZECIAy2z1EgIAWAAA//8AQf/pAeIC2RAiAMps9RICAFgAAP//AEH/6QHiAtkQIgDJb/QSAgBYAAD//wBB/+kB4gLZECIAamgNEgIAWAAA//8AFP8mAd4C2RAiAMpR9RICAFwAAAACADb/JgIKAsoADgAZAAAXETMVNjMyFhUUBiMiJxETIgYUFjMyNjU0JjZTOGlmentlYUCSQlBQQkRUU9oDpP9QnIJ9l07+7wKnb7hvb1lecAD//wAU/yYB3gLZECIAalYNEgIAXAAAAAEAVAAAAKcCDAADAAATESMRp1MCDP30Agz//wBk/+kCmgLZECMALQDwAAAQAgAsAAD//wBC/yYBOwLZECMATQCiAAAQAgBMAAAAAgAr/+wDvwLlABwALQAAEzQ+AzMyFzUhFSEVIRUhFSEVITUGIyIuAzcUHgMzMjcRJiMiDgMrKD1STSd5PgGt/rABSP64AVX+TkN1KE1SPCddGik5NB19Ozt8HzU5JxoBZFiLVDYUWExS7lL1UkpeFDVRiFpJbj8nDXgBZXgOJ0BuAAMAJP/pA38CGwAfACoAMQAAJR4DMzI3Mw4BIyInBiMiJjU0NjMyFz4BMzIWFxYVJCIGFRQWMzI2NTQXITQmIyIGAf0BHjAxGmYjVBB2WYQ+P4NxfHxxhz0fZT1KcRkV/diMUFBGRVFYASZQQD9S6jRLJRBpVmBnZ5OHhpJqMjhKQDdw5G1eYG1sXmEzR1lXAAEAVwH3AMAC8gAKAAATIzU0MxUOAR0BM8BpaSMZPAH3eIMmASY0EgABAFcByQDAAsQACgAAEzMVFCM1PgE9ASNXaWkjGTwCxHiDJgEmNBIAAQAUAk8BMwLlAAYAABMzFyMnByN0X2A/UU9AAuWWYGAA//8AXAJQAS0C5BACAHYAAP//ABYCUADnAuQQAgBDAAAAAQBzAmQA2wLMAAMAABMVIzXbaALMaGgAAgA9AjIBEQMEAAoAFQAAEzIWFRQGIiY1NDYXIgYVFBYyNjU0JqcsPj9WPz8rEhoaJBoZAwQ+LCs9PisqPz4aERIaGhETGQAAAQAFAmUBPwLNABAAABMyFjMyNzMGIyImIyIHIz4BWxlYFBkMOg9KFGQOFwo6CC0CzSUlaCYlMTYA///9p/7q////ghAnAEL9vf+aEAcAQv29AAAAAQAuAPABHAE4AAMAAAEVIzUBHO4BOEhIAP//AC4A8AEcATgQAgDgAAD////7APACMQE4EAIA4wAAAAH/+wDwAjEBOAADAAABFSE1AjH9ygE4SEgAAf/3APAD6QE4AAMAAAEVITUD6fwOAThISP////cA8APpATgQAgDkAAD//wBL//IA7QKkEAYBSAAA////a/7qAcP/ghAHAM8BxAAAAAEAQQHyAJ4C2gAIAAATIzU0NxUGFTOeXV0wMAHyZXsIJgpQAAEAQAHxAJ0C2QAIAAATMxUUBzU2NSNAXV0wMALZZXsIJghSAAEAQf+AAJ4AaAAIAAA3MxUUBzU2NSNBXV0wMGhlewgmCFIAAAEAQAHxAJ0C2QAJAAATFSMVFBcVJj0BnTAwXQLZaAZNByYIe2X//wAwAfIBKwLaECcA6ACNAAAQBgDo7wD//wAxAfEBLgLZECcA6QCRAAAQBgDp8QD//wAv/4ABLABoECcA6gCOAAAQBgDq7gD//wAxAfEBLgLZECcA6wCRAAAQBgDr8QAAAQAm/08CAQLFAAsAAAEVIxEjESM1MzUzFQIBwljBwVgB9lL9qwJVUs/PAAABACb/TwIBAsUAEwAAARUjETMVIxUjNSM1MxEjNTM1MxUCAcLCwljBwcHBWAH2Uv7NUtDQUgEzUs/PAAABADIA3AEsAdYACQAAEjIWFRQGIyImNHtoSUozNEkB1ko1MklJaAAAAQBGANwBLAHWAAMAABMWFQdG5uYB1nwBff//AFcAAAC/AGgQBgARAAD//wBzAAACJwBoECcAEQFoAAAQBgARHAD//wB0AAADdABoECcAEQK1AAAQJwARAWgAABAGABEdAP//AFcA4wC/AUsQBgB5AAAABwAJ/+oD4QLiAAoAFQAZACQALgA5AEMAABMyFhUUBiMiJjQ2FyIGFRQWMjY1NCYlMwEjATIWFRQGIyImNDYXIgYUFjI2NTQmJTIWFRQGIyImNDYXIgYUFjI2NTQmnj9XWD0+WFg9JTU2SjU1AShC/nVCAYI/V1g9PlhYPSU1NUo2NQFCP1dYPT5YWD0lNTVKNjUC2FhAPVhZfFg8NSUmNTUlJjVG/QoBK1hAPVhZfFg8NUo2NSUmNTxYQD1YWXxYPDVKNjUlJjUAAAkACf/qBUkC4gAKABQAHwApADQAPwBDAE4AWAAAATIWFRQGIyImNDYXIgYUFjI2NTQmJTIWFRQGIyImNDYXIgYUFjI2NTQmATIWFRQGIyImNDYXIgYVFBYyNjU0JiUzASMBMhYVFAYjIiY0NhciBhQWMjY1NCYDSz9XWD0+WFg9JTU1SjY1AUI/V1g9PlhYPSU1NUo2NfvFP1dYPT5YWD0lNTZKNTUBKEL+dUIBgj9XWD0+WFg9JTU1SjY1ARdYQD1YWXxYPDVKNjUlJjU8WEA9WFl8WDw1SjY1JSY1Af1YQD1YWXxYPDUlJjU1JSY1Rv0KAStYQD1YWXxYPDVKNjUlJjUAAQAxAbYA4gLMAAUAABMXDwEnN41VOFUkJALMKHZ4EY4AAAIAMQG2AbUCzAAFAAsAABMXDwEnNyUXDwEnN41VOFUkJAELVThVJCQCzCh2eBGOdyh2eBGOAAMAMQG2AogCzAAFAAsAEQAAARcPASc3JxcPASc3JRcPASc3AWBVOFUkJJtVOFUkJAHeVThVJCQCzCh2eBGOdyh2eBGOdyh2eBGOAAABADEBtgDiAswABQAAEx8BBy8BhjclJVU3Asx3jhF4dgAAAgAxAbYBtQLMAAUACwAAAR8BBy8CHwEHLwEBWTclJVU3fjclJVU3Asx3jhF4dih3jhF4dgAAAwAxAbYCiALMAAUACwARAAABHwEHLwElHwEHLwElHwEHLwEBWTgkJFU4ASg4JCRVOP6vOCQkVTgCzHeOEXh2KHeOEXh2KHeOEXh2AAEACv9VAW4AeQAFAAAFIycHIxMBbjp4eDqyq8rKASQAAQAxAGoAyQG2AAYAADc1NxUHFxUxmGpq41l6U1NTU///ADEAagDJAbYQDwEJAPoCIMAAAAUAYgBEAgwB7AAJABMAHQAoADQAABI0NjIWFxQGByI3MhYUBiImNTQ2Fw4BIy4BNDYyFgciJjU0NjMyFhQGJzcnNxc3FwcXBycHYhgcFwEYDg69DhcXHBcV5QEYDQ4YGBwY1Q0YFhAOFhfjvLwau7savLwau7sBChwYGA4NGAH6FxwXFhANF9QOGAEXHBgY4hUQDhcXHBcYvLwYu7sYvLwYu7v//wB8AAAB5gLZECYABAAAEAcABAEWAAAAAwBNAAAB/QLlAAMAGgAhAAAlFSM1ARQOAx0BIzU0NycRDgEVIzQ2MzIWJxU3NjU0JgFKWgENJTQ1JVoJCSsjVW9sYXSzDkswaGhoAb0uSjEtOSAvNyEVUwEIDkVBc3doFv8NQ0EqOgAB/+oC8AIsAyYAAwAAARUhNQIs/b4DJjY2AAEAO/85Alj/5AALAAAFMjcVDgEjIiYnNRYBSLdZOYBVVoA5WXVZQDkyMjlAWQABADsCPgJYAukACwAAASIHNT4BMzIWFxUmAUu3WTmAVVaAOVkCl1lAOTIyOUBZAAABACP/NwGTARQABwAAATMHFyMnByMBRD6Jmj57eT4BFOL7yMgA//8ACgACAzYC2RAnAA0B3/5JECcADf/i/koQBwANAN8AAAABADUAoQFbAUEAAwAAARUhNQFb/toBQaCgAAH/Tv/sAVoC2QADAAABMwEjARw+/jI+Atn9EwABAHn/LAEUAtkAIQAANxUUFjsBFSMiJj0BNDcuAT0BNDY7ARUjIgYdARQWFxUOAcYaJQ8uNDlSLiQ5NC4PJRoiLCwiVqYnHEFFPrZ4JhJGRbY+RUEcJ6ZGOwlFCTwAAQAf/ywAugLZACEAADc0Jic1PgE9ATQmKwE1MzIWHQEUBgcWHQEUBisBNTMyNjVtIiwsIholDy40OSQuUjk0Lg8lGlZFPAlFCTtGpiccQUU+tkVGEiZ4tj5FQRwn//8ATQAABCkC5RAjACICLAAAEAIAIgAA//8ATQAAAvwC5RAnAAQCLAAAEAIAIgAA//8AfAAAAxMC5RAmAAQAABADACIBFgAAAAEALv/0AggBnAAKAAABFQ4BByM+ATchNQIIUUobYhZGYf6BAZxKZ5RjVHuCVwABADD/TwIKAtkADwAAARQGBxEjESMRIxEjNTMyFgIKbWJAUkA5+l6CAelegwX+TANK/LYDSkCLAAIAHwBKAfkCIAAOABIAADciLgE1ND4BMyEVIxEzFQMRMxHuQmAtLWBCAQs5OctSSkRpPj1oRkD+qkABlv6qAVYAAAIAIABKAfoCIAAOABIAACUhNTMRIzUhMh4BFRQOAQMjETMBK/71OTkBC0JgLS1gglJSSkABVkBDaT8+aUQBlv6q//8AKAACAVcBIhAHAA0AAP5JAAIAP/9tAKgCDAADAA4AABMzFSMTFSMVFBYXFSI9AT9oaGk8GSNpAgxo/sRoEjQmASaDeAACADsAFQJYAs4ACwAXAAAlMjcVDgEjIiYnNRYTIgc1PgEzMhYXFSYBS7RZOYBWVYA5Wbe3WTmAVVaAOVlnWUA5MjI5QFkCFVlAOTIyOUBZ//8AKAACAVcC5RAmAA0ADBAHAA0AAP5J//8APAABAkgC7hAnARQA7gAVECcAef/lAZAQBwB5AX//HgABAAIBJQHwAY8AFwAAATMOASMiJi8BJiMiByM+ATMyHwEWMzI2AcUrF0g+HS8tIyMaNRgrEE84NTQkMCAZIwGPOTEJDwsLLjE0EgwPFgABADv/NAJY/98ACwAABSIHNT4BMzIWFxUmAUu3WTmAVVaAOVlzWUA5MjI5QFkAAQAk//IC7wK9AGEAAAEnJjU0NjIWFRQPARYXNzYzMhYVFA8BFhc3NjMyFhQGIyIvAQYHFxYVFAYjIi8BBgcXFhUUBiMiJjU0PwEmJwcGIyImNTQ/ASYnBwYjIiY0NjMyHwE2NycmNTQ2MzIWHwE2AXEgAyIuIgQfCwltHiEXICqZBAS7FAsYJCQYCxS6AgWbKiAXIh1tCAsgAyIXFiMEHwwIbR8gFyAqmQUDuxMMGCQkGA4RugIFmyogFxMbEW0HAai6Eg0YJCQYAxy5AgWaKiAXIR5tBg0gAyIuIgMgCQttHiIXHyqZBQS6EwwYJCQXBBy5AwSaKiAXIh1tCAsgAyIuIgQfCgluHyAXIBIYmQYA//8APAACAccCRBAnAHkBCP8fECcAeQEIAPkQBgB55Qn//wAxAbYDRwLMECYBAgAAECcBAgDMAAAQJwECAZkAABAHAQICZQAA//8APAAAApYCshAmAHnlTxAnAHkB1wBPECcAeQDd/x0QBwB5AN0BZ///ADwAAgKZAsUQJwB5/+X/HxAnAHkB2v8fECcAef/lAXcQJwB5AdoBehAHAHkA3wBU//8APAADAKQDEhAnAHn/5f8gEAcAef/lAcf//wA8/zkClgMgECcAeQDd/lYQJwB5AN0B1RAmAHnlGBAHAHkB1wAY//8APAApAiACDRAnAHn/5QDAECYADgozECcAef/l/0gQJwB5AWH/SBAHAHkBYQDC//8APP//AKQDIBAnAHn/5QCIECcAef/lAdUQBwB5/+X/HP//ADwAAgCkAx0QJgB55QUQJwB5/+UB0hAnAHn/5f8fEAcAef/lAP0AAgAUARwBUQLFAAoADQAAEyM1EzMRMxUjFSM9AQfQvMwuQ0M+gQGAOwEK/vA1ZJmqqgABABIBDgFGAsUAHgAAARUjBzYzMhYVFAYjIi4DJzMWMzI2NTQmIyIHIzcBLr4SJi5CUlhFJTkcFgQDOBVJLzU2LjEjNCICxTR3Gk8/Q1UWGCwND0c0Li83KOgAAAIAGAEOAUcCxQAYACQAABM0PgMzMhYXIyYjIgYHNjMyFhUUBiMiNyIGFRQWMzI2NTQmGBYhLikWNUQIOA4/MTQBJkM9T1RBmpwqNDUnKDMwAd04VzEeCjs0QFNOL0w7PlHnMSgpNjQoKzEAAAEAFgEcAUcCxQAJAAABFQYHIz4BNyM1AUeVJD0ZUVL3AsUsucRooG00AAMAFgEOAUgCxQAVAB8AKgAAExYVFAYjIiY1NDcuATU0NjMyFhUUBiYiBhUUFjI2NTQGIgYVFBYzMjY1NPpOVkNEVU4jG008PUwbSkgrK0grJFY0NCosNAH7Ikg6SUo6RyIUJx4xQD8yHyaHJB8eJSUdH40uJSYuLiYlAAABACT/6QJrAsUAMAAABSIuAycjNzMmNTQ3IzczPgQzMhcHLgEjIgYHIQchBhQXIQcjHgEzMjY3FQYBpD5nQC8VBFMWNwEDTxY/AxMvQGxAY14eM0ssRHMYAUUX/skCAQEfGP8WeEQpRTlHFy1BUT0ZOxAQBR07FTlRQS9DSSYaZF87FR4PO1xrFCJZKwD//wAPAMsDxgLYEC8AMAGiAMsuFBAPADcAAADLLhT//wAT/+wDXwLZECMBNgIZ/uoQIgB0AAAQAwEUAW0AAP//ABD/7ANfAtkQIwE2Ahn+6hAiAHUAABADARQBbQAA//8AFP/sA18C2RAjATYCGf7qECIBNQAAEAMBFAFtAAD//wAS/+wDYALZECMBNwIZ/uoQIgE2AAAQAwEUAW0AAP//ABD/7ANhAtkQIwE5Ahn+6hAiAHUAABADARQBbQAA//8AEv/sA2EC2RAjATkCGf7qECIBNgAAEAMBFAFtAAD//wAW/+wDYQLZECIBOAAAECMBOQIZ/uoQAwEUAW0AAAABAC0AAAI7A44ADAAAISMRBgcnNjcWFwcmJwFQODGXI3eQkHcjlzEDGzJ5I2SXl2QjeTIAAQAt/+oCOwN4AAwAAAEzETY3FwYHJic3FhcBGDgxlyN3kJB3I5cxA3j85TJ5I2SXl2QjeTIAAQAoAMUCIAELAAMAAAEVITUCIP4IAQtGRv////z/7AIIAtkQAwEUAK4AAAABAEv/8gCCAqQAAwAAFxEzEUs3DgKy/U4A//8AS//yAO0CpBAmAUdrABAGAUcAAAABABIAAAHbAtwAJQAAARUjESMRIxEjESM1MzU0NjMyFxUmIyIdATM1NDYzMhcVJiMiHQEB21dThlNGRkE6FxgTCjqGQToXGBMKOgIMRP44Acj+OAHIRFk4PwVFATVSWTg/BUUBNVIAAAEADAAAAYQC3AAZAAABESMRIxEjESM1MzU0NjsBFSMuASMiHQE7AQGEU4xTRkZBOrNFA0sOOowIAgz99AHI/jgByERZOD9mCBU1UgACABIAAAGLAtwAEQAYAAABESMRIxEjESM1MzU0NjMyFzUVJiMiHQEzAYtTjVNGRkE6TRgTQDqNAtn9JwHI/jgByERZOD8FAkcBNVIAAQASAAACRALcACsAAAEVIzUmIyIdATMRIxEjESMRIxEjESM1MzU0NjMyFxUmIyIdATM1NDYzMhYzAkRTFio6zVN6U3lTRkZBOhcYEwo6eUE6Ck8BAtlpIgE1Uv30Acj+OAHI/jgByERZOD8FRQE1Ulk4PwMAAAIAEgAAAj8C3AAiACkAAAERIxEjESMRIxEjESM1MzU0NjMyFxUmIyIdATM1NDYzMhYzFTUmIyIdAQI/U3VTeVNGRkE6FxgTCjp5QToFLhopEjoC2f0nAcj+OAHI/jgByERZOD8FRQE1Ulk4PwPNhgE1UgAAAwAS/8EDcQMgABsAHwAjAAABNCYjIgYVMzQ2MzIWFRQOAx0BMzU0PgMDIxUzBwkCAnJdTlZZRC06LzgeKiodSB0qKh6PSEgh/lABsAGvAe1HU19cO0EyKRsxJyc0HiwmGi0kJzz+wFN1AbABr/5RAAEAAAFPAbgAZAB1AAgAAgABAAIAFgAAAQAAAAAIAAQAAAAUABQAFAAUACoAQgByAMcBEQFeAW0BgwGYAbYBywHfAewB+AIFAioCPgJoAp4CuQLrAyMDOwN3A60DvwPZA+sD/wQSBEEEnAS3BOkFFgUzBUoFXwWUBawFuQXWBfEGAQYbBjMGWAZ5BqgG4AclBzcHVQdnB4MHoAe2B80H3gfsB/0IDwgcCCkIcwicCMMI7wkgCUAJewmcCa8JzAnlCfIKJApECmkKkgq7CtULDAstC00LXwt7C5ULtQvMC/wMCQw3DFoMYgxsDKAM6w0nDUsNXQ22DcEOCA5KDmQOdA6BDtIO3w8DDx4PTA+CD48Ptw/TD9wQBBAZEEQQThB+EMMRExEdESkRNRFBEU0RWRFlEYoR2RHlEfER/RIJEhUSIRItEjkSYBJsEngShBKQEpwSqBLCEvwTCBMUEyATLBM4E1kTjxOaE6UTsBO7E8YT0RQuFHcUghSNFJgUoxSuFLkUxBTPFRAVGxUmFTEVPBVHFVIVaxWlFbAVuxXGFdEV3BYFFhAWHRYpFjUWdha+FtIW5hb3Fv8XBxcTFzcXVBdhF2EXYRdhF2EXYRdhF2EXYRdhF2EXYRdhF2EXYRdhF2EXbhd2F34XixeYF6AXqBexF8MX1RfnF/oYBhgSGB4YKhhAGF4Ychh/GIcYkxijGKsYqxirGKsYqxirGKsYqxirGRAZkhmjGb4Z5Bn1GhAaNhpGGlYaYBqyGr4a8hr/GxYbLhtBG1IbXxttG5wbyxvXG+Mb7xwGHCIcQxxkHG0chxyvHLsczBzzHQodkx2jHbcdyx3kHfEeBR4dHi4eQh5CHkIeQh5CHkIeQh5bHokevx7UHxIfWR9oH3gfiB+YH6gfuB/IH9gf8iANIBogIyAwIDsgbyCVILsg9iEwIWgAAQAAAAFYEFRPJHxfDzz1AgsD6AAAAADD3lnvAAAAAMi7piH7cv4rBe4EGgAAAAgAAAAAAAAAAAK8AFgAAAAAAlgAAAEWAAABFgB8AWMANAIsAA4CLAAhA3kAHQKbADQAvwAwAU0ASQFNACYBhQAoAkgAMgEWAFcBTQAuARYAVwEW//gCLAArAiwAZgIsACICLAAgAiwAHAIsACMCLAArAiwALgIsACUCLAAmARYAbgEWAG4CSAAtAkgAMgJIADICLABNA/cAIgKbABECmwBPAtIAMALSAFkCmwBaAmMAWgMKACwC0gBTARYAZAH0ABECmwBPAiwAUANBAEsC0gBMAwoAJgKbAFsDCgAmAtIAXQKbADACYwAVAtIAVQKbAB4DsAAWApsAFgKbAA0CYwAcARYAQAEW//gBFQAWAdUALAIs/+oBTQAWAiwAKgIsADYB9AAfAiwAGgIsACgBFgASAiwAHQIsAEYA3gBCAN7/7gH0ADoA3gBEA0EARgIsAEYCLAAkAiwANgIsABoBTQBFAfQAIgEWAA4CLABBAfQACgLSAAYB9AARAfQAFAH0AB8BTgArAQQAZAFOAB0CSABLARYAAAEWAHoCLAA0AiwAGgIsAEMCLAALAQQAZAIsACsBTQAZAuH/8wFyACUBwAAtAkgAKAFNAC4C4f/zAU0AHAJeAJcCSAAyAV4AEwFeABABTQBcAiwAQQIZADABFgBXAU0AJwFeAEUBbQAoAcAALgNlAD0DZQA9A28AGgIsAGACmwARApsAEQKbABECmwARApsAEQKbABED6AALAtIAMAKbAFoCmwBaApsAWgKbAFoBFgAAARYARwEW//8BFgAJAtIAFALSAEwDCgAmAwoAJgMKACYDCgAmAwoAJgJIAF8DCgAeAtIAVQLSAFUC0gBVAtIAVQKbAA0CmgBbAmMAQwIsACoCLAAqAiwAKgIsACoCLAAqAiwAKgOAACoB9AAfAiwAKAIsACgCLAAoAiwAKAD7AAAA+wApAPv/+QD7//ACLAAkAiwARgIsACQCLAAkAiwAJAIsACQCLAAkAkgAMgJjABICLABBAiwAQQIsAEECLABBAfQAFAIrADYB9AAUAPsAVALkAGQBgABCA+gAKwOqACQBFgBXARYAVwFNABQBTQBcAU0AFgFNAHMBTQA9AU0ABQAA/acB9AAAA+gAAAH0AAAD6AAAAU0AAAD6AAAApwAAAiwAAAEWAAAAyAAAAGQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAU0ALgFNAC4CLP/7Aiz/+wPo//cD6P/3ATgASwI2/2sA3gBBAN0AQADeAEEA3QBAAU0AMAFNADEBTQAvAU0AMQIsACYCLAAmAV4AMgFeAEYBFgBXApoAcwPoAHQBFgBXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAH0AAAD6AAJBVAACQEWADEB1QAxAqgAMQEWADEB1QAxAqgAMQF4AAoA+gAxAPoAMQJuAGICLAB8AiwATQIs/+oCkgA7ApIAOwG2ACMDSAAKAZAANQCn/04BTgB5AU4AHwRYAE0DQgBNA0IAfAIsAC4CGQAwAhkAHwIZACABhQAoARYAPwKSADsBhQAoAnoAPAH0AAICkgA7AxMAJAIDADwDVwAxAtIAPALVADwA4AA8AtIAPAJcADwA4AA8AOAAPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFeABQBXgASAV4AGAFeABYBXgAWAo8AJAPoAA8DZQATA2UAEANlABQDZQASA2UAEANlABIDZQAWAlsALQJbAC0CSAAoAf7//ADIAEsBOABLAe8AEgHMAAwB0QASAowAEgKFABIDhAASAAEAAAPo/tQAWgXd+3L9OgXuAAEAAAAAAAAAAAAAAAAAAAFPAAEBuQGQAAUAAAKKArsALwCMAooCu/9dAd8AMQECAAACCwUEAgICAgIEgAAAJwAAAGsAAAAgAAAAAEdOVSAAQAAg//0DIP84AAAD6AEsYAABv9/3AAAAAAAAAAQAAAADAAAAJAAAAAQAAADEAAMAAQAAACQAAwAKAAAAxAAEAKAAAAAkACAABAAEAH4A/wExAVMCvALGAtoC3CBkIHQgrCEiIZEhkyISIhX//f//AAAAIACgATEBUgK7AsYC2gLcIAAgdCCsISIhkSGTIhIiFf/9////4//C/5H/c/4M/gP98/3y4NDgweCO4Bnfst+x3zPfMQFRAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADAAAAAAA3AAAAAAAAAARAAAAIAAAAH4AAAADAAAAoAAAAP8AAABiAAABMQAAATEAAADCAAABUgAAAVMAAADFAAACuwAAArwAAADHAAACxgAAAsYAAADJAAAC2gAAAtoAAADNAAAC3AAAAtwAAADOAAAgAAAAIGQAAADQAAAgdAAAIHQAAAE1AAAgrAAAIKwAAAE6AAAhIgAAISIAAAE7AAAhkQAAIZEAAAFDAAAhkwAAIZMAAAFEAAAiEgAAIhIAAAFFAAAiFQAAIhUAAAFGAAD//QAA//0AAAFOsAAssAATS7AqUFiwSnZZsAAjPxiwBitYPVlLsCpQWH1ZINSwARMuGC2wASwg2rAMKy2wAixLUlhFI1khLbADLGkYILBAUFghsEBZLbAELLAGK1ghIyF6WN0bzVkbS1JYWP0b7VkbIyGwBStYsEZ2WVjdG81ZWVkYLbAFLA1cWi2wBiyxIgGIUFiwIIhcXBuwAFktsAcssSQBiFBYsECIXFwbsABZLbAILBIRIDkvLbAJLCB9sAYrWMQbzVkgsAMlSSMgsAQmSrAAUFiKZYphILAAUFg4GyEhWRuKimEgsABSWDgbISFZWRgtsAossAYrWCEQGxAhWS2wCywg0rAMKy2wDCwgL7AHK1xYICBHI0ZhaiBYIGRiOBshIVkbIVktsA0sEhEgIDkvIIogR4pGYSOKIIojSrAAUFgjsABSWLBAOBshWRsjsABQWLBAZTgbIVlZLbAOLLAGK1g91hghIRsg1opLUlggiiNJILAAVVg4GyEhWRshIVlZLbAPLCMg1iAvsAcrXFgjIFhLUxshsAFZWIqwBCZJI4ojIIpJiiNhOBshISEhWRshISEhIVktsBAsINqwEistsBEsINKwEistsBIsIC+wBytcWCAgRyNGYWqKIEcjRiNhamAgWCBkYjgbISFZGyEhWS2wEywgiiCKhyCwAyVKZCOKB7AgUFg8G8BZLbAULLMAQAFAQkIBS7gQAGMAS7gQAGMgiiCKVVggiiCKUlgjYiCwACNCG2IgsAEjQlkgsEBSWLIAIABDY0KyASABQ2NCsCBjsBllHCFZGyEhWS2wFSywAUNjI7AAQ2MjLQAAALgB/4WwAY0AS7AIUFixAQGOWbFGBitYIbAQWUuwFFJYIbCAWR2wBitcWACwAyBFsAMrRAGwBCBFsAMrRLAFIEW6AAR//wACK7EDRnYrRFmwFCsAAAAAAgwC2QBSAF0AXQAAADACRgABAAAAAAAAAEUAAAABAAAAAAABAAgARQABAAAAAAACAAYATQABAAAAAAADACUAUwABAAAAAAAEAAkAeAABAAAAAAAFABsAgQABAAAAAAAGAAgARQABAAAAAAAIAAMAnAABAAAAAAALACsAnwABAAAAAAANBM0AygABAAAAAAAOACQFlwADAAEEAgACABAFuwADAAEEBQACABAFywADAAEEBgACAAwF2wADAAEEBwACAAwF5wADAAEECAACAAwF8wADAAEECQAAAIoF/wADAAEECQABABAGiQADAAEECQACAAwGmQADAAEECQADAEoGpQADAAEECQAEABIG7wADAAEECQAFADYHAQADAAEECQAGABAGiQADAAEECQAIAAYHNwADAAEECQALAFYHPQADAAEECQANCZoHkwADAAEECQAOAEgRLQADAAEECgACAAwRdQADAAEECwACABARgQADAAEEDAACAAwRdQADAAEEDgACAAwRkQADAAEEEAACAAoRnQADAAEEEwACABIRpwADAAEEFAACAAwRdQADAAEEFQACABwRuQADAAEEFgACAAwRdQADAAEEGAACAAwRdQADAAEEGQACAA4R1QADAAEEGwACABAR4wADAAEEHQACAAwRdQADAAEEHwACAAwRdQADAAEEIQACABAR8wADAAEEIgACAAwSAwADAAEEJAACAA4SDwADAAEEJgACAAwSHQADAAEEJwACABQSKQADAAEEKgACAAYSPQADAAEELQACAA4SQ0NvcHlsZWZ0IDIwMDIsIDIwMDMsIDIwMDUsIDIwMDgsIDIwMDksIDIwMTAgRnJlZSBTb2Z0d2FyZSBGb3VuZGF0aW9uLkZyZWVTYW5zTWVkaXVtRm9udEZvcmdlIDIuMCA6IEZyZWUgU2FucyA6IDE5LTktMjAxMEZyZWUgU2Fuc1ZlcnNpb24gJFJldmlzaW9uOiAxLjM0NCAkIEdOVWh0dHBzOi8vc2F2YW5uYWguZ251Lm9yZy9wcm9qZWN0cy9mcmVlZm9udC9UaGlzIGNvbXB1dGVyIGZvbnQgaXMgcGFydCBvZiBHTlUgRnJlZUZvbnQuICBJdCBpcyBmcmVlIHNvZnR3YXJlOiB5b3UgY2FuIHJlZGlzdHJpYnV0ZSBpdCBhbmQvb3IgbW9kaWZ5IGl0IHVuZGVyIHRoZSB0ZXJtcyBvZiB0aGUgR05VIEdlbmVyYWwgUHVibGljIExpY2Vuc2UgYXMgcHVibGlzaGVkIGJ5IHRoZSBGcmVlIFNvZnR3YXJlIEZvdW5kYXRpb24sIGVpdGhlciB2ZXJzaW9uIDMgb2YgdGhlIExpY2Vuc2UsIG9yIChhdCB5b3VyIG9wdGlvbikgYW55IGxhdGVyIHZlcnNpb24uCgpUaGlzIHByb2dyYW0gaXMgZGlzdHJpYnV0ZWQgaW4gdGhlIGhvcGUgdGhhdCBpdCB3aWxsIGJlIHVzZWZ1bCwgYnV0IFdJVEhPVVQgQU5ZIFdBUlJBTlRZOyB3aXRob3V0IGV2ZW4gdGhlIGltcGxpZWQgd2FycmFudHkgb2YgTUVSQ0hBTlRBQklMSVRZIG9yIEZJVE5FU1MgRk9SIEEgUEFSVElDVUxBUiBQVVJQT1NFLiAgU2VlIHRoZSBHTlUgR2VuZXJhbCBQdWJsaWMgTGljZW5zZSBmb3IgbW9yZSBkZXRhaWxzLgoKWW91IHNob3VsZCBoYXZlIHJlY2VpdmVkIGEgY29weSBvZiB0aGUgR05VIEdlbmVyYWwgUHVibGljIExpY2Vuc2UgYWxvbmcgd2l0aCB0aGlzIHByb2dyYW0uICBJZiBub3QsIHNlZSA8aHR0cDovL3d3dy5nbnUub3JnL2xpY2Vuc2VzLz4uCgpBcyBhIHNwZWNpYWwgZXhjZXB0aW9uLCBpZiB5b3UgY3JlYXRlIGEgZG9jdW1lbnQgd2hpY2ggdXNlcyB0aGlzIGZvbnQsIGFuZCBlbWJlZCB0aGlzIGZvbnQgb3IgdW5hbHRlcmVkIHBvcnRpb25zIG9mIHRoaXMgZm9udCBpbnRvIHRoZSBkb2N1bWVudCwgdGhpcyBmb250IGRvZXMgbm90IGJ5IGl0c2VsZiBjYXVzZSB0aGUgcmVzdWx0aW5nIGRvY3VtZW50IHRvIGJlIGNvdmVyZWQgYnkgdGhlIEdOVSBHZW5lcmFsIFB1YmxpYyBMaWNlbnNlLiBUaGlzIGV4Y2VwdGlvbiBkb2VzIG5vdCBob3dldmVyIGludmFsaWRhdGUgYW55IG90aGVyIHJlYXNvbnMgd2h5IHRoZSBkb2N1bWVudCBtaWdodCBiZSBjb3ZlcmVkIGJ5IHRoZSBHTlUgR2VuZXJhbCBQdWJsaWMgTGljZW5zZS4gSWYgeW91IG1vZGlmeSB0aGlzIGZvbnQsIHlvdSBtYXkgZXh0ZW5kIHRoaXMgZXhjZXB0aW9uIHRvIHlvdXIgdmVyc2lvbiBvZiB0aGUgZm9udCwgYnV0IHlvdSBhcmUgbm90IG9ibGlnYXRlZCB0byBkbyBzby4gSWYgeW91IGRvIG5vdCB3aXNoIHRvIGRvIHNvLCBkZWxldGUgdGhpcyBleGNlcHRpb24gc3RhdGVtZW50IGZyb20geW91ciB2ZXJzaW9uLmh0dHA6Ly93d3cuZ251Lm9yZy9jb3B5bGVmdC9ncGwuaHRtbAQ9BD4EQAQ8BDAEOwQ1BD0AbwBiAHkBDQBlAGoAbgDpAG4AbwByAG0AYQBsAE0AaQB0AHQAZQBsALUDtQPDA7EDrwOxAEMAbwBwAHkAbABlAGYAdAAgADIAMAAwADIALAAgADIAMAAwADMALAAgADIAMAAwADUALAAgADIAMAAwADgALAAgADIAMAAwADkALAAgADIAMAAxADAAIABGAHIAZQBlACAAUwBvAGYAdAB3AGEAcgBlACAARgBvAHUAbgBkAGEAdABpAG8AbgAuAEYAcgBlAGUAUwBhAG4AcwBNAGUAZABpAHUAbQBGAG8AbgB0AEYAbwByAGcAZQAgADIALgAwACAAOgAgAEYAcgBlAGUAIABTAGEAbgBzACAAOgAgADEAOQAtADkALQAyADAAMQAwAEYAcgBlAGUAIABTAGEAbgBzAFYAZQByAHMAaQBvAG4AIAAkAFIAZQB2AGkAcwBpAG8AbgA6ACAAMQAuADMANAA0ACAAJAAgAEcATgBVAGgAdAB0AHAAcwA6AC8ALwBzAGEAdgBhAG4AbgBhAGgALgBnAG4AdQAuAG8AcgBnAC8AcAByAG8AagBlAGMAdABzAC8AZgByAGUAZQBmAG8AbgB0AC8AVABoAGkAcwAgAGMAbwBtAHAAdQB0AGUAcgAgAGYAbwBuAHQAIABpAHMAIABwAGEAcgB0ACAAbwBmACAARwBOAFUAIABGAHIAZQBlAEYAbwBuAHQALgAgACAASQB0ACAAaQBzACAAZgByAGUAZQAgAHMAbwBmAHQAdwBhAHIAZQA6ACAAeQBvAHUAIABjAGEAbgAgAHIAZQBkAGkAcwB0AHIAaQBiAHUAdABlACAAaQB0ACAAYQBuAGQALwBvAHIAIABtAG8AZABpAGYAeQAgAGkAdAAgAHUAbgBkAGUAcgAgAHQAaABlACAAdABlAHIAbQBzACAAbwBmACAAdABoAGUAIABHAE4AVQAgAEcAZQBuAGUAcgBhAGwAIABQAHUAYgBsAGkAYwAgAEwAaQBjAGUAbgBzAGUAIABhAHMAIABwAHUAYgBsAGkAcwBoAGUAZAAgAGIAeQAgAHQAaABlACAARgByAGUAZQAgAFMAbwBmAHQAdwBhAHIAZQAgAEYAbwB1AG4AZABhAHQAaQBvAG4ALAAgAGUAaQB0AGgAZQByACAAdgBlAHIAcwBpAG8AbgAgADMAIABvAGYAIAB0AGgAZQAgAEwAaQBjAGUAbgBzAGUALAAgAG8AcgAgACgAYQB0ACAAeQBvAHUAcgAgAG8AcAB0AGkAbwBuACkAIABhAG4AeQAgAGwAYQB0AGUAcgAgAHYAZQByAHMAaQBvAG4ALgAKAAoAVABoAGkAcwAgAHAAcgBvAGcAcgBhAG0AIABpAHMAIABkAGkAcwB0AHIAaQBiAHUAdABlAGQAIABpAG4AIAB0AGgAZQAgAGgAbwBwAGUAIAB0AGgAYQB0ACAAaQB0ACAAdwBpAGwAbAAgAGIAZQAgAHUAcwBlAGYAdQBsACwAIABiAHUAdAAgAFcASQBUAEgATwBVAFQAIABBAE4AWQAgAFcAQQBSAFIAQQBOAFQAWQA7ACAAdwBpAHQAaABvAHUAdAAgAGUAdgBlAG4AIAB0AGgAZQAgAGkAbQBwAGwAaQBlAGQAIAB3AGEAcgByAGEAbgB0AHkAIABvAGYAIABNAEUAUgBDAEgAQQBOAFQAQQBCAEkATABJAFQAWQAgAG8AcgAgAEYASQBUAE4ARQBTAFMAIABGAE8AUgAgAEEAIABQAEEAUgBUAEkAQwBVAEwAQQBSACAAUABVAFIAUABPAFMARQAuACAAIABTAGUAZQAgAHQAaABlACAARwBOAFUAIABHAGUAbgBlAHIAYQBsACAAUAB1AGIAbABpAGMAIABMAGkAYwBlAG4AcwBlACAAZgBvAHIAIABtAG8AcgBlACAAZABlAHQAYQBpAGwAcwAuAAoACgBZAG8AdQAgAHMAaABvAHUAbABkACAAaABhAHYAZQAgAHIAZQBjAGUAaQB2AGUAZAAgAGEAIABjAG8AcAB5ACAAbwBmACAAdABoAGUAIABHAE4AVQAgAEcAZQBuAGUAcgBhAGwAIABQAHUAYgBsAGkAYwAgAEwAaQBjAGUAbgBzAGUAIABhAGwAbwBuAGcAIAB3AGkAdABoACAAdABoAGkAcwAgAHAAcgBvAGcAcgBhAG0ALgAgACAASQBmACAAbgBvAHQALAAgAHMAZQBlACAAPABoAHQAdABwADoALwAvAHcAdwB3AC4AZwBuAHUALgBvAHIAZwAvAGwAaQBjAGUAbgBzAGUAcwAvAD4ALgAKAAoAQQBzACAAYQAgAHMAcABlAGMAaQBhAGwAIABlAHgAYwBlAHAAdABpAG8AbgAsACAAaQBmACAAeQBvAHUAIABjAHIAZQBhAHQAZQAgAGEAIABkAG8AYwB1AG0AZQBuAHQAIAB3AGgAaQBjAGgAIAB1AHMAZQBzACAAdABoAGkAcwAgAGYAbwBuAHQALAAgAGEAbgBkACAAZQBtAGIAZQBkACAAdABoAGkAcwAgAGYAbwBuAHQAIABvAHIAIAB1AG4AYQBsAHQAZQByAGUAZAAgAHAAbwByAHQAaQBvAG4AcwAgAG8AZgAgAHQAaABpAHMAIABmAG8AbgB0ACAAaQBuAHQAbwAgAHQAaABlACAAZABvAGMAdQBtAGUAbgB0ACwAIAB0AGgAaQBzACAAZgBvAG4AdAAgAGQAbwBlAHMAIABuAG8AdAAgAGIAeQAgAGkAdABzAGUAbABmACAAYwBhAHUAcwBlACAAdABoAGUAIAByAGUAcwB1AGwAdABpAG4AZwAgAGQAbwBjAHUAbQBlAG4AdAAgAHQAbwAgAGIAZQAgAGMAbwB2AGUAcgBlAGQAIABiAHkAIAB0AGgAZQAgAEcATgBVACAARwBlAG4AZQByAGEAbAAgAFAAdQBiAGwAaQBjACAATABpAGMAZQBuAHMAZQAuACAAVABoAGkAcwAgAGUAeABjAGUAcAB0AGkAbwBuACAAZABvAGUAcwAgAG4AbwB0ACAAaABvAHcAZQB2AGUAcgAgAGkAbgB2AGEAbABpAGQAYQB0AGUAIABhAG4AeQAgAG8AdABoAGUAcgAgAHIAZQBhAHMAbwBuAHMAIAB3AGgAeQAgAHQAaABlACAAZABvAGMAdQBtAGUAbgB0ACAAbQBpAGcAaAB0ACAAYgBlACAAYwBvAHYAZQByAGUAZAAgAGIAeQAgAHQAaABlACAARwBOAFUAIABHAGUAbgBlAHIAYQBsACAAUAB1AGIAbABpAGMAIABMAGkAYwBlAG4AcwBlAC4AIABJAGYAIAB5AG8AdQAgAG0AbwBkAGkAZgB5ACAAdABoAGkAcwAgAGYAbwBuAHQALAAgAHkAbwB1ACAAbQBhAHkAIABlAHgAdABlAG4AZAAgAHQAaABpAHMAIABlAHgAYwBlAHAAdABpAG8AbgAgAHQAbwAgAHkAbwB1AHIAIAB2AGUAcgBzAGkAbwBuACAAbwBmACAAdABoAGUAIABmAG8AbgB0ACwAIABiAHUAdAAgAHkAbwB1ACAAYQByAGUAIABuAG8AdAAgAG8AYgBsAGkAZwBhAHQAZQBkACAAdABvACAAZABvACAAcwBvAC4AIABJAGYAIAB5AG8AdQAgAGQAbwAgAG4AbwB0ACAAdwBpAHMAaAAgAHQAbwAgAGQAbwAgAHMAbwAsACAAZABlAGwAZQB0AGUAIAB0AGgAaQBzACAAZQB4AGMAZQBwAHQAaQBvAG4AIABzAHQAYQB0AGUAbQBlAG4AdAAgAGYAcgBvAG0AIAB5AG8AdQByACAAdgBlAHIAcwBpAG8AbgAuAGgAdAB0AHAAOgAvAC8AdwB3AHcALgBnAG4AdQAuAG8AcgBnAC8AYwBvAHAAeQBsAGUAZgB0AC8AZwBwAGwALgBoAHQAbQBsAE4AbwByAG0AYQBsAE4AbwByAG0AYQBhAGwAaQBOAG8AcgBtAOEAbABNAGUAZABpAG8ARwBlAG0AaQBkAGQAZQBsAGQATwBkAG0AaQBhAG4AYQAgAFoAdwB5AGsBQgBhBB4EMQRLBEcEPQRLBDkATgBvAHIAbQDhAGwAbgBlAG0AZQBuAGUAbgBnAGEAaAQ/BEAETwQ8BFYEOQBOAGEAdgBhAGQAbgBvAHYAaQBkARMAagBzAG4AbwByAG0AYQBsAHUAcwBpAHMAdh7rAGEAQQByAHIAdQBuAHQAYQAAAgAAAAAAAP8eADIAAAAAAAAAAAAAAAAAAAAAAAAAAAFPAAAAAQACAAMABAAFAAYABwAIAAkACgALAAwADQAOAA8AEAARABIAEwAUABUAFgAXABgAGQAaABsAHAAdAB4AHwAgACEAIgAjACQAJQAmACcAKAApACoAKwAsAC0ALgAvADAAMQAyADMANAA1ADYANwA4ADkAOgA7ADwAPQA+AD8AQABBAEIAQwBEAEUARgBHAEgASQBKAEsATABNAE4ATwBQAFEAUgBTAFQAVQBWAFcAWABZAFoAWwBcAF0AXgBfAGAAYQCsAKMAhACFAL0AlgDoAIYAjgCLAJ0AqQCkAQIAigDaAIMAkwDyAPMAjQEDAIgBBADeAPEAngCqAPUA9AD2AKIArQDJAMcArgBiAGMAkABkAMsAZQDIAMoAzwDMAM0AzgDpAGYA0wDQANEArwBnAPAAkQDWANQA1QBoAOsA7QCJAGoAaQBrAG0AbABuAKAAbwBxAHAAcgBzAHUAdAB2AHcA6gB4AHoAeQB7AH0AfAC4AKEAfwB+AIAAgQDsAO4AugDXAQUBBgCwALEBBwEIANgBCQEKANwA3QDZAQsBDAENAQ4BDwEQAREBEgETARQBFQEWARcBGAEZARoBGwEcAR0BHgCyALMBHwEgASEAtgC3AMQBIgC0ALUAxQEjAIIAwgCHASQBJQEmAKsBJwEoASkBKgErASwBLQEuAS8AxgEwATEBMgEzATQBNQE2ATcAvgC/ATgBOQE6ATsBPAE9AT4BPwFAALwBQQFCAUMBRAFFAUYBRwFIAUkBSgFLAUwBTQFOAU8BUAFRAVIBUwFUAVUBVgFXAVgBWQFaAVsBXAFdAV4BXwFgAWEBYgFjAWQBZQFmAIwBZwFoAWkBagFrAWwBbQFuAW8A7wFwAXEBcgFzAMAAwQF0AXUBdgpzb2Z0aHlwaGVuBW1pY3JvBm1pZGRvdAJJSgJpagxxdW90ZWxlZnRtb2QKYXBvc3Ryb3BoZQ1hY3V0ZW1vZGlmaWVyDWdyYXZlbW9kaWZpZXINZGJsbG93bGluZWNtYgZlbnF1YWQGZW1xdWFkB2Vuc3BhY2UHZW1zcGFjZQ90aHJlZXBlcmVtc3BhY2UOZm91cnBlcmVtc3BhY2UNc2l4cGVyZW1zcGFjZQtmaWd1cmVzcGFjZRBwdW5jdHVhdGlvbnNwYWNlCXRoaW5zcGFjZQloYWlyc3BhY2UOemVyb3dpZHRoc3BhY2USemVyb3dpZHRobm9uam9pbmVyCHplcm9qb2luB3VuaTIwMEUHdW5pMjAwRgloeXBoZW50d28NaHlwaGVubm9icmVhawpmaWd1cmVkYXNoCXF1b3RlZGFzaA5kYmx2ZXJ0aWNhbGJhcg11bmRlcnNjb3JlZGJsDXF1b3RlcmV2ZXJzZWQLcXVvdGVkYmxyZXYOdHJpYW5nbGVidWxsZXQOb25lZG90ZW5sZWFkZXIOdHdvZG90ZW5sZWFkZXIJaHlwaGVuZG90DWxpbmVzZXBhcmF0b3IScGFyYWdyYXBoc2VwYXJhdG9yA2xyZQNybGUDcGRmA2xybwNybG8HdW5pMjAyRg5wZXJ0ZW50aG91c2FuZAVwcmltZQZzZWNvbmQLcHJpbWV0cmlwbGUIcHJpbWVyZXYLcHJpbWVkYmxyZXYOcHJpbWV0cmlwbGVyZXYFY2FyZXQNcmVmZXJlbmNlbWFyawlleGNsYW1kYmwLaW50ZXJyb2JhbmcIb3ZlcmxpbmUHdW5pMjAzRgN0aWULY2FyZXRpbnNlcnQIYXN0ZXJpc20MaHlwaGVuYnVsbGV0B3VuaTIwNDUHdW5pMjA0Ngd1bmkyMDQ3B3VuaTIwNDgHdW5pMjA0OQd1bmkyMDRBB3VuaTIwNEIHdW5pMjA0Qwd1bmkyMDREB3VuaTIwNEUHdW5pMjA0RgdjbG9zdXJlB3VuaTIwNTEHdW5pMjA1Mgd1bmkyMDUzB3VuaTIwNTQHdW5pMjA1NQd1bmkyMDU2B3VuaTIwNTcHdW5pMjA1OAd1bmkyMDU5B3VuaTIwNUEHdW5pMjA1Qgd1bmkyMDVDB3VuaTIwNUQHdW5pMjA1RQd1bmkyMDVGB3VuaTIwNjAHdW5pMjA2MQd1bmkyMDYyB3VuaTIwNjMHdW5pMjA2NAxmb3Vyc3VwZXJpb3IMZml2ZXN1cGVyaW9yC3NpeHN1cGVyaW9yDXNldmVuc3VwZXJpb3INZWlnaHRzdXBlcmlvcgRFdXJvB3VuaTIxNTYHdW5pMjE1Nwd1bmkyMTU4B3VuaTIxNUEMdGhyZWVlaWdodGhzC2ZpdmVlaWdodGhzDHNldmVuZWlnaHRocwdhcnJvd3VwCWFycm93ZG93bglzbGFzaG1hdGgHZGl2aWRlcwhwYXJhbGxlbAJmZgNmZmkDZmZsB3VuaUZGRkQAAAAAAAADAAkAAgAWAAH//wADAAEAAAAMAAAAAAAAAAIAHgABAIMAAQCEAIQAAgCFAIsAAQCMAIwAAgCNAI8AAQCQAJAAAgCRAJUAAQCWAJYAAgCXAJwAAQCdAJ0AAgCeAKMAAQCkAKQAAgClAKsAAQCsAKwAAgCtAK8AAQCwALAAAgCxALUAAQC2ALYAAgC3ALwAAQC9AL0AAgC+AMIAAQDDAMQAAgDFAMkAAQDNAM4AAQDQATUAAQE6ATsAAQE8AUIAAgFDAUYAAQFJAU0AAgFOAU4AAQABAAAACgAkADIAAkRGTFQADmxhdG4ADgAEAAAAAP//AAEAAAABa2VybgAIAAAAAQAAAAEABAACAAAABAAOBWYI+gvsAAIDHgAEAAADWAQcABEAFwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/8T/2P/s/+z/4v/YAAAAAAAA/+L/7P/i//b/4v/i/+z/5//2//H/+//YAAD/4v/O/+IAAP/2/+L/zgAA/+z/4v/i//b/9v/O/+z/7P/2/+wAAP/7AAD/4gAA/9j/zv/sAAD/7P/2/9gAAP/i/+L/4v/s/+z/2P/2/+z/7P/nAAD/+wAA/9gAAP/O/87/7P/2/+f/9v/O//b/9v/s/9j/7P/2/8n/4v/Y/+f/3f/2//b/+//JAAD/4v/O/9j/4v/i/9j/7P/s/+L/4v/Y/+z/4v/i/87/4v/s/9P/4v/d/+f/2AAA/9j/7P/i/9j/4v/2AAD/4v/s/9j/zv/Y/+z/4v/Y/9j/4v/O/+L/3f/n/9gAAP/Y/9j/5//i/+L/7P/2AAAAAP/i/+L/4v/2/9j/3f/i/+L/2P/s/+z/7P/YAAD/4v/O/+L/7P/n/+IAAAAA/+z/zv/Y/+wAAP/O/+L/4v/s/9j/7P/n//H/2AAAAAD/xP/Y/+L/7P/Y/9gAAP/2AAD/2P/s/+IAAP/Y/+IAAP/Y/+L/3f/n/+IAAP/E/9j/7P/Y/84AAP/i/9gAAP/Y/9j/4gAA/8T/4v/i/+z/2P/Y/9P/3f/YAAD/4v/YAAAAAP/sAAD/2AAAAAAAAP/sAAAAAP/O/+z/7P/2//EAAAAAAAD/4gAA//b/zv/2//b/9v/2/+wAAP/2AAD/9v/2AAD/7P/s/+z/9v/Y/+L/3f/n/9gAAP/i/87/7AAAAAD/7P/YAAD/9v/Y/+wAAP/2/87/9v/s//b/5wAA//sAAP/YAAD/zv/2/9j/2P/Y/+wAAP/YAAD/4v/Y/9j/7P/Y/9j/2P/i/9j/2P/T/93/4gAA/8QAAP/O/87/zv/sAAD/4gAA/+L/xP/Y/+z/4v/O/8T/2P/O/9P/zv/Y/9gAAAAAAAD/zv/Y/+L/4gAAAAD/9v/s/9j/7P/iAAD/zv/Y/+L/2P/Y/9P/3f/YAAIACQAkACoAAAAsAC8ABwAyADcACwA5AD0AEQCCAJIAFgCUAJgAJwCaAJoALACfAKAALQDFAMUALwACACAAJAAkAAEAJQAlAAIAJgAmAAMAJwAnAAQAKAAoAAUAKQApAAYAKgAqAAMALAAsAAcALQAtAAgALgAuABAALwAvAAkAMgAyAAsAMwAzAAoANAA0AAsANQA1AAwANgA2AA0ANwA3AA4AOQA6AA8AOwA7ABAAPAA8AA8APQA9ABAAggCHAAEAiACIAAUAiQCJAAMAigCNAAUAjgCRAAcAkgCSAAMAlACYAAsAmgCaAAsAnwCfAA8AoACgAAMAxQDFAAUAAgA0ACQAJAABACYAJgADACoAKgADACwALAAWAC0ALQAIADIAMgADADQANAADADYANgAPADcANwAHADkAOgACADsAOwAOADwAPAACAD0APQAOAEQARAAFAEYARgATAEcARwAVAEgASAAEAEkASQANAEoASgAFAE0ATQAJAFAAUQALAFIAUgAUAFMAUwARAFQAVAAVAFUAVQAQAFYAVgAMAFcAVwANAFgAWAASAFkAWgAGAFsAWwAKAFwAXAAGAF0AXQALAIIAiAABAIkAiQADAI4AkQAWAJQAmAADAJoAmgADAJ8AnwACAKIAqAAFAKkAqQATAKoArQAEALIAsgAEALMAswALALQAuAAUALoAugAUALsAvgASAL8AvwAGAMEAwQAGAMUAxQADAMYAxgAUAUkBSgANAUwBTQANAAIB0gAEAAACEgLWAA8ADwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD/9v/sAAD/9v/2//b/9v/2AAD/9v/x/+z/9gAAAAAAAP/2//b/9v/2AAAAAP/2AAD/9gAAAAAAAAAAAAAAAAAAAAD/9v/2AAAAAP/2AAD/+wAAAAAAAAAA//b/9gAAAAAAAP/2//YAAP/2//v/8QAAAAAAAAAAAAD/9v/s/+z/7P/s//b/9v/2//b/7AAAAAAAAAAA/+f/7AAAAAD/7P/2/+wAAP/2AAD/+//2//H/+wAA/+z/7AAA/+z/7P/Y/+z/9v/n/+L/4v/s/+f/8QAA//EAAP/s/+z/7P/n/+wAAP/s//b/7P/s/+f/8QAA//YAAAAAAAAAAAAAAAAAAAAAAAAAAP/2//b/+wAA/+z/9v/sAAAAAP/s//YAAP/s//b/7P/s/+f/8QAA/+z/7AAAAAD/9v/2//YAAAAAAAD/+//2//H/+wAAAAD/9v/s/+z/2P/2//b/7P/s//b/8f/7//YAAAAA//v/9gAAAAD/7P/2//b/8f/2AAAAAP/2//H/+wAA/+z/7P/s//b/7P/i/+z/9v/i/+z/3f/s/+f/8QACAAoARABLAAAATgBOAAgAUABTAAkAVQBdAA0AogCtABYAswC4ACIAugC/ACgAwQDBAC4AxgDGAC8BSQFJADAAAgAgAEQARAABAEUARQACAEYARgADAEcARwAEAEgASAAFAEkASQAGAEoASgAJAEsASwAIAE4ATgAKAFAAUQAIAFIAUgAFAFMAUwACAFUAVQALAFYAVgAMAFcAVwANAFgAWAAJAFkAWgAHAFsAWwAKAFwAXAAHAF0AXQAOAKIApwABAKgAqAAFAKkAqQADAKoArQAFALMAswAIALQAuAAFALoAugAFALsAvgAJAL8AvwAHAMEAwQAHAMYAxgAFAUkBSQAGAAIAHwBEAEQAAgBGAEYADABHAEcADgBIAEgAAQBJAEkACABKAEoAAgBNAE0ABABQAFEABgBSAFIADQBTAFMACgBUAFQADgBVAFUACQBWAFYABwBXAFcACABYAFgACwBZAFoAAwBbAFsABQBcAFwAAwBdAF0ABgCiAKgAAgCpAKkADACqAK0AAQCyALIAAQCzALMABgC0ALgADQC6ALoADQC7AL4ACwC/AL8AAwDBAMEAAwDGAMYADQFJAU0ACAACAQAABAAAAYgCuAAYAAUAAAAAAAAAAAAAAAD/7P/O/87/2AAA/87/7P/O/+wAAP/iAAD/2P/sAAD/xP/iAAD/zgAA/+z/xP/E/9gAAP+c/7r/7P/EAAD/xP/i/9j/4gAA/8T/zgAA/9gAAP/E/84AAP/EAAD/2P/O/+z/2AAA/+z/2P/E/9gAAP/iAAD/2AAAAAD/7AAA/9gAAAAA/9j/9v/TAAAAAP/E/8QAAP/sAAD/xP/s/+z/2AAA/+L/xP/E/+IAAP/Y/8T/2P/iAAD/2P/E/8T/xAAA/8T/zgAAAAAAAP/Y/9j/sP/iAAAAAAAAAAD/2AAA/9j/uv/Y/+IAAgAWACQAJwAAACkAKgAEAC4ALwAGADIANAAIADYANwALADkAPQANAEQARgASAEgASwAVAE4ATgAZAFAAUwAaAFUAXQAeAIIAhwAnAIkAiQAtAJQAmAAuAJoAmgAzAJ8AnwA0AKIApwA1AKkArQA7ALMAuABAALoAvwBGAMEAwQBMAUkBSQBNAAIAMgAkACQAAQAlACUAAgAmACcAAwApACkABAAqACoAAwAuAC4ACgAvAC8ABQAyADIAAwAzADMABgA0ADQAAwA2ADYABwA3ADcACAA5ADoACQA7ADsACgA8ADwACQA9AD0ACgBEAEQACwBFAEUADABGAEYADQBIAEgADgBJAEkADwBKAEoAEgBLAEsAEQBOAE4AEwBQAFEAEQBSAFIADgBTAFMADABVAFUAFABWAFYAFQBXAFcAFgBYAFgAEgBZAFoAEABbAFsAEwBcAFwAEABdAF0AFwCCAIcAAQCJAIkAAwCUAJgAAwCaAJoAAwCfAJ8ACQCiAKcACwCpAKkADQCqAK0ADgCzALMAEQC0ALgADgC6ALoADgC7AL4AEgC/AL8AEADBAMEAEAFJAUkADwACAAkADwAPAAEAEAAQAAIAEQARAAEAbQBtAAIAfQB9AAQA6QDpAAMA7ADtAAMBCQEJAAIBCgEKAAQAAgDQAAQAAADoASgABgAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP+m//b/zv/O/87/7AAAAAAAAP/i/87/zgAAAAD/zgAA/87/zv/sAAD/2P/E/87/7P/i/87/2P/O/9j/zv/2AAD/2P/O/+L/7P/i/9j/zgAA//b/2P/iAAD/7P/O/+IAAP/OAAD/4v/Y/+IAAAAA/+IAAAAA/+z/7AAA/+L/4gAAAAD/zv/i//b/9v/i/+IAAAAA/+z/4v/s/9j/4v/iAAEACgAQAG0AfQDoAOkA6gDsAO4BCQEKAAIACgAQABAAAgBtAG0AAwB9AH0AAgDoAOgABADpAOkAAQDqAOoABQDsAOwABADuAO4ABQEJAQkAAwEKAQoAAgACAC8AJAAkAAEAJgAmAAMAKgAqAAMALQAtAAgAMgAyAAMANAA0AAMANgA2AA8ANwA3AAcAOQA6AAIAOwA7AA4APAA8AAIAPQA9AA4ARABEAAUARgBIAAQASQBJAA0ASgBKAAUATQBNAAkAUABRAAsAUgBSAAQAUwBTAAsAVABUAAQAVQBVAAsAVgBWAAwAVwBXAA0AWABYAAsAWQBaAAYAWwBbAAoAXABcAAYAXQBdAAsAggCGAAEAiACIAAEAiQCJAAMAlACYAAMAmgCaAAMAnwCfAAIAogCoAAUAqQCtAAQAsgCyAAQAswCzAAsAtAC4AAQAugC6AAQAuwC+AAsAvwC/AAYAwQDBAAYAxQDFAAMAxgDGAAQBSQFNAA0AAQAAAAoArgDUABRERkxUAHphcm1uAKBiZW5nAKBibmcyAKBjeXJsAKBkZXYyAKBkZXZhAKBnZW9yAKBnanIyAKBncmVrAKBndWpyAKBndXIyAKBndXJ1AKBoZWJyAKBsYXRuAIZwaG54AKBzeXJjAKB0bWwyAKB1Z2FyAKB4cGVvAKAABAAAAAD//wABAAAACgABTkxEIAASAAD//wABAAEAAP//AAEAAgAAAAAAA2ZyYWMAFGxpZ2EAGmxpZ2EAIAAAAAEAAgAAAAEAAQAAAAEAAAADAAgANgB6AAQAAAABAAgAAQAeAAIACgAUAAEABADDAAIALQABAAQAxAACAE0AAQACACwATAAEAAgAAQAIAAEANgABAAgABQAMABQAHAAiACgBTQADAEkATwFMAAMASQBMAUsAAgBPAUoAAgBMAUkAAgBJAAEAAQBJAAQACAABAAgAAQCmAAUAEAAmAFAAZgCQAAIABgAOATwAAwEUABgBPAADABIAGAAEAAoAEgAaACIBQAADARQAGwFAAAMAEgAbAT0AAwEUABgBPQADABIAGAACAAYADgE+AAMBFAAYAT4AAwASABgABAAKABIAGgAiAUEAAwEUABsBQQADABIAGwE/AAMBFAAZAT8AAwASABkAAgAGAA4BQgADARQAGwFCAAMAEgAbAAEABQAVABYAFwAYABoAAA=='
-font_file = tempfile.NamedTemporaryFile(delete=False, suffix='.ttf')
-font_file.write(base64.b64decode(FONT_ENCODED))
-font_file.close()
 
 # Colors
 BLUE = (23,107,250)
@@ -53,13 +56,23 @@ YELLOW = (255,241,0)
 WHITE = (255,255,255)
 GRAY = (216,216,216)
 GREEN = (0,255,58)
+DARK_GREEN = (0,160,0)
 
 # Constants
-NUM_ROWS= 6
-NUM_COLUMNS = 7
 SQUARESIZE = 87
 PADDING = 15
 FPS=60
+DROP_GRAVITY = 9000 # Pixels per second squared a dropped piece falls with, about a third of a second down a standard column
+HIGHLIGHT_GROW_MS = 300 # Time the markers on a winning line take to grow to full size
+STATS_KEY = pygame.K_F3
+HINTS_KEY = pygame.K_h
+
+MENU_IDLE_TIMEOUT_MS = 1000 # The menu wakes up at least this often even with no input
+STATS_REFRESH_MS = 250 # How often the stats overlay text and the sampled cache counters are updated
+HISTORY_ROWS = 22 # Moves visible at once in the history panel
+HISTORY_SCROLL_ROWS = 3 # Rows scrolled per mouse wheel notch
+TEXT_CACHE_SIZE = 256 # Rendered text surfaces kept around, the menu and history panel need well under this
+THREAD_SWITCH_INTERVAL = 0.001 # Seconds a busy AI or hint thread holds the interpreter before the frame loop gets it back, 5 ms by default
 
 # Sizes
 screenWidth = 1024
@@ -68,28 +81,59 @@ size = (screenWidth, screenHeight)
 RADIUS = int(SQUARESIZE/2 - 5)
 
 
-# Windows tweaks for ANSI escape codes and DPI scaling
-if os.name == 'nt':
-	ctypes = __import__('ctypes')
-	ctypes.windll.shcore.SetProcessDpiAwareness(1)
-	ctypes.windll.kernel32.SetConsoleMode(ctypes.windll.kernel32.GetStdHandle(-11), 7)
-	del ctypes
-
-# Initialization
-pygame.init()
-screen = pygame.display.set_mode(size)
-clock = pygame.time.Clock()
+# Initialized by main()
+args = None
+screen = None
+clock = None
 validLocation = False
 gameOver = False
 game_history = []
-history_view = 0
+history_scroll = None # First row shown in the history panel, None to follow the latest move
+game_records = None # record.RecordWriter, opened when the first game finishes
+ai_player = None
+ai_worker = None
+hint_worker = None # hints.HintWorker, started the first time hints are shown
+hints_shown = False
+book = None # Opening book, opened with the first Expert AI
+tablebase = None # Endgame tablebase, opened with the first Hard or Expert AI
+renderer = None
+dirty_rects = []
+startup_phases = []
+stats = None # perf.Recorder, only created once statistics are asked for
+stats_overlay = False
+stats_surface = None
+stats_sampled = 0
+stats_area = None
 
 def deInit():
 	"""De-initializes the game properly"""
+	if ai_worker:
+		ai_worker.cancel()
+	if ai_player:
+		ai_player.close() # Stops the MCTS worker processes
+	if hint_worker:
+		hint_worker.close()
+	if game_records:
+		game_records.close()
+	if stats and args.stats_dump:
+		stats.dump(args.stats_dump)
+		for name, summary in stats.summary().items():
+			print(name.ljust(16) + str(summary['count']).rjust(7) + " samples, p50 " + str(summary['p50_ms']) + " ms, p95 " + str(summary['p95_ms']) + " ms, p99 " + str(summary['p99_ms']) + " ms")
 	pygame.quit()
-	os.remove(font_file.name)
 	sys.exit()
 
+def markStartup(phase):
+	"""Record that a startup phase has finished, for --profile-startup"""
+	startup_phases.append((phase, time.perf_counter()))
+
+def printStartupProfile():
+	"""Print how long each startup phase took, up to the first frame of the menu"""
+	previous = STARTUP_TIME
+	for phase, finished in startup_phases:
+		print(phase.ljust(20) + str(round(1000*(finished - previous), 1)).rjust(8) + " ms")
+		previous = finished
+	print("Time to first frame".ljust(20) + str(round(1000*(previous - STARTUP_TIME), 1)).rjust(8) + " ms")
+
 # Anti-aliasing (https://stackoverflow.com/questions/23852917/antialiasing-shapes-in-pygame)
 def drawCircle(surface, color, pos, radius):
 	"""Draw an anti aliased circle"""
@@ -97,130 +141,472 @@ def drawCircle(surface, color, pos, radius):
 	gfxdraw.filled_circle(surface, int(pos[0]), int(pos[1]), radius, color)
 
 # Same font for all systems (Because Linux/macOS/Windows ship with different fonts)
+@functools.lru_cache(maxsize=1)
+def fontData():
+	"""Decode the embedded font the first time text is drawn"""
+	return base64.b64decode(FONT_ENCODED)
+
+@functools.lru_cache(maxsize=None)
+def getFont(fontSize):
+	"""Load the font once per size, straight from memory so there is no temporary file to clean up"""
+	return pygame.font.Font(io.BytesIO(fontData()), fontSize)
+
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
 def renderText(text, color, fontSize):
-	"""Load the needed font and return the rendered text object"""
-	rFont = pygame.font.Font(font_file.name, fontSize)
-	rText = rFont.render(text, True, color)
+	"""Return the rendered text object, cached by text, color and size (callers must not draw on it)"""
+	rText = getFont(fontSize).render(text, True, color)
 	return rText
 
+def invalidateTextCache():
+	"""Forget every cached font and rendered text, needed when the resolution or theme changes"""
+	renderText.cache_clear()
+	getFont.cache_clear()
+
+def textCacheStats():
+	"""Return hit/miss counts of the font and rendered text caches"""
+	fonts = getFont.cache_info()
+	texts = renderText.cache_info()
+	return {'font_hits': fonts.hits, 'font_misses': fonts.misses, 'text_hits': texts.hits, 'text_misses': texts.misses, 'text_cached': texts.currsize}
+
 def createBoard():
-	"""Creates an empty numpy array matrix of NUM_ROWS and NUM_COLUMNS"""
-	board = numpy.zeros((NUM_ROWS,NUM_COLUMNS))
+	"""Creates an empty bitboard position of the size and pieces to connect given on the command line
+
+	It keeps count of the pieces on every winning line as they drop, which the Medium and
+	Hard AIs read their threats from.
+	"""
+	board = TrackedPosition(args.rows, args.columns, args.connect)
 	return board
 
 def dropPiece(board, row, col, piece):
 	"""Push the players piece to the specified location"""
 	game_history.append((piece, row, col))
-	board[row][col] = piece
+	board.play(col, piece)
 
 def isValidLocation(board, col):
 	"""Returns boolean depending on if the location desired is valid"""
-	if col > 6 or col < 0:
-		return 0
-	return board[NUM_ROWS-1][col] == 0
+	return board.canPlay(col)
 
 def getNextOpenRow(board, col):
 	"""Return the closest free row"""
-	for r in range(NUM_ROWS):
-		if board[r][col] == 0:
-			return r
+	if board.canPlay(col):
+		return board.heights[col]
 
 def printBoard(board):
 	"""Prints the array matrix for the user to see their previous game history"""
-	for i in reversed(range(NUM_ROWS)):
-		for j in range(NUM_COLUMNS):
-			if board[i][j] == 1:
+	for i in reversed(range(board.rows)):
+		for j in range(board.columns):
+			if board.pieceAt(i, j) == 1:
 				print("\033[0;31m* ", end = '')
-			elif board[i][j] == 2:
+			elif board.pieceAt(i, j) == 2:
 				print("\033[0;33m* ", end = '')
 			else:
 				print("\033[0;0m* ", end = '')
 		print("\033[1;37m")
 
 def winningMove(board, piece):
-	"""Checks horizonal/vertical/diaganol positions to determine if there is 4 pieces in a row"""
-	# Check horizontal locations for win
-	for c in range(NUM_COLUMNS-3):
-		for r in range(NUM_ROWS):
-			if board[r][c] == piece and board[r][c+1] == piece and board[r][c+2] == piece and board[r][c+3] == piece:
-				return True
-
-	# Check vertical locations for win
-	for c in range(NUM_COLUMNS):
-		for r in range(NUM_ROWS-3):
-			if board[r][c] == piece and board[r+1][c] == piece and board[r+2][c] == piece and board[r+3][c] == piece:
-				return True
-
-	# Check positively sloped diaganols
-	for c in range(NUM_COLUMNS-3):
-		for r in range(NUM_ROWS-3):
-			if board[r][c] == piece and board[r+1][c+1] == piece and board[r+2][c+2] == piece and board[r+3][c+3] == piece:
-				return True
-
-	# Check negatively sloped diaganols
-	for c in range(NUM_COLUMNS-3):
-		for r in range(3, NUM_ROWS):
-			if board[r][c] == piece and board[r-1][c+1] == piece and board[r-2][c+2] == piece and board[r-3][c+3] == piece:
-				return True
+	"""Checks horizonal/vertical/diaganol positions to determine if there are k pieces in a row"""
+	return board.isWin(piece)
 
 def tieGame(board):
 	"""Detect if the board is full, thus the game is tied"""
-	return numpy.all(board)
-
-def drawBoard(board):
-	"""Uses pygame's draw functionality to display the current board"""
-	# Flush previous screen
-	pygame.draw.rect(screen, WHITE, (0,	SQUARESIZE, screenWidth - 250 - PADDING, screenHeight - SQUARESIZE))
-
-	start_vertical = (screenHeight - (SQUARESIZE*NUM_ROWS + PADDING*(NUM_ROWS+2)))
-	pygame.draw.rect(screen, BLUE, (PADDING, start_vertical, (NUM_COLUMNS*(PADDING+SQUARESIZE) + PADDING), (NUM_ROWS*(PADDING+SQUARESIZE) + PADDING)), 0, int(RADIUS/2))
-
-	for c in range(NUM_COLUMNS):
-		for r in range(NUM_ROWS):
-			drawCircle(screen, WHITE, (PADDING + int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), start_vertical + int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)), RADIUS)
+	return board.isFull()
+
+class BoardRenderer:
+	"""Draws the game screen from sprites rendered once per resolution, repainting only changed cells
+
+	Everything drawn is queued in dirty_rects, so updateDisplay() only pushes those areas to the
+	display instead of the whole window. Cells keep the standard size unless the board has too
+	many rows or columns to fit, in which case cells, gaps and pieces all shrink together.
+	Dropped pieces fall and winning lines grow over several frames; animate() moves them on by
+	the time since the last frame and repaints only the columns they are in.
+	"""
+
+	def __init__(self, rows=NUM_ROWS, columns=NUM_COLUMNS):
+		self.resolution = (screenWidth, screenHeight, SQUARESIZE)
+		self.rows = rows
+		self.columns = columns
+		self.pitch = min(SQUARESIZE + PADDING, (screenWidth - 250 - 3*PADDING)//columns, (screenHeight - SQUARESIZE - 3*PADDING)//rows) # Distance between cell centers
+		self.gap = round(self.pitch*PADDING/(SQUARESIZE + PADDING))
+		self.cell = self.pitch - self.gap
+		self.radius = int(self.cell/2 - 5*self.cell/SQUARESIZE)
+		self.boardWidth = columns*self.pitch + self.gap
+		self.start_vertical = screenHeight - PADDING - (rows*self.pitch + self.gap)
+
+		# Board frame with empty holes, used to repaint the whole play area and to clear cells
+		self.frame = pygame.Surface((screenWidth - 250 - PADDING, screenHeight - SQUARESIZE))
+		self.frame.fill(WHITE)
+		pygame.draw.rect(self.frame, BLUE, (PADDING, self.start_vertical - SQUARESIZE, self.boardWidth, rows*self.pitch + self.gap), 0, int(self.radius/2))
+		for c in range(columns):
+			for r in range(rows):
+				x, y = self.cellCenter(r, c)
+				drawCircle(self.frame, WHITE, (x, y - SQUARESIZE), self.radius)
+
+		self.pieces = {piece: self.circleSprite(color, self.radius) for piece, color in ((1, RED), (2, YELLOW))}
+		self.highlight = self.circleSprite(GREEN, int(self.radius/3))
+
+		# Mini board, drawn at the standard cell size and smoothscaled once while empty to fit the
+		# panel; pieces are drawn straight at the small scale
+		miniBoard = pygame.Surface((columns*(SQUARESIZE + PADDING) + PADDING, rows*(SQUARESIZE + PADDING) + PADDING))
+		pygame.Surface.fill(miniBoard, GRAY)
+		for c in range(columns):
+			for r in range(rows):
+				drawCircle(miniBoard, WHITE, (int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)), RADIUS)
+		if (rows, columns) == (NUM_ROWS, NUM_COLUMNS):
+			miniSize = (176, 150)
+		else:
+			fit = min(176/miniBoard.get_width(), 150/miniBoard.get_height()) # Keep odd shapes in proportion
+			miniSize = (round(miniBoard.get_width()*fit), round(miniBoard.get_height()*fit))
+		self.miniScale = (miniSize[0]/miniBoard.get_width(), miniSize[1]/miniBoard.get_height())
+		self.miniHeight = miniBoard.get_height()
+		self.miniEmpty = pygame.transform.smoothscale(miniBoard, miniSize)
+
+		self.history = pygame.Surface((200, 1200))
+		self.drops = [] # [row, col, piece, seconds falling] of pieces on their way down, drawn as empty cells until they land
+		self.highlightCells = ()
+		self.highlightAge = None # Seconds the winning line's markers have been growing, None when they aren't
+		self.invalidate()
+
+	def circleSprite(self, color, radius):
+		"""Pre-render an anti aliased circle on a transparent surface"""
+		sprite = pygame.Surface((2*radius + 3, 2*radius + 3), pygame.SRCALPHA)
+		drawCircle(sprite, color, (radius + 1, radius + 1), radius)
+		return sprite
+
+	def cellCenter(self, row, col):
+		"""Screen position of the center of a board cell, row 0 being the bottom row"""
+		return (PADDING + int((col+1)*self.pitch - self.cell/2), screenHeight-int((row+1)*self.pitch-self.cell/2+PADDING)-1)
+
+	def columnAt(self, posx):
+		"""Column under a screen x position left of the history panel, the nearest edge column past the board"""
+		return max(0, min(int((posx - PADDING)//self.pitch), self.columns - 1))
+
+	def hoverX(self, posx):
+		"""Clamp the x position of the piece following the mouse to above the board"""
+		right = min(screenWidth - 250 - PADDING, PADDING + self.boardWidth + PADDING)
+		return max(SQUARESIZE*3/4, min(posx, right - SQUARESIZE*3/4))
+
+	def stripRect(self, col):
+		"""Screen area of a column from under the top strip to the bottom of the board"""
+		x = self.cellCenter(0, col)[0]
+		return pygame.Rect(x - self.pitch//2, SQUARESIZE, self.pitch, screenHeight - PADDING - SQUARESIZE)
+
+	@property
+	def animating(self):
+		"""True while a piece is falling or a winning line is still growing"""
+		return bool(self.drops) or self.highlightAge is not None
+
+	def startDrop(self, row, col, piece):
+		"""Let a piece just played fall from the top strip into its cell"""
+		self.drops.append([row, col, piece, 0.0])
+
+	def startHighlight(self, cells):
+		"""Grow the markers on a winning line once every falling piece has landed"""
+		self.highlightCells = tuple(cells)
+		self.highlightAge = 0.0
+
+	def stopAnimations(self):
+		"""Drop every animation, the next drawBoard() paints the pieces in place"""
+		for row, col, _, _ in self.drops:
+			self.cells.pop((row, col), None)
+		self.drops = []
+		self.highlightAge = None
+
+	def animate(self, seconds):
+		"""Move the animations on by the seconds since the last frame, repainting only the column strips they cover"""
+		if self.drops:
+			columns = set()
+			for drop in self.drops:
+				drop[3] += seconds
+				columns.add(drop[1])
+			for drop in [drop for drop in self.drops if self.dropY(drop) is None]:
+				self.drops.remove(drop)
+				self.cells[(drop[0], drop[1])] = (drop[2], False)
+			for col in columns:
+				strip = self.stripRect(col)
+				dirty_rects.append(screen.blit(self.frame, strip, strip.move(0, -SQUARESIZE)))
+				for r in range(self.rows):
+					piece, marked = self.cells.get((r, col), (0, False))
+					if piece:
+						x, y = self.cellCenter(r, col)
+						screen.blit(self.pieces[piece], (x - self.radius - 1, y - self.radius - 1))
+					if marked:
+						screen.blit(self.highlight, self.highlight.get_rect(center=self.cellCenter(r, col)))
+				screen.set_clip(strip) # Pieces come in from behind the top strip
+				for drop in self.drops:
+					if drop[1] == col:
+						x = self.cellCenter(drop[0], col)[0]
+						screen.blit(self.pieces[drop[2]], (x - self.radius - 1, self.dropY(drop) - self.radius - 1))
+				screen.set_clip(None)
+		elif self.highlightAge is not None:
+			self.highlightAge += seconds
+			grown = min(1000*self.highlightAge/HIGHLIGHT_GROW_MS, 1.0)
+			for r, c in self.highlightCells:
+				x, y = self.cellCenter(r, c)
+				area = pygame.Rect(x - self.radius - 1, y - self.radius - 1, 2*self.radius + 3, 2*self.radius + 3)
+				dirty_rects.append(screen.blit(self.frame, area, area.move(0, -SQUARESIZE)))
+				piece = self.cells.get((r, c), (0, False))[0]
+				if piece:
+					screen.blit(self.pieces[piece], area)
+				if grown == 1.0:
+					screen.blit(self.highlight, self.highlight.get_rect(center=(x, y)))
+					self.cells[(r, c)] = (piece, True)
+				elif int(grown*self.radius/3):
+					drawCircle(screen, GREEN, (x, y), int(grown*self.radius/3))
+			if grown == 1.0:
+				self.winning = self.highlightCells
+				self.highlightAge = None
+
+	def dropY(self, drop):
+		"""Screen y of a falling piece's center, None once it has reached its cell"""
+		row, col, _, seconds = drop
+		y = SQUARESIZE/2 + DROP_GRAVITY*seconds*seconds/2
+		target = self.cellCenter(row, col)[1]
+		return None if y >= target else int(y)
+
+	def invalidate(self):
+		"""Force the next draw to repaint everything, e.g. after a message or menu covered the board"""
+		self.board = None
+		self.cells = {}
+		self.winning = ()
+		self.historyShown = None
+
+	def drawBoard(self, board, winning_cells=()):
+		"""Repaint the cells that changed since the last call, or everything after invalidate()"""
+		if board is not self.board:
+			self.invalidate()
+			self.board = board
+			dirty_rects.append(screen.fill(WHITE))
+			screen.blit(self.frame, (0, SQUARESIZE))
+
+		winning_cells = tuple(winning_cells)
+		falling = {(drop[0], drop[1]) for drop in self.drops}
+		for r in range(self.rows):
+			for c in range(self.columns):
+				piece = 0 if (r, c) in falling else board.pieceAt(r, c)
+				marked = (r, c) in winning_cells
+				if self.cells.get((r, c), (0, False)) == (piece, marked):
+					continue
+				self.cells[(r, c)] = (piece, marked)
+				x, y = self.cellCenter(r, c)
+				area = pygame.Rect(x - self.radius - 1, y - self.radius - 1, 2*self.radius + 3, 2*self.radius + 3)
+				dirty_rects.append(screen.blit(self.frame, area, area.move(0, -SQUARESIZE)))
+				if piece:
+					screen.blit(self.pieces[piece], area)
+				if marked:
+					screen.blit(self.highlight, self.highlight.get_rect(center=(x, y)))
+		self.winning = winning_cells
+
+		self.drawHistory(board)
+
+	def drawHistory(self, board):
+		"""Update the side panel, rendering only the history rows inside the scrolled viewport"""
+		first = historyFirstRow()
+		shown = self.historyShown
+		if shown is None or shown[1] > len(game_history):
+			dirty_rects.append(pygame.draw.rect(screen, WHITE, ((screenWidth - 250 - PADDING), PADDING, 250, (screenHeight - (2*PADDING)))))
+			pygame.draw.rect(screen, GRAY, ((screenWidth - 250 - PADDING), PADDING, 250, (screenHeight - (2*PADDING))), 0, int(RADIUS/2))
+			self.history.fill(GRAY)
+			self.history.blit(renderText("Game History", BLACK, 32 if sys.platform == 'linux' else 31), (0, 0))
+			self.history.blit(self.miniEmpty, (PADDING, 40))
+			self.drawMiniLabels()
+			shown = (first, 0, {})
+		elif shown[0] == first and shown[1] == len(game_history):
+			return
 
-	for c in range(NUM_COLUMNS):
-		for r in range(NUM_ROWS):
-			if board[r][c] == 1:
-				drawCircle(screen, RED, (PADDING + int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), screenHeight-int((r+1)*(SQUARESIZE+PADDING)-SQUARESIZE/2+PADDING)-1), RADIUS)
-			elif board[r][c] == 2:
-				drawCircle(screen, YELLOW, (PADDING + int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), screenHeight-int((r+1)*(SQUARESIZE+PADDING)-SQUARESIZE/2+PADDING)-1), RADIUS)
+		# Mini board cells that changed
+		miniCells = shown[2]
+		for r in range(self.rows):
+			for c in range(self.columns):
+				piece = board.pieceAt(r, c)
+				if piece and miniCells.get((r, c)) != piece:
+					miniCells[(r, c)] = piece
+					x = int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)*self.miniScale[0]
+					y = ((self.miniHeight - int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)) - 1)*self.miniScale[1]
+					drawCircle(self.history, RED if piece == 1 else YELLOW, (PADDING + x, 40 + y), max(int(RADIUS*self.miniScale[0]), 1))
+
+		# Rows in the viewport, all of them after scrolling, otherwise only the new ones
+		offset = SQUARESIZE*2 + PADDING*3
+		rowHeight = self.history.get_height()/56
+		if shown[0] != first:
+			self.history.fill(GRAY, (0, offset, self.history.get_width(), rowHeight*HISTORY_ROWS + 1))
+			newRows = range(first, min(len(game_history), first + HISTORY_ROWS))
+		else:
+			newRows = range(max(shown[1], first), min(len(game_history), first + HISTORY_ROWS))
+		for i in newRows:
+			entry = game_history[i]
+			slot = i - first
+			text = renderText("Player " + str(entry[0]) + "     Row " + str(entry[1] + 1) + " Column " + str(entry[2] + 1), BLACK, 16)
+			location = pygame.Rect(0, rowHeight*slot + offset, self.history.get_width() - 2*PADDING, rowHeight)
+			self.history.blit(text, (0,(location.centery - (text.get_rect().height/2))))
+			drawCircle(self.history, RED if entry[0] == 1 else YELLOW, (67, rowHeight*slot + (text.get_rect().height/2) + offset), 7)
+		self.historyShown = (first, len(game_history), miniCells)
+
+		dirty_rects.append(screen.blit(self.history, ((screenWidth - 235),PADDING*2), pygame.Rect(0, 0, 200, 692)))
+		if len(game_history) > HISTORY_ROWS:
+			dirty_rects.append(screen.blit(renderText("Scroll for more", BLACK, 20), ((screenWidth - 235),PADDING*2 + 695)))
+
+	def drawMiniLabels(self):
+		"""Number the mini board's columns along its bottom and its rows up its left side, skipping some when crowded"""
+		spacing = (SQUARESIZE + PADDING)*self.miniScale[0]
+		step = 1
+		while spacing*step < 18: # About the width of a two digit label
+			step += 1
+		for c in range(0, self.columns, step):
+			label = renderText(str(c + 1), BLACK, 16)
+			x = PADDING + int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)*self.miniScale[0]
+			self.history.blit(label, (x - label.get_width()/2, 40 + self.miniEmpty.get_height() - 1))
+		spacing = (SQUARESIZE + PADDING)*self.miniScale[1]
+		step = 1
+		while spacing*step < 18:
+			step += 1
+		for r in range(0, self.rows, step):
+			label = pygame.transform.rotate(renderText(str(r + 1), BLACK, 16), 90)
+			y = 40 + ((self.miniHeight - int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)) - 1)*self.miniScale[1]
+			self.history.blit(label, (0, y - label.get_height()/2))
+
+def drawBoard(board, winning_cells=()):
+	"""Uses pygame's draw functionality to display the current board, marking any winning cells"""
+	getRenderer(board).drawBoard(board, winning_cells)
+
+def animateDrop(board, row, col, piece, winning_cells=()):
+	"""Show a piece just played falling into place, followed by the winning line growing if it won"""
+	renderer = getRenderer(board)
+	renderer.startDrop(row, col, piece)
+	drawBoard(board)
+	if winning_cells:
+		renderer.startHighlight(winning_cells)
 
-	drawHistory(board)
+def finishAnimations(board):
+	"""Keep drawing frames until every piece has landed and the winning line is marked"""
+	seconds = 0.0
+	while getRenderer(board).animating:
+		for event in pygame.event.get():
+			if event.type == pygame.QUIT:
+				deInit()
+		getRenderer(board).animate(seconds)
+		seconds = nextFrame()
 
 def drawHistory(board):
 	"""Displays game history on a side panel"""
-	pygame.draw.rect(screen, WHITE, ((screenWidth - 250 - PADDING), PADDING, 250, (screenHeight - (2*PADDING))))
-	pygame.draw.rect(screen, GRAY, ((screenWidth - 250 - PADDING), PADDING, 250, (screenHeight - (2*PADDING))), 0, int(RADIUS/2))
-	history = pygame.Surface((200, 1200))
-	history.fill(GRAY)
-	offset = SQUARESIZE*2 + PADDING*3
-
-	miniBoard = pygame.Surface((screenWidth*729/1024, screenHeight*627/768))
-	pygame.Surface.fill(miniBoard, GRAY)
-	for c in range(NUM_COLUMNS):
-		for r in range(NUM_ROWS):
-			drawCircle(miniBoard, WHITE, (int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)), RADIUS)
-	for c in range(NUM_COLUMNS):
-		for r in range(NUM_ROWS):
-			if board[r][c] == 1:
-				drawCircle(miniBoard, RED, (int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), (miniBoard.get_height() - int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)) - 1), RADIUS)
-			elif board[r][c] == 2:
-				drawCircle(miniBoard, YELLOW, (int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), (miniBoard.get_height() - int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)) - 1), RADIUS)
-	history.blit(renderText("Game History", BLACK, 32 if sys.platform == 'linux' else 31), (0, 0))
-	history.blit(pygame.transform.smoothscale(miniBoard, (176, 150)), (PADDING, 40))
-	history.blit(renderText("1    2    3    4    5    6    7", BLACK, 16), (PADDING*1.5, offset - (PADDING*2)))
-	history.blit(pygame.transform.rotate(renderText("1    2    3    4    5    6", BLACK, 16), 90), (0, 48))
-
-	for i in range(len(game_history) - (22*history_view)):
-		text = renderText("Player " + str(game_history[i + (22*history_view)][0]) + "     Row " + str(game_history[i + (22*history_view)][1] + 1) + " Column " + str(game_history[i + (22*history_view)][2] + 1), BLACK, 16)
-		location = pygame.Rect(0, history.get_height()*i/56 + offset, history.get_width() - 2*PADDING, history.get_height()/56)
-		history.blit(text, (0,(location.centery - (text.get_rect().height/2))))
-		drawCircle(history, RED if game_history[i + (22*history_view)][0] == 1 else YELLOW, (67, history.get_height()*i/56 + (text.get_rect().height/2) + offset), 7)
-
-	screen.blit(history, ((screenWidth - 235),PADDING*2), pygame.Rect(0, 0, 200, 692))
-	if len(game_history) >= 23:
-		screen.blit(renderText("Click for more", BLACK, 20), ((screenWidth - 235),PADDING*2 + 695))
+	getRenderer(board).drawHistory(board)
+
+def historyFirstRow():
+	"""Index of the first move shown in the history panel, following the latest move unless scrolled"""
+	last = max(len(game_history) - HISTORY_ROWS, 0)
+	return last if history_scroll is None else min(history_scroll, last)
+
+def scrollHistory(rows):
+	"""Scroll the history panel by a number of rows, back to following the latest move at the end"""
+	global history_scroll
+	last = max(len(game_history) - HISTORY_ROWS, 0)
+	first = min(max(historyFirstRow() + rows, 0), last)
+	history_scroll = None if first == last else first
+
+def pageHistory():
+	"""Scroll the history panel down a page, or back to the top from the end"""
+	if historyFirstRow() == max(len(game_history) - HISTORY_ROWS, 0):
+		scrollHistory(-len(game_history))
+	else:
+		scrollHistory(HISTORY_ROWS)
+
+def getRenderer(board=None):
+	"""Return the board renderer, rebuilding its sprites if the resolution or the board's size changed"""
+	global renderer
+	if renderer is not None and renderer.resolution != (screenWidth, screenHeight, SQUARESIZE):
+		invalidateTextCache()
+		renderer = None
+	if renderer is None or (board is not None and (renderer.rows, renderer.columns) != (board.rows, board.columns)):
+		renderer = BoardRenderer(board.rows, board.columns) if board is not None else BoardRenderer()
+	return renderer
+
+def updateDisplay():
+	"""Push only the areas drawn since the last frame to the display"""
+	if dirty_rects:
+		pygame.display.update(dirty_rects)
+		dirty_rects.clear()
+
+def enableStats():
+	"""Start recording frame, event, draw and AI timings"""
+	global stats
+	if stats is None:
+		stats = perf.Recorder()
+		stats.instrument(BoardRenderer, ['drawBoard', 'drawHistory', 'animate'])
+		stats.instrument(sys.modules[__name__], ['drawThinking', 'drawHoverStrip', 'composeMenu', 'drawMenuButton', 'updateDisplay'])
+
+def toggleStats():
+	"""Show or hide the stats overlay, recording from the first time it is shown"""
+	global stats_overlay, stats_surface
+	enableStats()
+	stats_overlay = not stats_overlay
+	stats_surface = None
+	if not stats_overlay and stats_area:
+		dirty_rects.append(stats_area) # The screen under it is already restored, see presentFrame()
+
+def sampleStats():
+	"""Record the hit rates of the text and search caches"""
+	texts = renderText.cache_info()
+	if texts.hits + texts.misses:
+		stats.count('text_cache_hit_rate', texts.hits/(texts.hits + texts.misses))
+	if ai_player and ai_player.searcher:
+		stats.count('table_hit_rate', ai_player.searcher.table.stats()['hit_rate'])
+
+def recordAIMove(player, worker):
+	"""Record how long the AI took over its move and how much it searched"""
+	stats.record('ai_think', worker.started, worker.seconds)
+	if player.lastResult and player.mcts:
+		stats.count('ai_playouts', player.lastResult.playouts)
+	elif player.lastResult:
+		stats.count('ai_nodes', player.lastResult.nodes)
+
+def renderStats(series):
+	"""Render frame rate, frame time percentiles, the last AI move and the text cache hit rate"""
+	durations = stats.recent(series, 600)
+	line = ("FPS " + str(round(stats.fps(series), 1)) if series == 'frame' else "Menu") + "   p95 " + str(round(1000*perf.percentile(durations, 95), 1)) + " ms   p99 " + str(round(1000*perf.percentile(durations, 99), 1)) + " ms"
+	think = stats.recent('ai_think', 1)
+	nodes = stats.recent('ai_nodes', 1)
+	hits = stats.recent('text_cache_hit_rate', 1)
+	detail = "AI " + (str(round(1000*think[0])) + " ms" if think else "-") + ("   " + str(int(nodes[0])) + " nodes" if nodes else "") + "   text cache " + (str(round(100*hits[0])) + "%" if hits else "-")
+
+	font = getFont(16)
+	first, second = font.render(line, True, WHITE), font.render(detail, True, WHITE) # Not renderText, these change too often to cache
+	surface = pygame.Surface((max(first.get_width(), second.get_width()) + 8, first.get_height() + second.get_height() + 6))
+	surface.set_alpha(200)
+	surface.blit(first, (4, 3))
+	surface.blit(second, (4, 3 + first.get_height()))
+	return surface
+
+def presentFrame(series='frame'):
+	"""Push this frame's drawing to the display, with the stats overlay on top when it is shown
+
+	The overlay is drawn just before the display update and the pixels under it are put back
+	right after, so the rest of the game never has to know it is there.
+	"""
+	global stats_surface, stats_sampled, stats_area
+	if stats and pygame.time.get_ticks() - stats_sampled >= STATS_REFRESH_MS:
+		stats_sampled = pygame.time.get_ticks()
+		sampleStats()
+		stats_surface = None
+	if not stats_overlay:
+		updateDisplay()
+		return
+
+	if stats_surface is None:
+		stats_surface = renderStats(series)
+	if stats_area:
+		dirty_rects.append(stats_area) # In case the overlay got smaller
+	stats_area = stats_surface.get_rect()
+	under = screen.subsurface(stats_area).copy()
+	dirty_rects.append(screen.blit(stats_surface, stats_area))
+	updateDisplay()
+	screen.blit(under, stats_area)
+
+def nextFrame():
+	"""Wait for the next frame, show everything drawn during this one and return the seconds since the last"""
+	elapsed = clock.tick(FPS)/1000
+	if stats:
+		stats.record('frame', time.perf_counter() - elapsed, elapsed)
+	presentFrame()
+	return elapsed
 
 def drawMessage(message, backgroundColor, foregroundColor, strokeColor, duration):
 	"""Uses pygame's rect and label functionality to create a rectangle with the desired message for the user"""
@@ -228,7 +614,7 @@ def drawMessage(message, backgroundColor, foregroundColor, strokeColor, duration
 
 	while pygame.time.get_ticks() < initial_time + duration:
 		bgRect = pygame.Rect((screenWidth/2 - 250), 250, 500, 200)
-		pygame.draw.rect(screen, backgroundColor, bgRect, 0, 10)
+		dirty_rects.append(pygame.draw.rect(screen, backgroundColor, bgRect, 0, 10))
 		mText = renderText(message, foregroundColor, 55)
 		rText = mText.get_rect()
 		mText2 = renderText(message, strokeColor, 55)
@@ -241,300 +627,330 @@ def drawMessage(message, backgroundColor, foregroundColor, strokeColor, duration
 			if event.type == pygame.QUIT:
 				deInit()
 
-		clock.tick(FPS)
-		pygame.display.update()
+		nextFrame()
+
+	getRenderer().invalidate() # The message covered part of the board
+
+def menuButtons():
+	"""Return the main menu buttons as (rect, label, font size, color, hover color, game mode) tuples, mode None meaning quit"""
+	player_v_player_l_rect = pygame.Rect(screenWidth*131/512, screenHeight*438/768, screenWidth/2, screenHeight*25/256)
+	player_v_player_o_rect = pygame.Rect(screenWidth*131/512, screenHeight*673/768, screenWidth/4 - 3, screenHeight*25/256)
+	quit_rect = pygame.Rect(screenWidth*518/1024 + 3, screenHeight*673/768, screenWidth/4 - 3, screenHeight*25/256)
+	ai_easy_rect, ai_med_rect, ai_hard_rect, ai_expert_rect, ai_mcts_rect = [pygame.Rect(screenWidth*(265 + 102*i)/1024, screenHeight*578/768, screenWidth*98/1024, screenHeight*25/256) for i in range(5)]
+	return [
+		(player_v_player_l_rect, "Player vs Player (Local)", 35, RED, WHITE, 0),
+		(ai_easy_rect, "Easy", 26, GRAY, (0x00,0xA0,0x00), 1),
+		(ai_med_rect, "Medium", 26, GRAY, (0xC7,0xC7,0x00), 2),
+		(ai_hard_rect, "Hard", 26, GRAY, RED, 3),
+		(ai_expert_rect, "Expert", 26, GRAY, (0x80,0x00,0xC0), 4),
+		(ai_mcts_rect, "MCTS", 26, GRAY, BLUE, 5),
+		(player_v_player_o_rect, "Play Online", 35, BLUE, WHITE, ONLINE),
+		(quit_rect, "Quit", 35, BLUE, WHITE, None),
+	]
+
+def composeMenu(board, buttons):
+	"""Draw everything on the main menu that doesn't react to the mouse onto one surface"""
+	menuSurface = pygame.Surface(size)
+	menuSurface.fill(WHITE)
+
+	background_rect = pygame.Rect(screenWidth*131/1280, screenHeight*433/768, screenWidth*103/128, screenHeight*5/12)
+	player_v_ai_background_rect = pygame.Rect(screenWidth*131/512, screenHeight*518/768, screenWidth/2, screenHeight*50/256)
+	pygame.draw.rect(menuSurface, YELLOW, background_rect, 0, 10) # Background
+	pygame.draw.rect(menuSurface, GREEN, player_v_ai_background_rect, 0, 10) # Player vs. AI background
+	for rect, _, _, color, _, _ in buttons:
+		pygame.draw.rect(menuSurface, color, rect, 0, 10)
+	p_v_AI = renderText("Player vs AI", BLACK, 35)
+	menuSurface.blit(p_v_AI, ((player_v_ai_background_rect.centerx - (p_v_AI.get_rect().width/2)), (player_v_ai_background_rect.y + (p_v_AI.get_rect().height/4))))
+
+	# Connect 4 Logo, showing the last game when it was played on a standard board
+	logo_board = board
+	if not board.moves or (board.rows, board.columns) != (NUM_ROWS, NUM_COLUMNS):
+		logo_board = [
+			[1, 2, 2, 1, 2, 0, 0],
+			[0, 1, 2, 1, 1, 0, 0],
+			[0, 0, 1, 2, 0, 0, 0],
+			[0, 0, 0, 1, 0, 0, 0],
+			[0, 0, 0, 0, 0, 0, 0],
+			[0, 0, 0, 0, 0, 0, 0],
+			[0, 0, 0, 0, 0, 0, 0],
+		]
+
+	logo = pygame.Surface((screenWidth*729/1024, screenHeight*627/768))
+	pygame.Surface.fill(logo, WHITE)
+	pygame.draw.rect(logo, BLUE, (0, 0, logo.get_width(), logo.get_height()), 0, int(RADIUS/2))
+
+	for c in range(NUM_COLUMNS):
+		for r in range(NUM_ROWS):
+			drawCircle(logo, WHITE, (int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)), RADIUS)
+
+	for c in range(NUM_COLUMNS):
+		for r in range(NUM_ROWS):
+			if logo_board[r][c] == 1:
+				drawCircle(logo, RED, (int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), (logo.get_height() - int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)) - 1), RADIUS)
+			elif logo_board[r][c] == 2:
+				drawCircle(logo, YELLOW, (int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), (logo.get_height() - int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)) - 1), RADIUS)
+	pygame.draw.rect(logo, GRAY, (SQUARESIZE, SQUARESIZE, logo.get_width() - (2*SQUARESIZE), (2*SQUARESIZE)), 0, int(RADIUS/2))
+	title = renderText("Connect " + str(args.connect), BLACK, 120)
+	logo.blit(title, ((logo.get_width() - title.get_rect().width)/2, (SQUARESIZE*4 - title.get_rect().height)/2))
+	menuSurface.blit(pygame.transform.smoothscale(logo, (468, 403)), (screenWidth/2 - int(468/2), PADDING))
+	return menuSurface
+
+def drawMenuButton(menuSurface, button, hovered):
+	"""Repaint one menu button from the static layer and return the area that changed"""
+	rect, label, fontSize, _, hoverColor, _ = button
+	area = screen.blit(menuSurface, rect, rect)
+	text = renderText(label, hoverColor if hovered else BLACK, fontSize)
+	screen.blit(text, ((rect.centerx - (text.get_rect().width/2)), (rect.centery - (text.get_rect().height/2))))
+	return area
 
 def drawStartUI(board, gameOver):
-	"""Draws main menu UI"""
-	menu = True
+	"""Draws main menu UI
 
-	# Flush previous screen
-	pygame.Surface.fill(screen, WHITE)
+	The static parts are composed once per visit and the loop sleeps in pygame.event.wait, so only
+	a button whose hover state changes gets repainted and an idle menu uses next to no CPU.
+	"""
+	menu = True
+	pygame.display.set_caption("Connect Four")
+	buttons = menuButtons()
+	menuSurface = None
+	firstFrame = True
 
 	while menu:
-		mouse_pos = pygame.mouse.get_pos()
-		screen.fill(WHITE)
-		
-		#Text Initializer
-		text_start = renderText("Player vs Player (Local)", BLACK, 35)
-		text_quit = renderText("Quit", BLACK, 35)
-		p_v_AI = renderText("Player vs AI", BLACK, 35)
-		AI_easy = renderText("Easy", BLACK, 35)
-		AI_med = renderText("Medium", BLACK, 35)
-		AI_hard = renderText("Hard", BLACK, 35)
-		title = renderText("Connect 4", BLACK, 120)
-
-		#Main Menu Rectangles
-		background_rect = pygame.Rect(screenWidth*131/1280, screenHeight*433/768, screenWidth*103/128, screenHeight*5/12)
-		player_v_player_l_rect = pygame.Rect(screenWidth*131/512, screenHeight*438/768, screenWidth/2, screenHeight*25/256)
-		player_v_ai_background_rect = pygame.Rect(screenWidth*131/512, screenHeight*518/768, screenWidth/2, screenHeight*50/256)
-		player_v_player_o_rect = pygame.Rect(screenWidth*131/512, screenHeight*673/768, screenWidth/2, screenHeight*25/256)
-		ai_easy_rect = pygame.Rect(screenWidth*285/1024, screenHeight*578/768, screenWidth*135/1024, screenHeight*25/256)
-		ai_med_rect = pygame.Rect(screenWidth*450/1024, screenHeight*578/768, screenWidth*135/1024, screenHeight*25/256)
-		ai_hard_rect = pygame.Rect(screenWidth*615/1024, screenHeight*578/768, screenWidth*135/1024, screenHeight*25/256)
-
-		pygame.draw.rect(screen, YELLOW, background_rect, 0, 10) # Background
-		pygame.draw.rect(screen, RED, player_v_player_l_rect, 0, 10) # Player vs. Player (local)
-		pygame.draw.rect(screen, GREEN, player_v_ai_background_rect, 0, 10) # Player vs. AI background
-		pygame.draw.rect(screen, BLUE, player_v_player_o_rect, 0, 10) # Player vs. Player (online)
-		pygame.draw.rect(screen, GRAY, ai_easy_rect, 0, 10) # AI easy
-		pygame.draw.rect(screen, GRAY, ai_med_rect, 0, 10) # AI medium
-		pygame.draw.rect(screen, GRAY, ai_hard_rect, 0, 10) # AI hard
+		if menuSurface is None: # First frame, or back from a game
+			menuSurface = composeMenu(board, buttons)
+			screen.blit(menuSurface, (0, 0))
+			hovered = None
+			mouse_pos = pygame.mouse.get_pos()
+			for i, button in enumerate(buttons):
+				if button[0].collidepoint(mouse_pos):
+					hovered = i
+				drawMenuButton(menuSurface, button, hovered == i)
+			dirty_rects.append(screen.get_rect())
+			presentFrame('menu_frame')
+			if firstFrame:
+				firstFrame = False
+				markStartup("First frame")
+				if args.profile_startup:
+					printStartupProfile()
 
 		#Hover & Click Events
-		for event in pygame.event.get():
+		event = pygame.event.wait(MENU_IDLE_TIMEOUT_MS)
+		events_start = time.perf_counter()
+		for event in [event] + pygame.event.get():
 			if event.type == pygame.QUIT:
 				menu = False
-			if event.type == pygame.MOUSEBUTTONDOWN:
-				if mouse_pos[0] in range(player_v_player_l_rect.left, player_v_player_l_rect.right) and mouse_pos[1] in range(player_v_player_l_rect.top, player_v_player_l_rect.bottom):
-					if gameOver:
-						gameOver = False
-					board = createBoard()
-					drawBoard(board)
-					gameLoop(gameOver, board, 0)
-				elif mouse_pos[0] in range(ai_easy_rect.left, ai_easy_rect.right) and mouse_pos[1] in range(ai_easy_rect.top, ai_easy_rect.bottom):
-					if gameOver:
-						gameOver = False
-					board = createBoard()
-					drawBoard(board)
-					gameLoop(gameOver, board, 1)
-					pass
-				elif mouse_pos[0] in range(ai_med_rect.left, ai_med_rect.right) and mouse_pos[1] in range(ai_med_rect.top, ai_med_rect.bottom):
-					if gameOver:
-						gameOver = False
-					board = createBoard()
-					drawBoard(board)
-					gameLoop(gameOver, board, 2)
-					pass
-				elif mouse_pos[0] in range(ai_hard_rect.left, ai_hard_rect.right) and mouse_pos[1] in range(ai_hard_rect.top, ai_hard_rect.bottom):
-					if gameOver:
-						gameOver = False
-					board = createBoard()
-					drawBoard(board)
-					gameLoop(gameOver, board, 3)
-					pass
-				elif mouse_pos[0] in range(player_v_player_o_rect.left, player_v_player_o_rect.right) and mouse_pos[1] in range(player_v_player_o_rect.top, player_v_player_o_rect.bottom):
-					menu = False
-
-		if mouse_pos[0] in range(player_v_player_l_rect.left, player_v_player_l_rect.right) and mouse_pos[1] in range(player_v_player_l_rect.top, player_v_player_l_rect.bottom):
-			text_start = renderText("Player vs Player (Local)", WHITE, 35)
-		else:
-			text_start = renderText("Player vs Player (Local)", BLACK, 35)
-		if mouse_pos[0] in range(ai_easy_rect.left, ai_easy_rect.right) and mouse_pos[1] in range(ai_easy_rect.top, ai_easy_rect.bottom):
-			AI_easy = renderText("Easy", (0x00,0xA0,0x00), 35)
-		else:
-			AI_easy = renderText("Easy", BLACK, 35)
-		if mouse_pos[0] in range(ai_med_rect.left, ai_med_rect.right) and mouse_pos[1] in range(ai_med_rect.top, ai_med_rect.bottom):
-			AI_med = renderText("Medium", (0xC7,0xC7,0x00), 35)
-		else:
-			AI_med = renderText("Medium", BLACK, 35)
-		if mouse_pos[0] in range(ai_hard_rect.left, ai_hard_rect.right) and mouse_pos[1] in range(ai_hard_rect.top, ai_hard_rect.bottom):
-			AI_hard = renderText("Hard", RED, 35)
-		else:
-			AI_hard = renderText("Hard", BLACK, 35)
-		if mouse_pos[0] in range(player_v_player_o_rect.left, player_v_player_o_rect.right) and mouse_pos[1] in range(player_v_player_o_rect.top, player_v_player_o_rect.bottom):
-			text_quit = renderText("Quit", WHITE, 35)
-		else:
-			text_quit = renderText("Quit", BLACK, 35)
-
-		# Connect 4 Logo
-		if not numpy.any(board):
-			board = [
-				[1, 2, 2, 1, 2, 0, 0],
-				[0, 1, 2, 1, 1, 0, 0],
-				[0, 0, 1, 2, 0, 0, 0],
-				[0, 0, 0, 1, 0, 0, 0],
-				[0, 0, 0, 0, 0, 0, 0],
-				[0, 0, 0, 0, 0, 0, 0],
-				[0, 0, 0, 0, 0, 0, 0],
-			]
-
-		logo = pygame.Surface((screenWidth*729/1024, screenHeight*627/768))
-		pygame.Surface.fill(logo, WHITE)
-		pygame.draw.rect(logo, BLUE, (0, 0, logo.get_width(), logo.get_height()), 0, int(RADIUS/2))
-
-		for c in range(NUM_COLUMNS):
-			for r in range(NUM_ROWS):
-				drawCircle(logo, WHITE, (int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)), RADIUS)
-
-		for c in range(NUM_COLUMNS):
-			for r in range(NUM_ROWS):
-				if board[r][c] == 1:
-					drawCircle(logo, RED, (int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), (logo.get_height() - int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)) - 1), RADIUS)
-				elif board[r][c] == 2:
-					drawCircle(logo, YELLOW, (int((c+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2), (logo.get_height() - int((r+1)*(SQUARESIZE + PADDING) - SQUARESIZE/2)) - 1), RADIUS)
-		pygame.draw.rect(logo, GRAY, (SQUARESIZE, SQUARESIZE, logo.get_width() - (2*SQUARESIZE), (2*SQUARESIZE)), 0, int(RADIUS/2))
-
-		# Main Menu Text
-		screen.blit(text_start, ((player_v_player_l_rect.centerx - (text_start.get_rect().width/2)), (player_v_player_l_rect.centery - (text_start.get_rect().height/2))))
-		screen.blit(p_v_AI, ((player_v_ai_background_rect.centerx - (p_v_AI.get_rect().width/2)), (player_v_ai_background_rect.y + (p_v_AI.get_rect().height/4))))
-		screen.blit(AI_easy, ((ai_easy_rect.centerx - (AI_easy.get_rect().width/2)), (ai_easy_rect.centery - (AI_easy.get_rect().height/2))))
-		screen.blit(AI_med, ((ai_med_rect.centerx - (AI_med.get_rect().width/2)), (ai_med_rect.centery - (AI_med.get_rect().height/2))))
-		screen.blit(AI_hard, ((ai_hard_rect.centerx - (AI_hard.get_rect().width/2)), (ai_hard_rect.centery - (AI_hard.get_rect().height/2))))
-		screen.blit(text_quit, ((player_v_player_o_rect.centerx - (text_quit.get_rect().width/2)), (player_v_player_o_rect.centery - (text_quit.get_rect().height/2))))
-		logo.blit(title, ((logo.get_width() - title.get_rect().width)/2, (SQUARESIZE*4 - title.get_rect().height)/2))
-		screen.blit(pygame.transform.smoothscale(logo, (468, 403)), (screenWidth/2 - int(468/2), PADDING))
-		pygame.display.set_caption("Connect Four")
-		clock.tick(FPS)
-		pygame.display.update()
+			elif event.type == pygame.WINDOWEXPOSED:
+				menuSurface = None
+			elif event.type == pygame.KEYDOWN and event.key == STATS_KEY:
+				toggleStats()
+			elif event.type == pygame.MOUSEMOTION and menuSurface is not None: # Recomposed with the hover state at the top of the loop otherwise
+				over = None
+				for i, button in enumerate(buttons):
+					if button[0].collidepoint(event.pos):
+						over = i
+				if over != hovered:
+					changed = [drawMenuButton(menuSurface, buttons[i], i == over) for i in (hovered, over) if i is not None]
+					hovered = over
+					dirty_rects.extend(changed)
+			elif event.type == pygame.MOUSEBUTTONDOWN and menuSurface is not None:
+				for rect, _, _, _, _, mode in buttons:
+					if not rect.collidepoint(event.pos):
+						continue
+					if mode is None:
+						menu = False
+					else:
+						if gameOver:
+							gameOver = False
+						board = createBoard()
+						if mode == ONLINE:
+							playOnline(gameOver, board)
+						else:
+							drawBoard(board)
+							gameLoop(gameOver, board, mode)
+						pygame.event.clear(pygame.MOUSEBUTTONDOWN) # Don't let the click that ended the game start another
+						menuSurface = None
+					break
+
+		if menuSurface is not None and (dirty_rects or stats_overlay):
+			presentFrame('menu_frame')
+			if stats:
+				stats.record('menu_frame', events_start, time.perf_counter() - events_start)
+
+def getAIPlayer(difficulty):
+	"""Return the AI player for the difficulty, reusing the current one when it matches"""
+	global ai_player, book, tablebase
+	from ai import AIPlayer, HARD, EXPERT # Not needed until someone plays the AI, so kept off the startup path
+	if ai_player is None or ai_player.difficulty != difficulty:
+		if ai_player:
+			ai_player.close()
+		if difficulty == EXPERT and book is None:
+			from book import openBook
+			book = openBook() # None when no book file has been generated
+		if difficulty >= HARD and tablebase is None:
+			from tablebase import openTablebase
+			tablebase = openTablebase()
+		ai_player = AIPlayer(difficulty, budgetMs=args.ai_time, book=book, tablebase=tablebase)
+	return ai_player
+
+def printAIMove(player):
+	"""Print how the AI came up with its last move"""
+	result = player.lastResult
+	if result and player.mcts:
+		print("\033[1;37mAI ran " + str(result.playouts) + " playouts on " + str(result.jobs) + " processes (" + str(int(result.playouts/max(result.seconds, 1e-6))) + " playouts/sec), win rates " + "  ".join(str(c + 1) + ":" + str(round(100*entry[1])) + "%" for c, entry in enumerate(result.columns) if entry))
+	elif result:
+		print("\033[1;37mAI searched to depth " + str(result.depth) + " (" + str(int(result.nodes/max(result.seconds, 1e-6))) + " nodes/sec, " + str(int(100*player.searcher.table.stats()['hit_rate'])) + "% table hits)")
+	elif player.lastSource:
+		print("\033[1;37mAI played from the " + player.lastSource)
+
+def drawThinking(message="AI is thinking"):
+	"""Shows an animated indicator in the top strip while the AI (or the online opponent) is choosing a move"""
+	dirty_rects.append(pygame.draw.rect(screen, WHITE, (0,0, screenWidth - 250 - PADDING, SQUARESIZE)))
+	text = renderText(message + "." * (1 + pygame.time.get_ticks()//400 % 3), BLACK, 48 if sys.platform == "linux" else 47)
+	screen.blit(text, (PADDING/2, (SQUARESIZE - text.get_height())/2))
+
+def toggleHints():
+	"""Show or hide the move hints, starting the hint worker the first time they are shown"""
+	global hint_worker, hints_shown
+	if hint_worker is None:
+		from hints import HintWorker
+		hint_worker = HintWorker()
+	hints_shown = not hints_shown
+	if not hints_shown:
+		hint_worker.cancel()
+
+def drawHoverStrip(board, posx, piece, hint=None):
+	"""Redraw the top strip: the piece following the mouse, if posx is given, and a hint above every playable column with the best ones underlined"""
+	renderer = getRenderer(board)
+	dirty_rects.append(pygame.draw.rect(screen, WHITE, (0,0, screenWidth - 250 - PADDING, SQUARESIZE)))
+	if posx is not None:
+		drawCircle(screen, RED if piece == 1 else YELLOW, (posx, int(SQUARESIZE/2)), renderer.radius)
+	if hint:
+		from hints import hintLabel
+		best = max(score for score in hint.scores if score is not None)
+		fontSize = max(12, min(28, renderer.pitch*2//5)) # "Loss" has to fit a column on the widest boards
+		for col, score in enumerate(hint.scores):
+			if score is not None:
+				x = renderer.cellCenter(0, col)[0]
+				text = renderText(hintLabel(score, hint.exact), BLACK, fontSize) # Black reads on the hover piece too
+				screen.blit(text, (x - text.get_width()//2, (SQUARESIZE - text.get_height())//2))
+				if score == best:
+					pygame.draw.rect(screen, DARK_GREEN, (x - renderer.pitch//3, SQUARESIZE - 5, 2*(renderer.pitch//3), 4)) # Below the hover piece
 
 def dropPieceAI(difficulty, board, piece):
 	"""Select the best move determined on the AI difficulty"""
-	if (difficulty == 1): # Easy
-		col = random.randint(0,6)
-		while (not isValidLocation(board,col)):
-			col = random.randint(0,6)
-		dropPiece(board, getNextOpenRow(board, col), col, piece)
-
-	elif (difficulty == 2): # Medium (Block winning moves)
-
-		# Pick a random location sometimes even when a win should be given
-		if (random.randint(0,2) == 1):
-			c = random.randint(0,6)
-			while (not isValidLocation(board,c)):
-				c = random.randint(0,6)
-			dropPiece(board, getNextOpenRow(board, c), c, piece)
-			return
-
-		# Check horizontal locations
-		for c in range(NUM_COLUMNS-3):
-			for r in range(NUM_ROWS):
-				if board[r][c] == 0 and getNextOpenRow(board, c) == r and board[r][c+1] == 1 and board[r][c+2] == 1 and board[r][c+3] == 1:
-					dropPiece(board, r, c, piece)
-					return
-				elif board[r][c] == 1 and board[r][c+1] == 0 and getNextOpenRow(board, c+1) == r and board[r][c+2] == 1 and board[r][c+3] == 1:
-					dropPiece(board, r, c+1, piece)
-					return
-				elif board[r][c] == 1 and board[r][c+1] == 1 and board[r][c+2] == 0 and getNextOpenRow(board, c+2) == r and board[r][c+3] == 1:
-					dropPiece(board, r, c+2, piece)
-					return
-				elif board[r][c] == 1 and board[r][c+1] == 1 and board[r][c+2] == 1 and board[r][c+3] == 0 and getNextOpenRow(board, c+3) == r:
-					dropPiece(board, r, c+3, piece)
-					return
-
-		# Check vertical locations
-		for c in range(NUM_COLUMNS):
-			for r in range(NUM_ROWS-3):
-				if board[r][c] == 1 and board[r+1][c] == 1 and board[r+2][c] == 1 and board[r+3][c] == 0:
-					dropPiece(board, r+3, c, piece)
-					return
-
-		# Check diaganols
-		for c in range(NUM_COLUMNS-3):
-			for r in range(NUM_ROWS-3):
-				if board[r][c] == 0 and getNextOpenRow(board, c) == r and board[r+1][c+1] == 1 and board[r+2][c+2] == 1 and board[r+3][c+3] == 1:
-					dropPiece(board, r, c, piece)
-					return
-				elif board[r][c] == 1 and board[r+1][c+1] == 0 and getNextOpenRow(board, c+1) == r+1 and board[r+2][c+2] == 1 and board[r+3][c+3] == 1:
-					dropPiece(board, r+1, c+1, piece)
-					return
-				elif board[r][c] == 1 and board[r+1][c+1] == 1 and board[r+2][c+2] == 0 and getNextOpenRow(board, c+2) == r+2 and board[r+3][c+3] == 1:
-					dropPiece(board, r+2, c+2, piece)
-					return
-				elif board[r][c] == 1 and board[r+1][c+1] == 1 and board[r+2][c+2] == 1 and board[r+3][c+3] == 0 and getNextOpenRow(board, c+3) == r+3:
-					dropPiece(board, r+3, c+3, piece)
-					return
-
-		# If not blocking opponent, pick a random location
-		c = random.randint(0,6)
-		while (not isValidLocation(board,c)):
-			c = random.randint(0,6)
-		dropPiece(board, getNextOpenRow(board, c), c, piece)
-
-	elif (difficulty == 3): # Hard (Finish moves and block others)
-
-		# Finish then block player
-		for p in range(2,0,-1):
-			# Check horizontal locations
-			for c in range(NUM_COLUMNS-3):
-				for r in range(NUM_ROWS):
-					if not board[r][c] and getNextOpenRow(board, c) == r and board[r][c+1] == p and board[r][c+2] == p and board[r][c+3] == p:
-						dropPiece(board, r, c, piece)
-						return
-					elif board[r][c] == p and not board[r][c+1] and getNextOpenRow(board, c+1) == r and board[r][c+2] == p and board[r][c+3] == p:
-						dropPiece(board, r, c+1, piece)
-						return
-					elif board[r][c] == p and board[r][c+1] == p and not board[r][c+2] and getNextOpenRow(board, c+2) == r and board[r][c+3] == p:
-						dropPiece(board, r, c+2, piece)
-						return
-					elif board[r][c] == p and board[r][c+1] == p and board[r][c+2] == p and not board[r][c+3] and getNextOpenRow(board, c+3) == r:
-						dropPiece(board, r, c+3, piece)
-						return
-
-			# Check vertical locations
-			for c in range(NUM_COLUMNS):
-				for r in range(NUM_ROWS-3):
-					if board[r][c] == p and board[r+1][c] == p and board[r+2][c] == p and not board[r+3][c]:
-						dropPiece(board, r+3, c, piece)
-						return
-
-			# Check diaganols
-			for c in range(NUM_COLUMNS-3):
-				for r in range(NUM_ROWS-3):
-					if not board[r][c] and getNextOpenRow(board, c) == r and board[r+1][c+1] == p and board[r+2][c+2] == p and board[r+3][c+3] == p:
-						dropPiece(board, r, c, piece)
-						return
-					elif board[r][c] == p and not board[r+1][c+1] and getNextOpenRow(board, c+1) == r+1 and board[r+2][c+2] == p and board[r+3][c+3] == p:
-						dropPiece(board, r+1, c+1, piece)
-						return
-					elif board[r][c] == p and board[r+1][c+1] == p and not board[r+2][c+2] and getNextOpenRow(board, c+2) == r+2 and board[r+3][c+3] == p:
-						dropPiece(board, r+2, c+2, piece)
-						return
-					elif board[r][c] == p and board[r+1][c+1] == p and board[r+2][c+2] == p and not board[r+3][c+3] and getNextOpenRow(board, c+3) == r+3:
-						dropPiece(board, r+3, c+3, piece)
-						return
-
-		# Pick a random location
-		c = random.randint(0,6)
-		while (not isValidLocation(board,c)):
-			c = random.randint(0,6)
-		dropPiece(board, getNextOpenRow(board, c), c, piece)
-
-def gameLoop(gameOver, board, mode):
-	global history_view
+	player = getAIPlayer(difficulty)
+	col = player.chooseMove(board, piece)
+	printAIMove(player)
+	dropPiece(board, getNextOpenRow(board, col), col, piece)
+
+def recordGame(board, mode, result):
+	"""Append the game that just ended to the archive, unless recording is off or no move was made"""
+	global game_records
+	if not args.record or not game_history:
+		return
+	try:
+		if game_records is None:
+			game_records = RecordWriter(args.record)
+		game_records.write([col for _, _, col in game_history], mode, result, board.rows, board.columns, board.k)
+	except OSError as error:
+		print("Could not save the game to " + args.record + ": " + str(error))
+		args.record = None # Don't try again after every game
+
+def playOnline(gameOver, board):
+	"""Connect to the match server and play one game against whoever it pairs us with"""
+	import net
+	host, port = net.DEFAULT_HOST, net.DEFAULT_PORT
+	if args.server:
+		host, _, port = args.server.rpartition(':')
+	try:
+		client = net.OnlineClient(host, int(port))
+	except (OSError, ValueError):
+		drawMessage("Server unavailable", BLUE, WHITE, BLACK, 1500)
+		return
+	try:
+		drawBoard(board)
+		gameLoop(gameOver, board, 0, client)
+	finally:
+		client.close()
+
+def gameLoop(gameOver, board, mode, online=None):
+	"""Play one game: local when mode is 0, against the AI level in mode, or over an OnlineClient"""
+	global history_scroll, ai_worker
 	turn = 0
 	currentWinner = 0
+	winning_cells = []
+	quitToMenu = False
+	online_piece = 0 # Our piece once the server has found an opponent
+	move_sent = False # Waiting for the server to accept our move
+	if online:
+		import net
+
+	def humanToMove():
+		if online:
+			return online_piece == turn+1 and not move_sent
+		return not (mode and turn)
+
+	frame_seconds = 0.0 # Length of the last frame, what the animations move on by
+	hover_x = None # Where the piece following the mouse is drawn
+	strip_dirty = False # The top strip needs the hover piece and hints redrawn
+	hint_drawn = None # Hint shown in the top strip
+	getRenderer(board).stopAnimations()
+	if mode:
+		from worker import AIWorker
+		getAIPlayer(mode).newGame()
+		ai_worker = AIWorker(ai_player) # Moves are computed off the frame loop so the UI stays responsive
 
 	while not gameOver:
+		events_start = time.perf_counter()
 		for event in pygame.event.get():
 			if event.type == pygame.QUIT:
 				deInit()
 
-			if event.type == pygame.MOUSEMOTION:
-				posx = event.pos[0]
+			if event.type == pygame.KEYDOWN and event.key == STATS_KEY:
+				toggleStats()
 
-				if ((posx > screenWidth - 250 - PADDING - (SQUARESIZE*3/4))):
-					posx = screenWidth - 250 - PADDING - (SQUARESIZE*3/4)
-				elif (posx < SQUARESIZE*3/4):
-					posx = SQUARESIZE*3/4
+			if event.type == pygame.KEYDOWN and event.key == HINTS_KEY and not online: # No engine help against a human opponent
+				toggleHints()
+				strip_dirty = True
 
-				pygame.draw.rect(screen, WHITE, (0,0, screenWidth - 250 - PADDING, SQUARESIZE))
-				if turn == 0:
-					drawCircle(screen, RED, (posx, int(SQUARESIZE/2)), RADIUS)
-				else: 
-					drawCircle(screen, YELLOW, (posx, int(SQUARESIZE/2)), RADIUS)
+			if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE: # Back to the menu
+				quitToMenu = True
+				gameOver = True
+				break
+
+			if event.type == pygame.MOUSEMOTION:
+				hover_x = getRenderer(board).hoverX(event.pos[0])
+				strip_dirty = True
+
+			if event.type == pygame.MOUSEWHEEL and pygame.mouse.get_pos()[0] >= (screenWidth - 250 - PADDING):
+				scrollHistory(-event.y*HISTORY_SCROLL_ROWS)
+				drawHistory(board)
 
 			if event.type == pygame.MOUSEBUTTONDOWN:
 				posx = event.pos[0]
-				if (posx >= (screenWidth - 250 - PADDING)) and (len(game_history) >= 23): # Clicked on right side of screen
-					history_view = 0 if history_view else 1
-					drawBoard(board)
-				elif (posx > PADDING and posx < (screenWidth - 250 - PADDING)):
-					col = int(math.floor((posx-PADDING)/(SQUARESIZE+PADDING)))
-					col = 6 if col > 6 else col # Fix a bug improperly
+				if (posx >= (screenWidth - 250 - PADDING)) and (len(game_history) > HISTORY_ROWS): # Clicked on right side of screen
+					pageHistory()
+					drawHistory(board)
+				elif (posx > PADDING and posx < (screenWidth - 250 - PADDING)) and humanToMove():
+					col = getRenderer(board).columnAt(posx)
+					if online and isValidLocation(board, col):
+						online.send(net.MOVE, col) # Dropped once the server sends it back
+						move_sent = True
+						continue
 					if isValidLocation(board, col):
-						pygame.draw.rect(screen, WHITE, (0,0, screenWidth, SQUARESIZE))
+						dirty_rects.append(pygame.draw.rect(screen, WHITE, (0,0, screenWidth - 250 - PADDING, SQUARESIZE)))
 						row = getNextOpenRow(board, col)
 						dropPiece(board, row, col, turn+1)
-						if winningMove(board, turn+1):
+						winning_cells = board.winningCells(row, col) # Only the lines through the new piece can have changed
+						if winning_cells:
 							currentWinner = turn+1
 							gameOver = True
-						elif tieGame(board):
+						elif board.isFull():
 							currentWinner = 3
 							gameOver = True
 						print("\033[1;37m--- TURN " + str(len(game_history)) + " ---")
 						printBoard(board)
-						drawBoard(board)
+						animateDrop(board, row, col, turn+1, winning_cells)
 					else:
 						drawMessage("Invalid Move!", GREEN, BLACK, GRAY, 800)
 						drawBoard(board)
@@ -543,23 +959,94 @@ def gameLoop(gameOver, board, mode):
 					turn += 1
 					turn = turn % 2
 
-		if mode and turn and not currentWinner: #aka if AI
-			dropPieceAI(mode, board, turn+1)
-			print("\033[1;37m--- TURN " + str(len(game_history)) + " ---")
-			printBoard(board)
-			drawBoard(board)
-			if winningMove(board, turn+1):
-				currentWinner = turn+1
+		if stats:
+			stats.record('events', events_start, time.perf_counter() - events_start)
+
+		hint = None
+		if hint_worker and hints_shown and not online and humanToMove() and not gameOver:
+			hint_worker.request(board, turn+1) # Gives up on any earlier position
+			hint = hint_worker.get(board)
+		elif hint_worker:
+			hint_worker.cancel() # Not the human's move or an online game, leave the CPU to the AI
+		if humanToMove() and not gameOver and (strip_dirty or hint is not hint_drawn): # Otherwise the top strip shows the AI or opponent indicator; redrawn at most once a frame
+			drawHoverStrip(board, hover_x, turn+1, hint)
+			hint_drawn = hint
+		strip_dirty = False
+
+		while online and not gameOver:
+			kind, values = online.poll() or (False, ())
+			if kind is False:
+				if online_piece == 0:
+					drawThinking("Waiting for an opponent")
+				elif not humanToMove() and not move_sent:
+					drawThinking("Opponent's turn")
+				break
+			elif kind == net.START:
+				online_piece, rows, columns, k = values
+				if (rows, columns, k) != (board.rows, board.columns, board.k): # The server decides the board
+					board = Position(rows, columns, k)
+					drawBoard(board)
+				dirty_rects.append(pygame.draw.rect(screen, WHITE, (0,0, screenWidth - 250 - PADDING, SQUARESIZE)))
+				print("\033[1;37mMatched with an opponent, you are player " + str(online_piece))
+			elif kind == net.MOVED:
+				piece, row, col = values
+				dropPiece(board, row, col, piece)
+				winning_cells = board.winningCells(row, col)
+				print("\033[1;37m--- TURN " + str(len(game_history)) + " ---")
+				printBoard(board)
+				dirty_rects.append(pygame.draw.rect(screen, WHITE, (0,0, screenWidth - 250 - PADDING, SQUARESIZE)))
+				animateDrop(board, row, col, piece, winning_cells)
+				turn = piece % 2
+				move_sent = False
+			elif kind == net.END:
+				currentWinner, reason = values
+				if reason == net.OPPONENT_LEFT:
+					drawMessage("Opponent left", BLUE, WHITE, BLACK, 1500)
 				gameOver = True
-			elif tieGame(board):
-				currentWinner = 3
+			elif kind == net.ERROR:
+				move_sent = False
+				drawMessage("Invalid Move!", GREEN, BLACK, GRAY, 800)
+				drawBoard(board)
+			elif kind is None: # Disconnected
+				drawMessage("Connection lost", BLUE, WHITE, BLACK, 1500)
+				quitToMenu = True
 				gameOver = True
-			turn += 1
-			turn = turn % 2
-
-		clock.tick(FPS)
-		pygame.display.update()
 
+		if mode and turn and not currentWinner and not quitToMenu: #aka if AI
+			if not ai_worker.thinking:
+				ai_worker.start(board, turn+1)
+			col = ai_worker.poll() if not getRenderer(board).drops else None # Let the last piece land before the AI's follows it
+			if col is None:
+				drawThinking()
+			else:
+				printAIMove(ai_player)
+				if stats:
+					recordAIMove(ai_player, ai_worker)
+				row = getNextOpenRow(board, col)
+				dropPiece(board, row, col, turn+1)
+				winning_cells = board.winningCells(row, col)
+				print("\033[1;37m--- TURN " + str(len(game_history)) + " ---")
+				printBoard(board)
+				dirty_rects.append(pygame.draw.rect(screen, WHITE, (0,0, screenWidth - 250 - PADDING, SQUARESIZE)))
+				animateDrop(board, row, col, turn+1, winning_cells)
+				if winning_cells:
+					currentWinner = turn+1
+					gameOver = True
+				elif board.isFull():
+					currentWinner = 3
+					gameOver = True
+				else:
+					ai_worker.ponder(board, turn+1) # Think about the reply while the human decides
+				turn += 1
+				turn = turn % 2
+
+		getRenderer(board).animate(frame_seconds)
+		frame_seconds = nextFrame()
+
+	if quitToMenu:
+		getRenderer(board).stopAnimations()
+	else:
+		finishAnimations(board)
 	if currentWinner == 1:
 		drawMessage("PLAYER 1 WINS!!", RED, WHITE, BLACK, 2000)
 	elif currentWinner == 2:
@@ -567,9 +1054,17 @@ def gameLoop(gameOver, board, mode):
 	elif currentWinner == 3:
 		drawMessage("TIE GAME!!", GREEN, BLACK, GRAY, 2000)
 
+	if ai_worker:
+		ai_worker.cancel()
+	recordGame(board, ONLINE if online else mode, currentWinner)
+	if quitToMenu:
+		history_scroll = None
+		game_history.clear()
+		return
+
 	results_screen = 1
-	drawBoard(board)
-	pygame.draw.rect(screen, WHITE, (0,0, screenWidth - 250 - PADDING, SQUARESIZE*1))
+	drawBoard(board, winning_cells)
+	dirty_rects.append(pygame.draw.rect(screen, WHITE, (0,0, screenWidth - 250 - PADDING, SQUARESIZE*1)))
 	screen.blit(renderText("Press any key to return to the menu", BLACK, 48 if sys.platform == "linux" else 47), (PADDING/2, SQUARESIZE/2))
 	while results_screen:
 		for event in pygame.event.get():
@@ -577,21 +1072,71 @@ def gameLoop(gameOver, board, mode):
 				deInit()
 			if event.type == pygame.MOUSEBUTTONDOWN:
 				posx = event.pos[0]
-				if (posx >= (screenWidth - 250 - PADDING)) and (len(game_history) >= 23): # Clicked on right side of screen
-					history_view = 0 if history_view else 1
-					drawBoard(board)
-					pygame.draw.rect(screen, WHITE, (0,0, screenWidth - 250 - PADDING, SQUARESIZE*1))
-					screen.blit(renderText("Press any key to return to the menu", BLACK, 48 if sys.platform == "linux" else 47), (PADDING/2, SQUARESIZE/2))
-			if event.type == pygame.KEYDOWN:
+				if (posx >= (screenWidth - 250 - PADDING)) and (len(game_history) > HISTORY_ROWS): # Clicked on right side of screen
+					pageHistory()
+					drawHistory(board)
+			if event.type == pygame.MOUSEWHEEL and pygame.mouse.get_pos()[0] >= (screenWidth - 250 - PADDING):
+				scrollHistory(-event.y*HISTORY_SCROLL_ROWS)
+				drawHistory(board)
+			if event.type == pygame.KEYDOWN and event.key == STATS_KEY:
+				toggleStats()
+			elif event.type == pygame.KEYDOWN:
 				results_screen = 0
 
-		clock.tick(FPS)
-		pygame.display.update()
+		nextFrame()
 
-	history_view = 0
+	history_scroll = None
 	game_history.clear()
 
-drawStartUI(createBoard(), gameOver)
-
-# Deinit
-deInit()
\ No newline at end of file
+def parseArgs(argv=None):
+	"""Parse the command line options"""
+	parser = argparse.ArgumentParser(description="Connect 4")
+	parser.add_argument('--ai-time', type=int, default=DEFAULT_BUDGET_MS, metavar='MS', help="thinking time per move of the Expert and MCTS AIs in milliseconds")
+	parser.add_argument('--profile-startup', action='store_true', help="print how long each startup phase took")
+	parser.add_argument('--server', metavar='HOST:PORT', help="match server for online games (default: this computer)")
+	parser.add_argument('--record', default=DEFAULT_RECORD_PATH, metavar='FILE', help="archive every game played to this file")
+	parser.add_argument('--no-record', dest='record', action='store_const', const=None, help="don't archive games")
+	parser.add_argument('--stats', action='store_true', help="show the performance overlay from the start (toggle it with F3)")
+	parser.add_argument('--stats-dump', metavar='FILE', help="record performance samples and write them at exit, as CSV if FILE ends in .csv, otherwise as a Chrome trace")
+	addBoardArguments(parser)
+	args = parser.parse_args(argv)
+	checkBoardArguments(parser, args)
+	return args
+
+def initDisplay():
+	"""Open the game window, initializing only the pygame modules the game uses (no audio or joystick)"""
+	global screen, clock
+	pygame.display.init()
+	pygame.font.init()
+	markStartup("Pygame init")
+	screen = pygame.display.set_mode(size)
+	clock = pygame.time.Clock()
+	clock.tick() # Starts pygame's timer, get_ticks() stays at 0 until then and the menu never ticks
+	markStartup("Window")
+
+def main():
+	global args
+
+	# Windows tweaks for ANSI escape codes and DPI scaling
+	if os.name == 'nt':
+		ctypes = __import__('ctypes')
+		ctypes.windll.shcore.SetProcessDpiAwareness(1)
+		ctypes.windll.kernel32.SetConsoleMode(ctypes.windll.kernel32.GetStdHandle(-11), 7)
+		del ctypes
+
+	args = parseArgs()
+	sys.setswitchinterval(THREAD_SWITCH_INTERVAL)
+	markStartup("Imports")
+	initDisplay()
+	if args.stats_dump:
+		enableStats()
+	if args.stats:
+		toggleStats()
+
+	drawStartUI(createBoard(), gameOver)
+
+	# Deinit
+	deInit()
+
+if __name__ == '__main__':
+	main()
\ No newline at end of file
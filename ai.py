@@ -0,0 +1,133 @@
+"""Move selection for every AI difficulty, kept free of pygame so headless tools can use it"""
+import random
+
+from engine import countLines
+from search import Searcher, DEFAULT_BUDGET_MS
+from mcts import MonteCarlo
+from solver import Solver
+
+EASY = 1
+MEDIUM = 2
+HARD = 3
+EXPERT = 4
+MCTS = 5
+DIFFICULTY_NAMES = {EASY: "Easy", MEDIUM: "Medium", HARD: "Hard", EXPERT: "Expert", MCTS: "MCTS"}
+ENDGAME_EMPTY = 16 # Empty cells from which on Hard and Expert solve the position exactly, a tenth of a second at most
+
+class AIPlayer:
+	"""Chooses moves for one difficulty, keeping the Expert's search state between moves
+
+	Hard and Expert play perfectly once ENDGAME_EMPTY cells or fewer are left, solving the
+	position unless it is already in the endgame tablebase, if given one.
+	MCTS thinks for budgetMs, stopping early after playouts in total if that is given, on
+	mctsJobs processes (every core by default); call close() to stop them.
+	"""
+
+	def __init__(self, difficulty, seed=None, budgetMs=DEFAULT_BUDGET_MS, book=None, tablebase=None, mctsJobs=None, playouts=None):
+		self.difficulty = difficulty
+		self.rng = random.Random(seed)
+		self.budgetMs = budgetMs
+		self.book = book
+		self.tablebase = tablebase
+		self.searcher = Searcher() if difficulty == EXPERT else None
+		self.mcts = MonteCarlo(mctsJobs) if difficulty == MCTS else None
+		self.solver = None # Created for the first endgame, kept for its table
+		self.playouts = playouts
+		self.lastResult = None # SearchResult (MCTSResult for MCTS) of the last searched move, None after book or heuristic moves
+		self.lastSource = None # "opening book", "endgame tablebase" or "endgame solver" when the last move was not searched
+
+	def newGame(self, seed=None):
+		"""Reset the random generator and forget the previous game's search results"""
+		self.rng.seed(seed)
+		if self.searcher:
+			self.searcher.newGame()
+
+	def close(self):
+		"""Stop the MCTS worker processes, if any"""
+		if self.mcts:
+			self.mcts.close()
+
+	def chooseMove(self, board, piece):
+		"""Return the column the AI wants to play for the piece"""
+		self.lastResult = None
+		self.lastSource = None
+		if self.difficulty == EASY:
+			return easyMove(board, self.rng)
+		elif self.difficulty == MEDIUM:
+			return mediumMove(board, piece, self.rng)
+		elif self.difficulty == MCTS:
+			self.lastResult = self.mcts.search(board, piece, self.budgetMs, self.playouts, self.rng.getrandbits(64))
+			return self.lastResult.move
+
+		entry = self.tablebase.lookup(board) if self.tablebase else None
+		if entry:
+			self.lastSource = "endgame tablebase"
+			return entry[0]
+		if board.rows*board.columns - board.moves <= ENDGAME_EMPTY:
+			if self.solver is None or (self.solver.rows, self.solver.columns, self.solver.k) != (board.rows, board.columns, board.k):
+				self.solver = Solver(board.rows, board.columns, board.k)
+			self.lastSource = "endgame solver"
+			return self.solver.bestMove(board, piece)[0]
+		if self.difficulty == HARD:
+			return hardMove(board, piece, self.rng)
+
+		# Expert (Iterative deepening alpha-beta search)
+		entry = self.book.lookup(board) if self.book else None
+		if entry:
+			self.lastSource = "opening book"
+			return entry[0]
+		self.lastResult = self.searcher.search(board, piece, self.budgetMs)
+		return self.lastResult.move
+
+def easyMove(board, rng):
+	"""Pick a random valid column"""
+	return randomMove(board, rng)
+
+def mediumMove(board, piece, rng):
+	"""Block the opponent's k-1 in a rows, but play randomly a third of the time"""
+	# Pick a random location sometimes even when a win should be given
+	if (rng.randint(0,2) == 1):
+		return randomMove(board, rng)
+
+	c = completingMove(board, 3 - piece, countLines(board))
+	if c is not None:
+		return c
+
+	# If not blocking opponent, pick a random location
+	return randomMove(board, rng)
+
+def hardMove(board, piece, rng):
+	"""Finish our own k-1 in a rows, then block the opponent's, otherwise play randomly without setting up their win"""
+	lines = countLines(board)
+	# Finish then block player
+	for p in (piece, 3 - piece):
+		c = completingMove(board, p, lines)
+		if c is not None:
+			return c
+
+	# Pick a random location, but not right under a cell that would win for the opponent
+	occupied = board.boards[1] | board.boards[2]
+	unsafe = {index//board.stride for index in lines.threatCells(3 - piece, occupied) if index % board.stride == board.heights[index//board.stride] + 1}
+	return randomMove(board, rng, unsafe)
+
+def randomMove(board, rng, avoid=()):
+	"""Pick a random valid column by drawing columns until one has room, skipping avoided columns if any other has room"""
+	if avoid and all(c in avoid for c in range(board.columns) if board.canPlay(c)):
+		avoid = ()
+	c = rng.randint(0, board.columns - 1)
+	while (not board.canPlay(c) or c in avoid):
+		c = rng.randint(0, board.columns - 1)
+	return c
+
+def completingMove(board, p, lines):
+	"""Return the column that gives p k in a row, or None
+
+	Every line where p has k-1 pieces and the opponent none is read from the board's
+	LineCounts, and the first one in line order whose empty cell is playable wins.
+	"""
+	occupied = board.boards[1] | board.boards[2]
+	for index in lines.threatCells(p, occupied):
+		col, row = divmod(index, board.stride)
+		if board.heights[col] == row:
+			return col
+	return None
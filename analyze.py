@@ -0,0 +1,249 @@
+"""Game review: replays played games, scores every move with the strongest engine available and flags blunders
+
+Example: `python analyze.py games.c4r --output review.jsonl`. Game archives (see record.py)
+and JSON lines files with a "moves" list per game (such as tournament.py --output) can be
+mixed. Positions with few enough empty cells are solved exactly (solver.py); earlier ones
+get a fixed depth alpha-beta search of every move, sharing one search table from the
+start of the game on, so a game reviewed on its own always gets the same review. Each
+move is labelled best, inaccuracy or blunder, where a blunder throws away a win or draw,
+or (before the exact range) gives up a large part of the heuristic score.
+
+Games are read and written one chunk at a time and reviewed in parallel processes, each
+of which caches the scores of the positions it has seen, so shared openings are only
+scored once. Per game JSON goes to --output, and totals per player (AI level, human or
+tournament side) are printed at the end.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from collections import OrderedDict, Counter
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from engine import Position, addBoardArguments, checkBoardArguments
+from search import Searcher, moveOrder, WIN_SCORE, MATE_SCORE
+from solver import Solver
+from record import iterGames, ONLINE, RESULT_NAMES
+from ai import DIFFICULTY_NAMES
+
+DEFAULT_DEPTH = 8 # Plies searched after each candidate move outside the exact range, 10 matches the Expert's default budget at three times the cost
+DEFAULT_EXACT = 20 # Empty cells from which on positions are solved exactly
+DEFAULT_CHUNK = 16 # Games per job, consecutive games tend to share openings
+DEFAULT_CACHE = 1 << 18 # Positions cached per process
+ANALYSIS_TABLE_SIZE = 1 << 18 # Search table entries, cleared for every game and kept across its positions
+INACCURACY_LOSS = 10 # Heuristic score a move may give up and still count as best
+BLUNDER_LOSS = 100 # Heuristic score given up that makes a move a blunder
+LABELS = ('best', 'inaccuracy', 'blunder')
+
+_analyzers = {}
+
+def outcome(score, exact):
+	"""Return 1, 0 or -1 for a score that is a known win, unclear or a draw, or a known loss"""
+	if exact:
+		return (score > 0) - (score < 0)
+	return (score > MATE_SCORE) - (score < -MATE_SCORE)
+
+def classify(scores, col, exact):
+	"""Return (label, score given up) of playing col, given every column's score for the mover"""
+	best = max(score for score in scores if score is not None)
+	loss = best - scores[col]
+	if loss == 0:
+		return 'best', 0
+	if outcome(scores[col], exact) < outcome(best, exact) or (not exact and loss >= BLUNDER_LOSS):
+		return 'blunder', loss
+	if not exact and loss < INACCURACY_LOSS:
+		return 'best', loss
+	return 'inaccuracy', loss
+
+class Analyzer:
+	"""Scores every move of positions of one board size, keeping an LRU cache of the results"""
+
+	def __init__(self, rows, columns, k, depth=DEFAULT_DEPTH, exact=DEFAULT_EXACT, cacheLimit=DEFAULT_CACHE):
+		self.depth = depth
+		self.exact = exact
+		self.cacheLimit = cacheLimit
+		self.solver = Solver(rows, columns, k)
+		self.searcher = Searcher(ANALYSIS_TABLE_SIZE)
+		self.cache = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	def scores(self, position, piece):
+		"""Return (per column scores for the piece to move, None for full columns, True if they are exact)"""
+		entry = self.cache.get(position.hash)
+		if entry is not None:
+			self.hits += 1
+			self.cache.move_to_end(position.hash)
+			return entry
+		self.misses += 1
+		if position.rows*position.columns - position.moves <= self.exact:
+			entry = (tuple(self.solver.analyze(position, piece)), True)
+			if len(self.solver.lower) + len(self.solver.upper) > self.solver.tableLimit//4:
+				self.solver.clear() # Keep each process's memory modest, there is one per core
+		else:
+			entry = (tuple(self._search(position, piece)), False)
+		self.cache[position.hash] = entry
+		if len(self.cache) > self.cacheLimit:
+			self.cache.popitem(last=False)
+		return entry
+
+	def _search(self, position, piece):
+		scores = []
+		self.searcher.deadline = float('inf') # Depth bound only
+		for col in range(position.columns):
+			if not position.canPlay(col):
+				scores.append(None)
+			elif position.isWinningMove(col, piece):
+				scores.append(WIN_SCORE)
+			else:
+				position.play(col, piece)
+				scores.append(0 if position.isFull() else -self.searcher.search(position, 3 - piece, None, self.depth).score)
+				position.undo(col)
+		return scores
+
+	def review(self, game):
+		"""Return the review of one game as a JSON ready dict"""
+		position = Position(game['rows'], game['columns'], game['k'])
+		self.searcher.newGame() # Consecutive positions share most of their trees, other games share little
+		moves = []
+		counts = {1: Counter(), 2: Counter()}
+		for ply, col in enumerate(game['moves']):
+			piece = 1 + ply % 2
+			if not position.canPlay(col):
+				return dict(game, error="column " + str(col) + " is not playable at ply " + str(ply))
+			scores, exact = self.scores(position, piece)
+			label, loss = classify(scores, col, exact)
+			best = max((c for c in moveOrder(position.columns) if scores[c] is not None), key=lambda c: scores[c])
+			moves.append({'ply': ply, 'piece': piece, 'column': col, 'label': label, 'loss': loss, 'best': best, 'exact': exact, 'scores': scores})
+			counts[piece][label] += 1
+			row = position.play(col, piece)
+			if position.winningCells(row, col):
+				break
+		summary = {game['players'][piece - 1]: {label: counts[piece][label] for label in LABELS} for piece in (1, 2)}
+		if game['players'][0] == game['players'][1]:
+			summary = {game['players'][0]: {label: counts[1][label] + counts[2][label] for label in LABELS}}
+		return dict(game, review=moves, summary=summary)
+
+def analyzeChunk(job):
+	"""Process pool entry point: review a list of games, returning the reviews and cache hits and misses"""
+	settings, games = job
+	reviews = []
+	hits = misses = 0
+	for game in games:
+		key = (game['rows'], game['columns'], game['k']) + settings
+		if key not in _analyzers:
+			_analyzers[key] = Analyzer(*key)
+		analyzer = _analyzers[key]
+		before = analyzer.hits, analyzer.misses
+		reviews.append(analyzer.review(game))
+		hits += analyzer.hits - before[0]
+		misses += analyzer.misses - before[1]
+	return reviews, hits, misses
+
+def archivePlayers(mode):
+	"""Return who played red and yellow in an archived game of the mode"""
+	if mode == ONLINE:
+		return ("Online", "Online")
+	if mode == 0:
+		return ("Human", "Human")
+	return ("Human", DIFFICULTY_NAMES.get(mode, "AI level " + str(mode)))
+
+def readGames(paths, rows, columns, k):
+	"""Yield every game in the files as a dict, reading archives through mmap and JSON lines line by line"""
+	index = 0
+	for path in paths:
+		if path.endswith(('.jsonl', '.json')):
+			with open(path) as games_file:
+				for number, line in enumerate(games_file, 1):
+					if not line.strip():
+						continue
+					record = json.loads(line)
+					if isinstance(record, list):
+						record = {'moves': record}
+					yield {
+						'game': index, 'source': path + ":" + str(number),
+						'rows': record.get('rows', rows), 'columns': record.get('columns', columns), 'k': record.get('k', k),
+						'players': (record.get('red', "Player 1"), record.get('yellow', "Player 2")),
+						'result': record.get('winner'), 'moves': list(record['moves']),
+					}
+					index += 1
+		else:
+			for number, record in enumerate(iterGames(path)):
+				yield {
+					'game': index, 'source': path + ":" + str(number),
+					'rows': record.rows, 'columns': record.columns, 'k': record.k,
+					'players': archivePlayers(record.mode),
+					'result': RESULT_NAMES.get(record.result, record.result), 'moves': list(record.moves),
+				}
+				index += 1
+
+def chunked(games, size):
+	"""Yield lists of up to size games"""
+	chunk = []
+	for game in games:
+		chunk.append(game)
+		if len(chunk) == size:
+			yield chunk
+			chunk = []
+	if chunk:
+		yield chunk
+
+def main():
+	parser = argparse.ArgumentParser(description="Label every move of played Connect 4 games as best, inaccuracy or blunder")
+	parser.add_argument('paths', nargs='+', metavar='GAMES', help="game archives (.c4r) or JSON lines files with a moves list per game")
+	parser.add_argument('-o', '--output', default='review.jsonl', help="per game JSON lines output, '-' for none")
+	parser.add_argument('--summary', metavar='FILE', help="also write the per player totals to this JSON file")
+	parser.add_argument('--depth', type=int, default=DEFAULT_DEPTH, help="plies searched after each move before the exact range, higher is more accurate but slower")
+	parser.add_argument('--exact', type=int, default=DEFAULT_EXACT, metavar='EMPTY', help="solve positions with at most this many empty cells exactly")
+	parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="number of worker processes")
+	parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK, metavar='GAMES', help="games handed to a worker at a time")
+	addBoardArguments(parser) # Board of JSON lines games that don't say
+	args = parser.parse_args()
+	checkBoardArguments(parser, args)
+
+	start = time.perf_counter()
+	totals = {}
+	games = hits = misses = 0
+	settings = (args.depth, args.exact)
+	output = open(args.output, 'w') if args.output != '-' else None
+	source = chunked(readGames(args.paths, args.rows, args.columns, args.connect), args.chunk)
+	try:
+		with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+			pending = {pool.submit(analyzeChunk, (settings, chunk)) for _, chunk in zip(range(2*args.jobs), source)} # A bounded window, the rest is read as results come in
+			while pending:
+				done, pending = wait(pending, return_when=FIRST_COMPLETED)
+				for future in done:
+					reviews, chunkHits, chunkMisses = future.result()
+					hits += chunkHits
+					misses += chunkMisses
+					for review in reviews:
+						games += 1
+						if output:
+							output.write(json.dumps(review) + "\n")
+						for player, counts in review.get('summary', {}).items():
+							total = totals.setdefault(player, Counter())
+							total.update(counts)
+							total['games'] += 1
+					for chunk in source:
+						pending.add(pool.submit(analyzeChunk, (settings, chunk)))
+						break
+				print("\r" + str(games) + " games reviewed", end='', flush=True)
+	finally:
+		if output:
+			output.close()
+
+	elapsed = time.perf_counter() - start
+	print("\r" + str(games) + " games in " + str(round(elapsed, 1)) + "s (" + str(round(games/max(elapsed, 1e-6), 1)) + " games/sec), " + str(int(100*hits/max(hits + misses, 1))) + "% of positions from the cache")
+	summary = {}
+	for player in sorted(totals):
+		total = totals[player]
+		moves = sum(total[label] for label in LABELS)
+		summary[player] = dict({label: total[label] for label in LABELS}, games=total['games'], moves=moves)
+		print(player.ljust(10) + str(total['games']).rjust(6) + " games " + str(moves).rjust(7) + " moves   " + "   ".join(label + " " + str(round(100*total[label]/max(moves, 1), 1)) + "%" for label in LABELS))
+	if args.summary:
+		with open(args.summary, 'w') as summary_file:
+			json.dump(summary, summary_file, indent=1)
+
+if __name__ == '__main__':
+	sys.exit(main())
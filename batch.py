@@ -0,0 +1,104 @@
+"""Vectorized win and threat evaluation for many boards at once, for self-play and analysis
+
+Boards are (N, NUM_ROWS, NUM_COLUMNS) int8 arrays laid out like the game board: row 0 is
+the bottom row, 0 is an empty cell and 1/2 are the players' pieces. Every function works
+on the whole batch with window sums over shifted slices, without a Python loop per board.
+Boards may be any size; k, the pieces in a row needed to win, defaults to 4.
+"""
+from collections import namedtuple
+
+import numpy
+
+from engine import NUM_ROWS, NUM_COLUMNS
+
+BatchEvaluation = namedtuple('BatchEvaluation', 'winners legal wins blocks')
+
+def _windowSlices(rows, columns, k=4):
+	"""Yield, per direction, the k cell slices whose elementwise sum is every window's sum
+
+	Directions with no room for k in a row are skipped, as in engine.winningLines(), since
+	their slices would have negative stops that wrap around.
+	"""
+	if k <= columns:
+		yield [(slice(None), slice(None), slice(i, columns - k + 1 + i)) for i in range(k)] # Horizontal
+	if k <= rows:
+		yield [(slice(None), slice(i, rows - k + 1 + i), slice(None)) for i in range(k)] # Vertical
+	if k <= rows and k <= columns:
+		yield [(slice(None), slice(i, rows - k + 1 + i), slice(i, columns - k + 1 + i)) for i in range(k)] # Positive diagonal
+		yield [(slice(None), slice(k - 1 - i, rows - i), slice(i, columns - k + 1 + i)) for i in range(k)] # Negative diagonal
+
+def _windowSums(cells, cellSlices):
+	"""Sum a boolean cell mask over every window described by the slices"""
+	total = cells[cellSlices[0]].astype(numpy.int8)
+	for cellSlice in cellSlices[1:]:
+		total += cells[cellSlice]
+	return total
+
+def winners(boards, k=4):
+	"""Return an (N,) int8 array holding the piece with k in a row on each board, or 0"""
+	boards = numpy.asarray(boards, dtype=numpy.int8)
+	result = numpy.zeros(boards.shape[0], dtype=numpy.int8)
+	for piece in (2, 1): # Piece 1 wins ties on impossible boards where both have four
+		cells = boards == piece
+		for cellSlices in _windowSlices(boards.shape[1], boards.shape[2], k):
+			sums = _windowSums(cells, cellSlices)
+			found = (sums == len(cellSlices)).reshape(boards.shape[0], -1).any(axis=1)
+			result[found] = piece
+	return result
+
+def legalMoves(boards):
+	"""Return an (N, NUM_COLUMNS) bool mask of the columns that still have room"""
+	boards = numpy.asarray(boards, dtype=numpy.int8)
+	return boards[:, -1, :] == 0
+
+def landingCells(boards):
+	"""Return an (N, NUM_ROWS, NUM_COLUMNS) bool mask of the cell each column's next piece lands on"""
+	boards = numpy.asarray(boards, dtype=numpy.int8)
+	heights = (boards != 0).sum(axis=1)
+	rows = numpy.arange(boards.shape[1]).reshape(1, -1, 1)
+	return rows == heights[:, numpy.newaxis, :]
+
+def completingCells(boards, piece, k=4):
+	"""Return an (N, NUM_ROWS, NUM_COLUMNS) bool mask of the empty cells that would give the piece k in a row"""
+	boards = numpy.asarray(boards, dtype=numpy.int8)
+	own = boards == piece
+	empty = boards == 0
+	result = numpy.zeros(boards.shape, dtype=bool)
+	for cellSlices in _windowSlices(boards.shape[1], boards.shape[2], k):
+		openWindows = (_windowSums(own, cellSlices) == len(cellSlices) - 1) & (_windowSums(empty, cellSlices) == 1)
+		for cellSlice in cellSlices:
+			result[cellSlice] |= openWindows & empty[cellSlice]
+	return result
+
+def immediateWins(boards, piece, k=4):
+	"""Return an (N, NUM_COLUMNS) bool mask of the columns where the piece wins right away"""
+	return (completingCells(boards, piece, k) & landingCells(boards)).any(axis=1)
+
+def evaluate(boards, piece, k=4):
+	"""Return winners, legal moves, immediate wins and forced blocks for the piece to move on every board"""
+	boards = numpy.asarray(boards, dtype=numpy.int8)
+	return BatchEvaluation(winners(boards, k), legalMoves(boards), immediateWins(boards, piece, k), immediateWins(boards, 3 - piece, k))
+
+def toArray(positions):
+	"""Stack engine.Position objects into an (N, rows, columns) int8 batch"""
+	positions = list(positions)
+	rows = positions[0].rows if positions else NUM_ROWS
+	columns = positions[0].columns if positions else NUM_COLUMNS
+	boards = numpy.zeros((len(positions), rows, columns), dtype=numpy.int8)
+	for n, position in enumerate(positions):
+		boards[n] = [position[r] for r in range(rows)]
+	return boards
+
+# Single board helpers, thin wrappers over the batch versions
+
+def winner(board, k=4):
+	"""Return the piece with k in a row on a single board, or 0"""
+	return int(winners(numpy.asarray(board, dtype=numpy.int8)[numpy.newaxis], k)[0])
+
+def winningColumns(board, piece, k=4):
+	"""Return the columns where the piece wins right away on a single board"""
+	return numpy.flatnonzero(immediateWins(numpy.asarray(board, dtype=numpy.int8)[numpy.newaxis], piece, k)[0]).tolist()
+
+def blockingColumns(board, piece, k=4):
+	"""Return the columns the piece must play to stop the opponent winning on a single board"""
+	return winningColumns(board, 3 - piece, k)
@@ -0,0 +1,282 @@
+"""Benchmarks for the engine, AI and rendering hot paths, run without a window
+
+Example: `python bench.py --output results.json --baseline baseline.json`
+Every benchmark runs on the same seeded corpora of positions, so two runs on the same
+machine are comparable. With a baseline, any result more than --threshold percent worse
+makes the run exit with status 1, so it can gate changes in a script. The animation frames
+must also fit in the game's frame budget at its target FPS, baseline or not.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import contextlib
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import Connect4
+from engine import TrackedPosition, NUM_ROWS, NUM_COLUMNS
+from search import moveOrder
+from perf import percentile
+
+BENCH_VERSION = 1
+CORPUS_SEED = 350
+CORPUS_SIZE = 40
+CORPORA = {'empty': (0, 0), 'midgame': (14, 20), 'near-full': (34, 38)} # Range of moves already played
+FRAME_PASSES = 5 # Times each render benchmark goes over its corpus, frames are too quick for one pass to be stable
+DIFFICULTIES = {1: "easy", 2: "medium", 3: "hard", 4: "expert", 5: "mcts"}
+
+def randomPosition(rng, moves):
+	"""Play random moves that neither win nor fill the board, return None if the game got stuck or has a win in one
+
+	The board is a TrackedPosition like the game's and the tournament's, so the Medium and
+	Hard AIs read their line counts from it instead of recounting them on every move.
+	"""
+	position = TrackedPosition(NUM_ROWS, NUM_COLUMNS)
+	piece = 1
+	for _ in range(moves):
+		columns = [c for c in range(NUM_COLUMNS) if position.canPlay(c) and not position.isWinningMove(c, piece)]
+		if not columns:
+			return None
+		position.play(rng.choice(columns), piece)
+		piece = 3 - piece
+	if position.isFull() or any(position.canPlay(c) and position.isWinningMove(c, piece) for c in range(NUM_COLUMNS)):
+		return None # Finished games and wins in one make trivial benchmark positions
+	return position
+
+def buildCorpora(seed=CORPUS_SEED, count=CORPUS_SIZE):
+	"""Return {name: [positions]}, the same positions for the same seed"""
+	rng = random.Random(seed)
+	corpora = {}
+	for name, (fewest, most) in CORPORA.items():
+		positions = []
+		while len(positions) < count:
+			position = randomPosition(rng, rng.randint(fewest, most))
+			if position is not None:
+				positions.append(position)
+		corpora[name] = positions
+	return corpora
+
+def toMove(position):
+	"""The piece whose turn it is"""
+	return 1 + position.moves % 2
+
+def throughput(operation, items, minSeconds, rounds=5):
+	"""Call operation on every item for at least minSeconds in total and return the best round's ops/sec
+
+	Taking the fastest round rather than the average keeps other load on the machine from
+	showing up as a regression.
+	"""
+	best = 0.0
+	for _ in range(rounds):
+		calls = 0
+		start = time.perf_counter()
+		while True:
+			for item in items:
+				operation(item)
+			calls += len(items)
+			elapsed = time.perf_counter() - start
+			if elapsed >= minSeconds/rounds:
+				break
+		best = max(best, calls/elapsed)
+	return {'ops_per_sec': round(best, 1)}
+
+def latency(samples):
+	"""Summarize timings in seconds as millisecond percentiles"""
+	return {'p50_ms': round(1000*percentile(samples, 50), 3), 'p95_ms': round(1000*percentile(samples, 95), 3), 'p99_ms': round(1000*percentile(samples, 99), 3), 'max_ms': round(1000*max(samples), 3), 'samples': len(samples)}
+
+def timed(operation, items):
+	"""Return how long each operation(item) took, in seconds"""
+	samples = []
+	for item in items:
+		start = time.perf_counter()
+		operation(item)
+		samples.append(time.perf_counter() - start)
+	return samples
+
+def benchEngine(corpora, minSeconds):
+	"""Win detection and open row lookups over every corpus"""
+	results = {}
+	for name, positions in corpora.items():
+		moves = [(position, c) for position in positions for c in range(NUM_COLUMNS)]
+		results['winningMove/' + name] = throughput(lambda position: Connect4.winningMove(position, toMove(position)), positions, minSeconds)
+		results['getNextOpenRow/' + name] = throughput(lambda move: Connect4.getNextOpenRow(*move), moves, minSeconds)
+	return results
+
+def benchAI(corpora, difficulties):
+	"""Per move latency of dropPieceAI for each difficulty, every position played as a fresh game"""
+	results = {}
+	for difficulty in difficulties:
+		player = Connect4.getAIPlayer(difficulty)
+		for name, positions in corpora.items():
+			samples = []
+			with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull): # dropPieceAI prints search stats
+				for i, position in enumerate(positions):
+					player.newGame(CORPUS_SEED + i) # Outside the timing, clearing the search table isn't part of a move
+					samples += timed(lambda board: Connect4.dropPieceAI(difficulty, board, toMove(board)), [position.copy()])
+			Connect4.game_history.clear()
+			results['dropPieceAI/' + DIFFICULTIES[difficulty] + '/' + name] = latency(samples)
+	return results
+
+def benchRender(corpora):
+	"""Per frame cost of full and incremental board repaints, the history panel and text rendering"""
+	results = {}
+	for name, positions in corpora.items():
+		def fullFrame(position):
+			Connect4.renderer.invalidate()
+			Connect4.drawBoard(position)
+			Connect4.updateDisplay()
+		def moveFrame(position):
+			col = next(c for c in moveOrder(NUM_COLUMNS) if position.canPlay(c))
+			Connect4.drawBoard(position)
+			Connect4.dropPiece(position, Connect4.getNextOpenRow(position, col), col, toMove(position))
+			start = time.perf_counter()
+			Connect4.drawBoard(position)
+			Connect4.updateDisplay()
+			elapsed = time.perf_counter() - start
+			position.undo(col)
+			Connect4.game_history.pop()
+			return elapsed
+		def historyFrame(position):
+			Connect4.renderer.historyShown = None
+			Connect4.drawHistory(position)
+			Connect4.updateDisplay()
+
+		Connect4.getRenderer()
+		Connect4.game_history[:] = [(1 + i % 2, 0, 0) for i in range(22)]
+		results['drawBoard/full/' + name] = latency(timed(fullFrame, positions*FRAME_PASSES))
+		results['drawHistory/' + name] = latency(timed(historyFrame, positions*FRAME_PASSES))
+		Connect4.game_history.clear()
+		results['drawBoard/move/' + name] = latency([moveFrame(position.copy()) for position in positions*FRAME_PASSES])
+
+	labels = [("Player " + str(1 + i % 2) + "     Row " + str(1 + i % 6) + " Column " + str(1 + i % 7), 16) for i in range(64)]
+	results['renderText/cached'] = throughput(lambda label: Connect4.renderText(label[0], Connect4.BLACK, label[1]), labels, 0.2)
+	def uncached(label):
+		Connect4.renderText.cache_clear()
+		Connect4.renderText(label[0], Connect4.BLACK, label[1])
+	results['renderText/uncached'] = throughput(uncached, labels, 0.2)
+	results['composeMenu'] = latency(timed(lambda position: Connect4.composeMenu(position, Connect4.menuButtons()), corpora['empty'][:10] + corpora['midgame'][:10]))
+	return results
+
+def benchAnimation(corpora):
+	"""Per frame cost of pieces falling and winning lines growing, stepped one frame at a time like the game loop"""
+	results = {}
+	for name, positions in corpora.items():
+		drops = []
+		highlights = []
+		for position in positions:
+			position = position.copy()
+			Connect4.drawBoard(position)
+			Connect4.updateDisplay()
+			renderer = Connect4.getRenderer(position)
+			for col in [c for c in moveOrder(NUM_COLUMNS) if position.canPlay(c)][:2]: # Two pieces in flight at once, as when the AI answers quickly
+				row, piece = Connect4.getNextOpenRow(position, col), toMove(position)
+				Connect4.dropPiece(position, row, col, piece)
+				Connect4.animateDrop(position, row, col, piece)
+			renderer.startHighlight([(0, c) for c in range(4)]) # Grows once the pieces have landed
+			while renderer.animating:
+				growing = not renderer.drops
+				start = time.perf_counter()
+				renderer.animate(1/Connect4.FPS)
+				Connect4.updateDisplay()
+				(highlights if growing else drops).append(time.perf_counter() - start)
+			Connect4.game_history.clear()
+		results['animate/drop/' + name] = latency(drops)
+		results['animate/highlight/' + name] = latency(highlights)
+	return results
+
+def overBudget(results):
+	"""Return a line for every animation whose p99 frame doesn't fit in the game's frame budget"""
+	budget = 1000/Connect4.FPS
+	return [name + ": p99 " + str(result['p99_ms']) + " ms, over the " + str(round(budget, 1)) + " ms frame budget at " + str(Connect4.FPS) + " FPS" for name, result in results.items() if name.startswith('animate/') and result['p99_ms'] > budget]
+
+def compare(results, baseline, threshold):
+	"""Return a line for every benchmark that got more than threshold percent worse than the baseline"""
+	regressions = []
+	for name, result in results.items():
+		previous = baseline.get(name)
+		if previous is None:
+			continue
+		if 'ops_per_sec' in result and 'ops_per_sec' in previous:
+			change = 100*(previous['ops_per_sec'] - result['ops_per_sec'])/previous['ops_per_sec']
+			now, before, unit = result['ops_per_sec'], previous['ops_per_sec'], " ops/sec"
+		elif 'p50_ms' in result and 'p50_ms' in previous: # The median, the tail is too noisy to gate on
+			change = 100*(result['p50_ms'] - previous['p50_ms'])/max(previous['p50_ms'], 1e-3)
+			now, before, unit = result['p50_ms'], previous['p50_ms'], " ms p50"
+		else:
+			continue
+		if change > threshold:
+			regressions.append(name + ": " + str(before) + " -> " + str(now) + unit + " (" + str(round(change, 1)) + "% worse)")
+	return regressions
+
+def printResults(results):
+	"""Print one aligned line per benchmark"""
+	width = max(len(name) for name in results)
+	for name, result in results.items():
+		if 'ops_per_sec' in result:
+			print(name.ljust(width) + str(round(result['ops_per_sec'])).rjust(12) + " ops/sec")
+		else:
+			print(name.ljust(width) + str(result['p50_ms']).rjust(12) + " ms p50" + str(result['p95_ms']).rjust(10) + " ms p95" + str(result['p99_ms']).rjust(10) + " ms p99")
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark the engine, AI and rendering without a window")
+	parser.add_argument('--only', choices=('engine', 'ai', 'render', 'animation'), action='append', help="run only these groups (repeatable)")
+	parser.add_argument('--difficulty', type=int, choices=sorted(DIFFICULTIES), action='append', help="AI difficulties to time (repeatable, default all)")
+	parser.add_argument('--ai-time', type=int, default=100, metavar='MS', help="Expert and MCTS thinking time per move")
+	parser.add_argument('--min-time', type=float, default=0.5, metavar='SECONDS', help="minimum duration of each throughput benchmark")
+	parser.add_argument('--output', help="write the results to this JSON file")
+	parser.add_argument('--baseline', help="compare against results saved earlier with --output")
+	parser.add_argument('--threshold', type=float, default=25, metavar='PERCENT', help="how much worse than the baseline counts as a regression")
+	args = parser.parse_args()
+	groups = args.only or ('engine', 'ai', 'render', 'animation')
+
+	Connect4.args = Connect4.parseArgs(['--ai-time', str(args.ai_time)])
+	Connect4.initDisplay()
+	corpora = buildCorpora()
+
+	results = {}
+	start = time.perf_counter()
+	if 'engine' in groups:
+		results.update(benchEngine(corpora, args.min_time))
+	if 'ai' in groups:
+		results.update(benchAI(corpora, args.difficulty or sorted(DIFFICULTIES)))
+	if 'render' in groups:
+		results.update(benchRender(corpora))
+	if 'animation' in groups:
+		results.update(benchAnimation(corpora))
+	printResults(results)
+	print("Finished in " + str(round(time.perf_counter() - start, 1)) + "s")
+
+	if args.output:
+		report = {
+			'version': BENCH_VERSION,
+			'python': platform.python_version(),
+			'machine': platform.machine(),
+			'corpus_seed': CORPUS_SEED,
+			'ai_time': args.ai_time,
+			'results': results,
+		}
+		with open(args.output, 'w') as output:
+			json.dump(report, output, indent=1)
+
+	failures = overBudget(results)
+	for failure in failures:
+		print("OVER BUDGET " + failure)
+
+	if args.baseline:
+		with open(args.baseline) as baseline_file:
+			baseline = json.load(baseline_file)
+		regressions = compare(results, baseline['results'], args.threshold)
+		for regression in regressions:
+			print("REGRESSION " + regression)
+		if regressions:
+			return 1
+		print("No regressions beyond " + str(args.threshold) + "% against " + args.baseline)
+	return 1 if failures else 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,183 @@
+"""Opening book stored as a sorted binary file of searched positions, read through mmap
+
+Generate a book with `python book.py --plies 4 --line-plies 8 --depth 10`. Every position up
+to --plies is stored, and beyond that up to --line-plies the book follows its own moves: the
+side the book plays only makes the stored best move while the other side tries every reply.
+That covers every game the Expert can play from the book at a few thousand positions, where
+storing every position 8 plies in would take over a million searches.
+
+The file is a small header followed by fixed size records sorted by Zobrist hash, so lookups
+are a binary search over pages the operating system shares between every game process using
+the file.
+"""
+import os
+import sys
+import mmap
+import time
+import struct
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import Position, CONNECT, addBoardArguments, checkBoardArguments
+from search import Searcher, moveOrder
+
+BOOK_MAGIC = b'C4BK'
+BOOK_VERSION = 1
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'connect4.book')
+HEADER = struct.Struct('<4sBBBBI') # Magic, version, rows, columns, pieces to connect (0 in older books, meaning 4), record count
+RECORD = struct.Struct('<Qbh') # Position hash, best move, score for the side to move
+KEY = struct.Struct('<Q')
+SCORE_LIMIT = 32767
+
+class OpeningBook:
+	"""Read only view of a book file, mapped into memory instead of being loaded
+
+	The endgame tablebase (see tablebase.py) is the same kind of file with its own magic.
+	"""
+
+	def __init__(self, path=DEFAULT_BOOK_PATH, magic=BOOK_MAGIC):
+		with open(path, 'rb') as book_file:
+			self.map = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+		stored, version, self.rows, self.columns, self.k, self.count = HEADER.unpack_from(self.map, 0)
+		self.k = self.k or CONNECT
+		if stored != magic or version != BOOK_VERSION or len(self.map) != HEADER.size + self.count*RECORD.size:
+			self.map.close()
+			raise ValueError("Not a valid opening book: " + path)
+
+	def lookup(self, position):
+		"""Return (move, score) stored for the position, or None if it is not in the book"""
+		if position.rows != self.rows or position.columns != self.columns or position.k != self.k:
+			return None
+		key = position.hash
+		low, high = 0, self.count - 1
+		while low <= high:
+			middle = (low + high) // 2
+			offset = HEADER.size + middle*RECORD.size
+			stored = KEY.unpack_from(self.map, offset)[0]
+			if stored < key:
+				low = middle + 1
+			elif stored > key:
+				high = middle - 1
+			else:
+				_, move, score = RECORD.unpack_from(self.map, offset)
+				return move, score
+		return None
+
+	def entries(self):
+		"""Yield every stored (key, move, score), in key order"""
+		for i in range(self.count):
+			yield RECORD.unpack_from(self.map, HEADER.size + i*RECORD.size)
+
+	def close(self):
+		"""Unmap the book file"""
+		self.map.close()
+
+def openBook(path=DEFAULT_BOOK_PATH, magic=BOOK_MAGIC):
+	"""Return the opening book at path, or None if there is no usable book there"""
+	try:
+		return OpeningBook(path, magic)
+	except (OSError, ValueError):
+		return None
+
+def writeBook(path, rows, columns, entries, k=CONNECT, magic=BOOK_MAGIC):
+	"""Write (key, move, score) entries as a book file, sorted so it can be binary searched"""
+	entries = sorted(entries)
+	with open(path + '.tmp', 'wb') as book_file:
+		book_file.write(HEADER.pack(magic, BOOK_VERSION, rows, columns, k, len(entries)))
+		for key, move, score in entries:
+			book_file.write(RECORD.pack(key, move, max(-SCORE_LIMIT, min(SCORE_LIMIT, score))))
+	os.replace(path + '.tmp', path) # Readers never see a half written book
+
+def openingLines(rows, columns, plies, k=CONNECT):
+	"""Return one move sequence for every distinct unfinished position up to the given ply"""
+	lines = []
+	seen = set()
+	frontier = [()]
+	for ply in range(plies + 1):
+		lines.extend(frontier)
+		if ply == plies:
+			break
+		following = []
+		for line in frontier:
+			position = replay(rows, columns, line, k)
+			piece = 1 + len(line) % 2
+			for col in moveOrder(columns):
+				if not position.canPlay(col) or position.isWinningMove(col, piece):
+					continue
+				position.play(col, piece)
+				if position.hash not in seen:
+					seen.add(position.hash)
+					following.append(line + (col,))
+				position.undo(col)
+		frontier = following
+	return lines
+
+def bookReplies(rows, columns, line, move, k=CONNECT):
+	"""Return the lines two plies on where the book side plays move and the opponent any reply that doesn't end the game"""
+	position = replay(rows, columns, line, k)
+	piece = 1 + len(line) % 2
+	if position.isWinningMove(move, piece):
+		return []
+	position.play(move, piece)
+	return [line + (move, col) for col in moveOrder(columns) if position.canPlay(col) and not position.isWinningMove(col, 3 - piece) and position.moves + 1 < rows*columns]
+
+def replay(rows, columns, moves, k=CONNECT):
+	"""Return the position reached by playing the columns in order, starting with piece 1"""
+	position = Position(rows, columns, k)
+	for i, col in enumerate(moves):
+		position.play(col, 1 + i % 2)
+	return position
+
+_searcher = None
+
+def searchLine(job):
+	"""Search the position after a move sequence and return its book entry"""
+	global _searcher
+	rows, columns, k, depth, moves = job
+	if _searcher is None:
+		_searcher = Searcher()
+	position = replay(rows, columns, moves, k)
+	result = _searcher.search(position, 1 + len(moves) % 2, float('inf'), depth)
+	return position.hash, result.move, result.score
+
+def main():
+	parser = argparse.ArgumentParser(description="Generate the Connect 4 opening book")
+	parser.add_argument('--plies', type=int, default=4, help="store every position up to this many moves in")
+	parser.add_argument('--line-plies', type=int, default=8, help="beyond --plies, follow the book's own moves against every reply up to this many moves in")
+	parser.add_argument('--depth', type=int, default=10, help="search depth used for every stored position")
+	addBoardArguments(parser)
+	parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="number of worker processes")
+	parser.add_argument('-o', '--output', default=DEFAULT_BOOK_PATH)
+	args = parser.parse_args()
+	checkBoardArguments(parser, args)
+
+	start = time.perf_counter()
+	entries = {} # Position hash -> (move, score)
+
+	def searchAll(lines, label):
+		jobs = [(args.rows, args.columns, args.connect, args.depth, line) for line in lines]
+		print("Searching " + str(len(jobs)) + " " + label + " to depth " + str(args.depth))
+		for done, (key, move, score) in enumerate(pool.map(searchLine, jobs, chunksize=16), 1):
+			entries[key] = (move, score)
+			if done % 100 == 0:
+				print("\r" + str(done) + "/" + str(len(jobs)), end='', flush=True)
+		print("\r", end='')
+
+	with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+		lines = openingLines(args.rows, args.columns, args.plies, args.connect)
+		searchAll(lines, "positions")
+		# The book side to move: the empty board for piece 1, after every first move for piece 2
+		frontier = [line for line in lines if len(line) <= 1]
+		for ply in range(2, args.line_plies + 1, 2):
+			following = {}
+			for line in frontier:
+				for reply in bookReplies(args.rows, args.columns, line, entries[replay(args.rows, args.columns, line, args.connect).hash][0], args.connect):
+					if len(reply) <= args.line_plies:
+						following.setdefault(replay(args.rows, args.columns, reply, args.connect).hash, reply)
+			frontier = list(following.values())
+			searchAll([line for key, line in following.items() if key not in entries], "book line positions up to " + str(min(ply + 1, args.line_plies)) + " plies in")
+	writeBook(args.output, args.rows, args.columns, [(key, move, score) for key, (move, score) in entries.items()], args.connect)
+	print("\rWrote " + str(len(entries)) + " positions to " + args.output + " in " + str(round(time.perf_counter() - start, 1)) + "s")
+
+if __name__ == '__main__':
+	sys.exit(main())
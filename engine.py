@@ -0,0 +1,323 @@
+"""Bitboard game state for Connect 4, kept free of pygame/numpy so the AI and tools can use it headless"""
+import random
+
+NUM_ROWS = 6
+NUM_COLUMNS = 7
+CONNECT = 4 # Pieces in a row needed to win
+MIN_SIZE = 4
+MAX_SIZE = 20 # Rows or columns, beyond this the pieces get too small to see
+MIN_CONNECT = 3
+ZOBRIST_SEED = 0xC4C4 # Fixed so hashes agree between processes and between runs
+
+_zobrist_cache = {}
+_line_cache = {}
+
+def zobristKeys(rows, columns):
+	"""Return the per piece, per bit random keys used to hash positions of the given size"""
+	key = (rows, columns)
+	if key not in _zobrist_cache:
+		rng = random.Random(ZOBRIST_SEED ^ (rows << 8) ^ columns)
+		bits = (rows + 1)*columns
+		_zobrist_cache[key] = (None, [rng.getrandbits(64) for _ in range(bits)], [rng.getrandbits(64) for _ in range(bits)])
+	return _zobrist_cache[key]
+
+def winningLines(rows, columns, k):
+	"""Return every line of k cells on a board of the given size, and the lines through each cell
+
+	Lines are tuples of bit indices, listed horizontal, vertical, rising and then falling
+	diagonals, each by left column and then bottom row. The second list holds the ids of
+	the lines through every bit index, empty for the spare bits on top of the columns.
+	"""
+	key = (rows, columns, k)
+	if key not in _line_cache:
+		stride = rows + 1
+		lines = []
+		for dr, dc in ((0, 1), (1, 0), (1, 1), (-1, 1)):
+			for c in range(columns - (k - 1)*dc):
+				for r in range(rows) if dr <= 0 else range(rows - (k - 1)*dr):
+					if 0 <= r + (k - 1)*dr < rows:
+						lines.append(tuple((c + i*dc)*stride + r + i*dr for i in range(k)))
+		through = [[] for _ in range(stride*columns)]
+		for line, cells in enumerate(lines):
+			for index in cells:
+				through[index].append(line)
+		_line_cache[key] = (lines, through)
+	return _line_cache[key]
+
+def addBoardArguments(parser):
+	"""Add the --rows, --columns and --connect options to an argparse parser"""
+	parser.add_argument('--rows', type=int, default=NUM_ROWS)
+	parser.add_argument('--columns', type=int, default=NUM_COLUMNS)
+	parser.add_argument('--connect', type=int, default=CONNECT, metavar='K', help="pieces in a row needed to win")
+
+def checkBoardArguments(parser, args):
+	"""Exit with a usage error if the parsed board options don't make a playable game"""
+	if not (MIN_SIZE <= args.rows <= MAX_SIZE and MIN_SIZE <= args.columns <= MAX_SIZE):
+		parser.error("--rows and --columns must be between " + str(MIN_SIZE) + " and " + str(MAX_SIZE))
+	if not MIN_CONNECT <= args.connect <= max(args.rows, args.columns):
+		parser.error("--connect must be at least " + str(MIN_CONNECT) + " and fit on the board")
+
+def addMovesArgument(parser):
+	"""Add the optional moves argument, the columns played so far as 1 based digits (letters past 9)"""
+	parser.add_argument('moves', nargs='?', default='', help="columns played so far, 1 based, e.g. 4453")
+
+def replayMovesArgument(parser, args):
+	"""Return (position, piece to move) after args.moves, exiting with a usage error if a move can't be played or the game is over"""
+	position = Position(args.rows, args.columns, args.connect)
+	piece = 1
+	for char in args.moves:
+		col = int(char, 36) - 1
+		if not 0 <= col < args.columns or not position.canPlay(col) or position.isWinningMove(col, piece):
+			parser.error("move " + char + " is not playable or ends the game")
+		position.play(col, piece)
+		piece = 3 - piece
+	if position.isFull():
+		parser.error("the board is full")
+	return position, piece
+
+def hasRun(board, shift, k):
+	"""Returns True if the bitboard has k set bits in a row along the shift direction
+
+	Runs are doubled in length with each and-shift, so it takes about log2(k) big integer
+	operations whatever the size of the board.
+	"""
+	length = 1
+	while 2*length <= k:
+		board &= board >> (length*shift)
+		length *= 2
+	if length < k:
+		board &= board >> ((k - length)*shift) # Overlapping halves cover the rest
+	return board != 0
+
+class Position:
+	"""A board stored as one integer bitboard per player plus a column height array
+
+	Cell (row, col) lives at bit col*(rows+1) + row, with row 0 at the bottom. Every column
+	carries one spare bit on top so shifted lines can never wrap into the next column.
+	The Zobrist hash is updated with every move, so it costs one xor to keep current.
+	Wins need k pieces in a row; the standard k of 4 has its own unrolled checks.
+	"""
+	__slots__ = ('rows', 'columns', 'k', 'stride', 'boards', 'heights', 'moves', 'hash', 'zobrist')
+
+	def __init__(self, rows=NUM_ROWS, columns=NUM_COLUMNS, k=CONNECT):
+		self.rows = rows
+		self.columns = columns
+		self.k = k
+		self.stride = rows + 1
+		self.boards = [0, 0, 0] # Indexed by piece (1 or 2), slot 0 is unused
+		self.heights = [0] * columns
+		self.moves = 0
+		self.hash = 0
+		self.zobrist = zobristKeys(rows, columns)
+
+	def copy(self):
+		"""Return an independent copy of this position"""
+		other = Position.__new__(Position)
+		other.rows = self.rows
+		other.columns = self.columns
+		other.k = self.k
+		other.stride = self.stride
+		other.boards = self.boards[:]
+		other.heights = self.heights[:]
+		other.moves = self.moves
+		other.hash = self.hash
+		other.zobrist = self.zobrist
+		return other
+
+	def canPlay(self, col):
+		"""Returns True if a piece can still be dropped into the column"""
+		return 0 <= col < self.columns and self.heights[col] < self.rows
+
+	def play(self, col, piece):
+		"""Drop a piece into the column and return the row it landed on"""
+		row = self.heights[col]
+		index = col*self.stride + row
+		self.boards[piece] |= 1 << index
+		self.hash ^= self.zobrist[piece][index]
+		self.heights[col] = row + 1
+		self.moves += 1
+		return row
+
+	def undo(self, col):
+		"""Take back the top piece of the column"""
+		row = self.heights[col] - 1
+		index = col*self.stride + row
+		piece = 1 if self.boards[1] >> index & 1 else 2
+		self.boards[piece] &= ~(1 << index)
+		self.hash ^= self.zobrist[piece][index]
+		self.heights[col] = row
+		self.moves -= 1
+
+	def isFull(self):
+		"""Returns True once every cell holds a piece"""
+		return self.moves == self.rows*self.columns
+
+	def isWin(self, piece):
+		"""Returns True if the piece has k in a row anywhere on the board"""
+		board = self.boards[piece]
+		if self.k != 4:
+			return self._hasRun(board)
+		for shift in (1, self.stride, self.stride - 1, self.stride + 1): # Vertical, horizontal, both diagonals
+			pairs = board & (board >> shift)
+			if pairs & (pairs >> 2*shift):
+				return True
+		return False
+
+	def isWinningMove(self, col, piece):
+		"""Returns True if dropping the piece into the column would complete k in a row"""
+		board = self.boards[piece] | (1 << (col*self.stride + self.heights[col]))
+		if self.k != 4:
+			return self._hasRun(board)
+		for shift in (1, self.stride, self.stride - 1, self.stride + 1):
+			pairs = board & (board >> shift)
+			if pairs & (pairs >> 2*shift):
+				return True
+		return False
+
+	def _hasRun(self, board):
+		for shift in (1, self.stride, self.stride - 1, self.stride + 1):
+			if hasRun(board, shift, self.k):
+				return True
+		return False
+
+	def winningCells(self, row, col):
+		"""Return the cells of every k in a row running through (row, col), or an empty list
+
+		Only the four lines through the given cell are walked, so checking the move just
+		played costs a handful of bit tests instead of a scan of the whole board.
+		"""
+		piece = self.pieceAt(row, col)
+		cells = []
+		if not piece:
+			return cells
+		for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+			line = []
+			for sign in (1, -1):
+				r, c = row + sign*dr, col + sign*dc
+				while 0 <= r < self.rows and 0 <= c < self.columns and self.pieceAt(r, c) == piece:
+					line.append((r, c))
+					r, c = r + sign*dr, c + sign*dc
+			if len(line) >= self.k - 1:
+				cells.extend(line)
+		if cells:
+			cells.append((row, col))
+		return cells
+
+	def pieceAt(self, row, col):
+		"""Return the piece at the cell, or 0 if it is empty"""
+		bit = 1 << (col*self.stride + row)
+		if self.boards[1] & bit:
+			return 1
+		if self.boards[2] & bit:
+			return 2
+		return 0
+
+	def __getitem__(self, row):
+		"""Row adapter so existing board[r][c] style code keeps working"""
+		return tuple(self.pieceAt(row, c) for c in range(self.columns))
+
+class LineCounts:
+	"""How many pieces each player has on every winning line, updated one move at a time
+
+	Besides the counts it keeps, per piece, the lines where that piece has k - 1 and the
+	opponent none. Each of those lines is one empty cell away from a win, so immediate wins,
+	forced blocks and threats further up the board are lookups instead of board scans.
+	"""
+	__slots__ = ('k', 'lines', 'through', 'counts', 'open')
+
+	def __init__(self, rows=NUM_ROWS, columns=NUM_COLUMNS, k=CONNECT):
+		self.k = k
+		self.lines, self.through = winningLines(rows, columns, k)
+		self.counts = [None, [0]*len(self.lines), [0]*len(self.lines)] # Indexed by piece like Position.boards
+		self.open = [None, set(), set()]
+
+	def copy(self):
+		"""Return an independent copy of these counts"""
+		other = LineCounts.__new__(LineCounts)
+		other.k = self.k
+		other.lines = self.lines
+		other.through = self.through
+		other.counts = [None, self.counts[1][:], self.counts[2][:]]
+		other.open = [None, set(self.open[1]), set(self.open[2])]
+		return other
+
+	def add(self, index, piece):
+		"""Count a piece placed on the bit index"""
+		mine, theirs = self.counts[piece], self.counts[3 - piece]
+		for line in self.through[index]:
+			mine[line] += 1
+			if theirs[line] == 0:
+				if mine[line] == self.k - 1:
+					self.open[piece].add(line)
+				elif mine[line] == self.k:
+					self.open[piece].discard(line)
+			elif mine[line] == 1:
+				self.open[3 - piece].discard(line) # Blocked
+
+	def remove(self, index, piece):
+		"""Take back a piece counted on the bit index"""
+		mine, theirs = self.counts[piece], self.counts[3 - piece]
+		for line in self.through[index]:
+			mine[line] -= 1
+			if theirs[line] == 0:
+				if mine[line] == self.k - 1:
+					self.open[piece].add(line)
+				elif mine[line] == self.k - 2:
+					self.open[piece].discard(line)
+			elif mine[line] == 0 and theirs[line] == self.k - 1:
+				self.open[3 - piece].add(line) # Unblocked
+
+	def threatCells(self, piece, occupied):
+		"""Return the bit index of the empty cell of each of the piece's open lines, by line id"""
+		cells = []
+		for line in sorted(self.open[piece]):
+			for index in self.lines[line]:
+				if not occupied >> index & 1:
+					cells.append(index)
+					break
+		return cells
+
+def countLines(position):
+	"""Return the LineCounts of a position, kept up to date by it when it is a TrackedPosition"""
+	if isinstance(position, TrackedPosition):
+		return position.lines
+	counts = LineCounts(position.rows, position.columns, position.k)
+	for piece in (1, 2):
+		board = position.boards[piece]
+		while board:
+			low = board & -board
+			counts.add(low.bit_length() - 1, piece)
+			board ^= low
+	return counts
+
+class TrackedPosition(Position):
+	"""A Position that also keeps the LineCounts of the board current with every move and undo
+
+	The heuristic AIs read their threats from it. Searches work on a plain Position copy,
+	since they don't need the counts, so only the game board pays for the upkeep.
+	"""
+	__slots__ = ('lines',)
+
+	def __init__(self, rows=NUM_ROWS, columns=NUM_COLUMNS, k=CONNECT):
+		Position.__init__(self, rows, columns, k)
+		self.lines = LineCounts(rows, columns, k)
+
+	def copy(self):
+		other = TrackedPosition.__new__(TrackedPosition)
+		for name in Position.__slots__:
+			setattr(other, name, getattr(self, name))
+		other.boards = self.boards[:]
+		other.heights = self.heights[:]
+		other.lines = self.lines.copy()
+		return other
+
+	def play(self, col, piece):
+		row = Position.play(self, col, piece)
+		self.lines.add(col*self.stride + row, piece)
+		return row
+
+	def undo(self, col):
+		index = col*self.stride + self.heights[col] - 1
+		piece = 1 if self.boards[1] >> index & 1 else 2
+		Position.undo(self, col)
+		self.lines.remove(index, piece)
@@ -0,0 +1,148 @@
+"""Move hints: the score of every column for the side to move, worked out on a background thread
+
+Like the AI worker, the game hands the current position over and polls for results, so the
+frame loop never waits. Every column is searched deeper and deeper and the scores are
+published after each full depth, so hints start rough and sharpen while the player
+thinks; near the end of the game they are solved exactly instead. Results are cached by
+position, so going back to a recent position shows its hints at once. When the position changes,
+the search of the old one stops and its unfinished depth is thrown away.
+"""
+import threading
+from collections import namedtuple, OrderedDict
+
+from engine import Position
+from search import Searcher, WIN_SCORE, MATE_SCORE
+from solver import Solver
+
+HINT_EXACT = 16 # Empty cells from which on hints are solved exactly, quick enough there to not need deepening
+HINT_MAX_DEPTH = 11 # Plies searched after each column before the hint counts as final
+HINT_DEPTH_STEP = 2 # Deepen two plies at a time, so scores don't swing with whose move a search ends on
+HINT_TABLE_SIZE = 1 << 18 # Search table entries, kept across positions since consecutive ones share most of their trees
+HINT_CACHE_SIZE = 1024 # Positions whose hints are kept, the least recently shown dropped first; a game has at most a few dozen
+
+Hint = namedtuple('Hint', 'scores depth exact') # scores: per column for the piece to move, None for full columns
+
+def positionKey(position):
+	return (position.rows, position.columns, position.k, position.hash)
+
+def hintLabel(score, exact):
+	"""Short text for a hint score: Win, Loss, Draw or a signed heuristic value"""
+	if exact:
+		return "Win" if score > 0 else "Loss" if score < 0 else "Draw"
+	if score > MATE_SCORE:
+		return "Win"
+	if score < -MATE_SCORE:
+		return "Loss"
+	return ("+" if score > 0 else "") + str(score)
+
+def isFinal(hint):
+	"""True if searching deeper can't change the hint"""
+	return hint.exact or hint.depth >= HINT_MAX_DEPTH or all(score is None or abs(score) > MATE_SCORE for score in hint.scores)
+
+class HintWorker:
+	"""Works out hints for the latest position asked for, on a daemon thread started with the worker"""
+
+	def __init__(self):
+		self.cache = OrderedDict() # positionKey -> Hint, the deepest one found, in least recently used order
+		self.lock = threading.Condition()
+		self.job = None # (key, position, piece) being worked on, replaced by request()
+		self.closed = False
+		self.searcher = Searcher(HINT_TABLE_SIZE)
+		self.solvers = {}
+		self.thread = threading.Thread(target=self._run, daemon=True)
+		self.thread.start()
+
+	def request(self, position, piece):
+		"""Work on hints for the piece to move in the position, giving up on any other position"""
+		key = positionKey(position)
+		with self.lock:
+			if self.job is not None and self.job[0] == key:
+				return
+			hint = self.cache.get(key)
+			self.job = None if hint and isFinal(hint) else (key, Position.copy(position), piece)
+			self.searcher.stop() # Let a search of the old position return early
+			self.lock.notify()
+
+	def get(self, position):
+		"""Return the best Hint found so far for the position, or None"""
+		key = positionKey(position)
+		with self.lock:
+			if key in self.cache:
+				self.cache.move_to_end(key)
+			return self.cache.get(key)
+
+	def cancel(self):
+		"""Stop working, keeping every hint found so far"""
+		with self.lock:
+			self.job = None
+			self.searcher.stop()
+
+	def close(self):
+		"""Stop the thread"""
+		with self.lock:
+			self.closed = True
+			self.job = None
+			self.searcher.stop()
+			self.lock.notify()
+		self.thread.join()
+
+	def _store(self, key, hint):
+		"""Cache a hint, dropping the least recently used ones past HINT_CACHE_SIZE"""
+		with self.lock:
+			self.cache[key] = hint
+			self.cache.move_to_end(key)
+			while len(self.cache) > HINT_CACHE_SIZE:
+				self.cache.popitem(last=False)
+
+	def _run(self):
+		while True:
+			with self.lock:
+				while self.job is None and not self.closed:
+					self.lock.wait()
+				if self.closed:
+					return
+				job = self.job
+			self._work(job)
+			with self.lock:
+				if self.job is job:
+					self.job = None
+
+	def _work(self, job):
+		"""Deepen the hints of one position until they are final or the job is replaced"""
+		key, position, piece = job
+		if position.rows*position.columns - position.moves <= HINT_EXACT:
+			size = (position.rows, position.columns, position.k)
+			if size not in self.solvers:
+				self.solvers[size] = Solver(*size)
+			self._store(key, Hint(tuple(self.solvers[size].analyze(position, piece)), 0, True))
+			return
+
+		with self.lock:
+			hint = self.cache.get(key)
+		for depth in range((hint.depth + HINT_DEPTH_STEP) if hint else 1, HINT_MAX_DEPTH + 1, HINT_DEPTH_STEP):
+			scores = []
+			for col in range(position.columns):
+				if not position.canPlay(col):
+					scores.append(None)
+					continue
+				if position.isWinningMove(col, piece):
+					scores.append(WIN_SCORE)
+					continue
+				position.play(col, piece)
+				if position.isFull():
+					scores.append(0)
+				else:
+					with self.lock: # Either the new job is seen here or its stop() lands after this reset
+						if self.job is not job:
+							return
+						self.searcher.stopped = False
+						self.searcher.deadline = float('inf')
+					result = self.searcher.search(position, 3 - piece, None, depth)
+					if self.searcher.stopped:
+						return # Replaced mid search, the result may be from a shallower depth
+					scores.append(-result.score)
+				position.undo(col)
+			hint = Hint(tuple(scores), depth, False)
+			self._store(key, hint)
+			if isFinal(hint):
+				return
@@ -0,0 +1,123 @@
+"""Load generator for server.py: many simulated players over loopback, reporting moves/sec and latency
+
+Example: `python loadgen.py --clients 2000 --duration 30`, or add --spawn to start a server
+on a free port first. Each client joins matchmaking, plays random legal moves and queues
+again when its game ends; latency is the time from sending a move to the server echoing it.
+"""
+import os
+import sys
+import time
+import random
+import socket
+import asyncio
+import argparse
+import subprocess
+
+import net
+from engine import Position
+from perf import percentile
+
+LINGER = 2 # Seconds past the end of the run a client keeps waiting for a message
+
+class Stats:
+	"""Counters shared by every simulated client"""
+
+	def __init__(self):
+		self.moves = 0
+		self.games = 0
+		self.errors = 0
+		self.latencies = []
+
+async def readMessage(reader):
+	kind = (await reader.readexactly(1))[0]
+	payload = net.PAYLOADS[kind]
+	return kind, payload.unpack(await reader.readexactly(payload.size)) if payload.size else ()
+
+async def player(host, port, seed, stats, deadline):
+	"""Play games back to back until the deadline, one connection per game"""
+	rng = random.Random(seed)
+	while time.perf_counter() < deadline:
+		reader, writer = await asyncio.open_connection(host, port)
+		try:
+			writer.write(net.encode(net.HELLO, net.PROTOCOL_VERSION))
+			position = None
+			piece = 0
+			sent = 0.0
+			while True:
+				kind, values = await asyncio.wait_for(readMessage(reader), max(deadline - time.perf_counter(), 0) + LINGER)
+				if kind == net.START:
+					piece, rows, columns, k = values
+					position = Position(rows, columns, k)
+				elif kind == net.MOVED:
+					mover, _, col = values
+					position.play(col, mover)
+					if mover == piece:
+						stats.latencies.append(time.perf_counter() - sent)
+						stats.moves += 1
+				elif kind == net.END:
+					stats.games += piece == 1 # Count each game once
+					break
+				elif kind == net.ERROR:
+					stats.errors += 1
+
+				if position is not None and kind in (net.START, net.MOVED) and position.moves % 2 + 1 == piece:
+					if time.perf_counter() >= deadline:
+						writer.write(net.encode(net.LEAVE))
+						break
+					col = rng.choice([c for c in range(position.columns) if position.canPlay(c)])
+					sent = time.perf_counter()
+					writer.write(net.encode(net.MOVE, col))
+		except asyncio.TimeoutError:
+			pass # Still waiting for an opponent when the run ended
+		except (asyncio.IncompleteReadError, ConnectionError):
+			stats.errors += 1
+		finally:
+			writer.close()
+
+async def run(args, port):
+	stats = Stats()
+	start = time.perf_counter()
+	deadline = start + args.duration
+	clients = []
+	for i in range(args.clients):
+		clients.append(asyncio.ensure_future(player(args.host, port, args.seed + i, stats, deadline)))
+		if i % 100 == 99:
+			await asyncio.sleep(0) # Let the server accept in batches instead of overflowing its backlog
+	await asyncio.gather(*clients, return_exceptions=True)
+	elapsed = time.perf_counter() - start
+
+	latencies = sorted(stats.latencies)
+	print(str(args.clients) + " clients, " + str(stats.games) + " games, " + str(stats.moves) + " moves in " + str(round(elapsed, 1)) + "s")
+	print(str(round(stats.moves/elapsed)) + " moves/sec, " + str(round(stats.games/elapsed, 1)) + " games/sec, " + str(stats.errors) + " errors")
+	print("Move latency p50 " + str(round(1000*percentile(latencies, 50), 2)) + " ms, p95 " + str(round(1000*percentile(latencies, 95), 2)) + " ms, p99 " + str(round(1000*percentile(latencies, 99), 2)) + " ms, max " + str(round(1000*(latencies[-1] if latencies else 0), 2)) + " ms")
+
+def freePort():
+	with socket.socket() as probe:
+		probe.bind((net.DEFAULT_HOST, 0))
+		return probe.getsockname()[1]
+
+def main():
+	parser = argparse.ArgumentParser(description="Drive a Connect 4 match server with simulated players")
+	parser.add_argument('--host', default=net.DEFAULT_HOST)
+	parser.add_argument('--port', type=int, default=net.DEFAULT_PORT)
+	parser.add_argument('--clients', type=int, default=1000, help="simulated players, two per match")
+	parser.add_argument('--duration', type=float, default=10, metavar='SECONDS')
+	parser.add_argument('--seed', type=int, default=0)
+	parser.add_argument('--spawn', action='store_true', help="start a server on a free port for the run")
+	args = parser.parse_args()
+
+	server = None
+	port = args.port
+	if args.spawn:
+		port = freePort()
+		server = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'server.py'), '--host', args.host, '--port', str(port)], stdout=subprocess.PIPE)
+		server.stdout.readline() # Printed once it is listening
+	try:
+		asyncio.run(run(args, port))
+	finally:
+		if server:
+			server.terminate()
+			server.wait()
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,224 @@
+"""Monte Carlo tree search AI: random playouts instead of an evaluation function, spread over every core
+
+Each worker process grows its own UCT tree from the same position with its own random
+seed (root parallelization), and the visit counts and wins of the root moves are summed
+across workers afterwards. The move visited most wins. Playouts run on bare bitboard
+integers rather than a Position, since they are where nearly all the time goes.
+
+Example: `python mcts.py 4453 --time 2000` searches the position after those (1 based)
+columns and prints the win rate of every move.
+"""
+import os
+import sys
+import math
+import time
+import random
+import argparse
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import Position, hasRun, addBoardArguments, checkBoardArguments, addMovesArgument, replayMovesArgument
+from search import moveOrder
+
+EXPLORATION = math.sqrt(2) # UCT exploration constant
+CHECK_INTERVAL = 16 # Playouts between looks at the clock
+
+_stop = None # The MonteCarlo stop event, in worker processes
+
+MCTSResult = namedtuple('MCTSResult', 'move winRate playouts seconds jobs columns') # columns: (visits, win rate) per column, None if full
+
+class Node:
+	"""A position in the tree, with the wins and visits of the piece that moved into it"""
+	__slots__ = ('move', 'parent', 'children', 'untried', 'visits', 'wins', 'result')
+
+	def __init__(self, move, parent, untried, result=None):
+		self.move = move
+		self.parent = parent
+		self.children = []
+		self.untried = untried # Columns not expanded yet
+		self.visits = 0
+		self.wins = 0.0 # Draws count half
+		self.result = result # 1.0 when the move into this node won, 0.5 when it filled the board
+
+def playout(position, piece, rng):
+	"""Play random moves from the position until it ends and return 1.0, 0.5 or 0.0 for the piece to move"""
+	rows, stride, k = position.rows, position.stride, position.k
+	boards = position.boards[:]
+	heights = position.heights[:]
+	free = [c for c in range(position.columns) if heights[c] < rows]
+	empty = rows*position.columns - position.moves
+	shifts = (1, stride, stride - 1, stride + 1)
+	random = rng.random
+	mover = piece
+	while empty:
+		i = int(random()*len(free))
+		col = free[i]
+		row = heights[col]
+		board = boards[mover] | 1 << (col*stride + row)
+		boards[mover] = board
+		heights[col] = row + 1
+		if row + 1 == rows:
+			free[i] = free[-1]
+			free.pop()
+		empty -= 1
+		for shift in shifts:
+			if k == 4:
+				pairs = board & (board >> shift)
+				won = pairs & (pairs >> 2*shift)
+			else:
+				won = hasRun(board, shift, k)
+			if won:
+				return 1.0 if mover == piece else 0.0
+		mover = 3 - mover
+	return 0.5
+
+def growTree(position, piece, seconds, playouts, seed, exploration=EXPLORATION, stop=None):
+	"""Run UCT from the position until the time or playout budget runs out, or the stop event is set
+
+	Returns (per column (visits, wins) of the root moves, playouts run). The position is
+	played on and undone in place, so it is unchanged afterwards.
+	"""
+	rng = random.Random(seed)
+	deadline = time.perf_counter() + seconds if seconds is not None else None
+	order = [c for c in moveOrder(position.columns) if position.canPlay(c)]
+	root = Node(None, None, order[::-1]) # Popped from the end, so central columns are tried first
+	done = 0
+	while (playouts is None or done < playouts) and (done % CHECK_INTERVAL or ((deadline is None or time.perf_counter() < deadline) and not (stop and stop.is_set()))):
+		node = root
+		toMove = piece
+		played = []
+		# Selection: follow the best UCT score down to a node with moves left to try
+		while node.result is None and not node.untried:
+			scale = exploration*math.sqrt(math.log(node.visits))
+			node = max(node.children, key=lambda child: child.wins/child.visits + scale/math.sqrt(child.visits))
+			position.play(node.move, toMove)
+			played.append(node.move)
+			toMove = 3 - toMove
+		# Expansion: add one child for a move not tried yet
+		if node.result is None:
+			col = node.untried.pop()
+			won = position.isWinningMove(col, toMove)
+			position.play(col, toMove)
+			played.append(col)
+			result = 1.0 if won else 0.5 if position.isFull() else None
+			child = Node(col, node, [] if result is not None else [c for c in order if position.canPlay(c)][::-1], result)
+			node.children.append(child)
+			node = child
+			toMove = 3 - toMove
+		# Simulation, scored for the piece that moved into the node
+		score = node.result if node.result is not None else 1.0 - playout(position, toMove, rng)
+		# Backpropagation, flipping the point of view at every level
+		while node is not None:
+			node.visits += 1
+			node.wins += score
+			score = 1.0 - score
+			node = node.parent
+		for col in reversed(played):
+			position.undo(col)
+		done += 1
+
+	stats = [None]*position.columns
+	for child in root.children:
+		stats[child.move] = (child.visits, child.wins)
+	return stats, done
+
+def growTreeJob(job):
+	"""Process pool entry point: rebuild the position from its bitboards and grow one tree"""
+	rows, columns, k, boards, heights, piece, seconds, playouts, seed = job
+	position = Position(rows, columns, k)
+	position.boards = list(boards)
+	position.heights = list(heights)
+	position.moves = sum(heights)
+	return growTree(position, piece, seconds, playouts, seed, stop=_stop)
+
+def setStopEvent(event):
+	"""Process pool initializer: keep the event stop() sets"""
+	global _stop
+	_stop = event
+
+class MonteCarlo:
+	"""Root parallel MCTS over a process pool that is started on the first search and kept until close()
+
+	Like search.Searcher, another thread may call stop() while a search is running; set
+	stopped back to False before the next search.
+	"""
+
+	def __init__(self, jobs=None):
+		self.jobs = jobs or os.cpu_count() or 1
+		self.pool = None
+		self.stopEvent = multiprocessing.Event() # Shared with the worker processes
+
+	@property
+	def stopped(self):
+		return self.stopEvent.is_set()
+
+	@stopped.setter
+	def stopped(self, value):
+		if value:
+			self.stopEvent.set()
+		else:
+			self.stopEvent.clear()
+
+	def stop(self):
+		"""Make the running search return with the playouts it has so far"""
+		self.stopEvent.set()
+
+	def search(self, position, piece, budgetMs=None, playouts=None, seed=None):
+		"""Return the MCTSResult of searching for the piece, bounded by time, total playouts or both"""
+		start = time.perf_counter()
+		seconds = budgetMs/1000 if budgetMs is not None else None
+		share = -(-playouts//self.jobs) if playouts is not None else None
+		rng = random.Random(seed)
+		if self.jobs == 1:
+			results = [growTree(Position.copy(position), piece, seconds, share, rng.getrandbits(64), stop=self.stopEvent)]
+		else:
+			if self.pool is None:
+				self.pool = ProcessPoolExecutor(max_workers=self.jobs, initializer=setStopEvent, initargs=(self.stopEvent,))
+			job = (position.rows, position.columns, position.k, position.boards, position.heights, piece, seconds, share)
+			results = list(self.pool.map(growTreeJob, [job + (rng.getrandbits(64),) for _ in range(self.jobs)]))
+
+		visits = [0]*position.columns
+		wins = [0.0]*position.columns
+		for stats, _ in results:
+			for col, entry in enumerate(stats):
+				if entry:
+					visits[col] += entry[0]
+					wins[col] += entry[1]
+		columns = tuple((visits[c], wins[c]/visits[c]) if visits[c] else None for c in range(position.columns))
+		move = max((c for c in moveOrder(position.columns) if position.canPlay(c)), key=lambda c: visits[c])
+		return MCTSResult(move, columns[move][1] if columns[move] else 0.5, sum(done for _, done in results), time.perf_counter() - start, len(results), columns)
+
+	def close(self):
+		"""Stop the worker processes"""
+		if self.pool is not None:
+			self.pool.shutdown()
+			self.pool = None
+
+def main():
+	parser = argparse.ArgumentParser(description="Search a Connect 4 position with Monte Carlo tree search")
+	addMovesArgument(parser)
+	parser.add_argument('--time', type=int, default=1000, metavar='MS', help="thinking time, 0 for no limit")
+	parser.add_argument('--playouts', type=int, help="stop after this many playouts in total")
+	parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="number of worker processes")
+	parser.add_argument('--seed', type=int)
+	addBoardArguments(parser)
+	args = parser.parse_args()
+	checkBoardArguments(parser, args)
+	if not args.time and not args.playouts:
+		parser.error("give a --time or --playouts limit")
+
+	position, piece = replayMovesArgument(parser, args)
+
+	mcts = MonteCarlo(args.jobs)
+	try:
+		result = mcts.search(position, piece, args.time or None, args.playouts, args.seed)
+	finally:
+		mcts.close()
+	for col, entry in enumerate(result.columns):
+		if entry:
+			print("Column " + str(col + 1) + ": " + str(entry[0]).rjust(9) + " visits, win rate " + str(round(100*entry[1], 1)) + "%")
+	print("Best move " + str(result.move + 1) + ", win rate " + str(round(100*result.winRate, 1)) + "%, " + str(result.playouts) + " playouts on " + str(result.jobs) + " processes in " + str(round(result.seconds, 2)) + "s (" + str(round(result.playouts/result.seconds)) + " playouts/sec)")
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,134 @@
+"""Wire protocol for online matches, plus the client the game uses to talk to server.py
+
+Every message is a one byte type followed by a fixed size payload, so nothing on the wire
+needs a length prefix and the whole protocol fits in a table:
+
+	client -> server   HELLO  version             join matchmaking
+	                   MOVE   column              drop a piece
+	                   LEAVE                      resign and disconnect
+	                   HEARTBEAT                  still here, sent after HEARTBEAT_INTERVAL seconds without news
+	server -> client   WAITING                    queued until an opponent joins
+	                   START  piece rows cols k   match found, piece 1 moves first, k in a row wins
+	                   MOVED  piece row col       a move was accepted (sent to both players)
+	                   END    result reason       match over, result as in record.py
+	                   ERROR  code                the last message was rejected
+"""
+import queue
+import socket
+import struct
+import threading
+
+PROTOCOL_VERSION = 3
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 4444
+HEARTBEAT_INTERVAL = 10 # Seconds between heartbeats while nothing arrives, the server drops clients that miss a few
+
+HELLO = 0x01
+MOVE = 0x02
+LEAVE = 0x03
+HEARTBEAT = 0x04
+WAITING = 0x10
+START = 0x11
+MOVED = 0x12
+END = 0x13
+ERROR = 0x14
+
+PAYLOADS = {
+	HELLO: struct.Struct('B'),
+	MOVE: struct.Struct('B'),
+	LEAVE: struct.Struct(''),
+	HEARTBEAT: struct.Struct(''),
+	WAITING: struct.Struct(''),
+	START: struct.Struct('BBBB'),
+	MOVED: struct.Struct('BBB'),
+	END: struct.Struct('BB'),
+	ERROR: struct.Struct('B'),
+}
+
+# END reasons
+FINISHED = 0
+OPPONENT_LEFT = 1
+
+# ERROR codes
+NOT_YOUR_TURN = 1
+INVALID_MOVE = 2
+BAD_MESSAGE = 3
+BAD_VERSION = 4
+NOT_IN_MATCH = 5
+
+def encode(kind, *values):
+	"""Return the bytes of one message"""
+	return bytes((kind,)) + PAYLOADS[kind].pack(*values)
+
+def readMessage(receive):
+	"""Read one message with receive(n), which returns exactly n bytes, and return (kind, values)
+
+	Raises ValueError for an unknown message type.
+	"""
+	kind = receive(1)[0]
+	payload = PAYLOADS.get(kind)
+	if payload is None:
+		raise ValueError("Unknown message type " + str(kind))
+	return kind, payload.unpack(receive(payload.size)) if payload.size else ()
+
+class OnlineClient:
+	"""Connection to a match server; a background thread queues incoming messages for poll()"""
+
+	def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=5):
+		self.socket = socket.create_connection((host, port), timeout)
+		self.socket.settimeout(HEARTBEAT_INTERVAL) # See _exactly()
+		self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		self.sendLock = threading.Lock() # The receive thread sends heartbeats
+		self.messages = queue.Queue()
+		self.connected = True
+		self.thread = threading.Thread(target=self._receive, daemon=True)
+		self.thread.start()
+		self.send(HELLO, PROTOCOL_VERSION)
+
+	def send(self, kind, *values):
+		"""Send one message, quietly dropping it if the connection is gone"""
+		try:
+			with self.sendLock:
+				self.socket.sendall(encode(kind, *values))
+		except OSError:
+			self.connected = False
+
+	def poll(self):
+		"""Return the next (kind, values) message, None if nothing arrived, or (None, ()) once disconnected"""
+		try:
+			return self.messages.get_nowait()
+		except queue.Empty:
+			return None
+
+	def close(self):
+		"""Leave the match and close the connection"""
+		if self.connected:
+			self.send(LEAVE)
+		self.connected = False
+		try:
+			self.socket.shutdown(socket.SHUT_RDWR)
+		except OSError:
+			pass
+		self.socket.close()
+		self.thread.join()
+
+	def _exactly(self, n):
+		data = b''
+		while len(data) < n:
+			try:
+				chunk = self.socket.recv(n - len(data))
+			except socket.timeout:
+				self.send(HEARTBEAT) # Quiet for a while, let the server know we are still here
+				continue
+			if not chunk:
+				raise ConnectionError("Server closed the connection")
+			data += chunk
+		return data
+
+	def _receive(self):
+		try:
+			while True:
+				self.messages.put(readMessage(self._exactly))
+		except (OSError, ValueError):
+			self.connected = False
+			self.messages.put((None, ()))
@@ -0,0 +1,147 @@
+"""Performance counters kept in fixed size ring buffers, dumped as CSV or a Chrome trace
+
+A Recorder is only created when statistics are asked for, and timing is added to functions
+by wrapping them at that point, so a game without it runs the original code untouched.
+"""
+import csv
+import json
+import time
+import functools
+from array import array
+
+DEFAULT_CAPACITY = 4096 # Samples kept per series, about a minute of frames at 60 FPS
+
+class RingBuffer:
+	"""Fixed size buffer of (time, value) samples that overwrites the oldest once full"""
+	__slots__ = ('capacity', 'count', 'times', 'values')
+
+	def __init__(self, capacity=DEFAULT_CAPACITY):
+		self.capacity = capacity
+		self.count = 0
+		self.times = array('d', bytes(8*capacity))
+		self.values = array('d', bytes(8*capacity))
+
+	def __len__(self):
+		return min(self.count, self.capacity)
+
+	def append(self, when, value):
+		i = self.count % self.capacity
+		self.times[i] = when
+		self.values[i] = value
+		self.count += 1
+
+	def samples(self):
+		"""Return every kept (time, value) pair, oldest first"""
+		first = self.count - len(self)
+		return [(self.times[i % self.capacity], self.values[i % self.capacity]) for i in range(first, self.count)]
+
+	def recent(self, n):
+		"""Return the values of the last n samples, oldest first"""
+		n = min(n, len(self))
+		return [self.values[i % self.capacity] for i in range(self.count - n, self.count)]
+
+def percentile(values, p):
+	"""The p-th percentile of the values (nearest rank), 0.0 when there are none"""
+	if not values:
+		return 0.0
+	values = sorted(values)
+	return values[min(len(values) - 1, int(p/100*len(values)))]
+
+class Recorder:
+	"""Collects timed spans (durations in seconds) and counters (plain values) by name"""
+
+	def __init__(self, capacity=DEFAULT_CAPACITY):
+		self.capacity = capacity
+		self.origin = time.perf_counter()
+		self.spans = {}
+		self.counters = {}
+
+	def record(self, name, start, duration):
+		"""Record that name ran for duration seconds from start (a time.perf_counter() value)"""
+		buffer = self.spans.get(name)
+		if buffer is None:
+			buffer = self.spans[name] = RingBuffer(self.capacity)
+		buffer.append(start, duration)
+
+	def count(self, name, value):
+		"""Record the current value of a counter such as nodes searched or a cache hit rate"""
+		buffer = self.counters.get(name)
+		if buffer is None:
+			buffer = self.counters[name] = RingBuffer(self.capacity)
+		buffer.append(time.perf_counter(), value)
+
+	def timed(self, name, function):
+		"""Return function wrapped so every call is recorded as a span"""
+		@functools.wraps(function)
+		def wrapper(*args, **kwargs):
+			start = time.perf_counter()
+			try:
+				return function(*args, **kwargs)
+			finally:
+				self.record(name, start, time.perf_counter() - start)
+		wrapper.untimed = function
+		return wrapper
+
+	def instrument(self, owner, names, prefix=''):
+		"""Replace the named functions of a module or class with timed versions, once"""
+		for name in names:
+			function = getattr(owner, name)
+			if not hasattr(function, 'untimed'):
+				setattr(owner, name, self.timed(prefix + name, function))
+
+	def recent(self, name, n):
+		"""The last n durations of a span, or values of a counter"""
+		buffer = self.spans.get(name) or self.counters.get(name)
+		return buffer.recent(n) if buffer else []
+
+	def fps(self, name='frame', frames=60):
+		"""Frames per second over the last few frame spans"""
+		durations = self.recent(name, frames)
+		return len(durations)/sum(durations) if durations and sum(durations) > 0 else 0.0
+
+	def summary(self):
+		"""Return {name: {count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}} for every span kept"""
+		result = {}
+		for name, buffer in self.spans.items():
+			durations = buffer.recent(len(buffer))
+			result[name] = {
+				'count': buffer.count,
+				'mean_ms': round(1000*sum(durations)/len(durations), 3),
+				'p50_ms': round(1000*percentile(durations, 50), 3),
+				'p95_ms': round(1000*percentile(durations, 95), 3),
+				'p99_ms': round(1000*percentile(durations, 99), 3),
+				'max_ms': round(1000*max(durations), 3),
+			}
+		return result
+
+	def writeCSV(self, path):
+		"""One row per sample: kind, name, seconds since recording started, duration in ms or counter value"""
+		with open(path, 'w', newline='') as csv_file:
+			writer = csv.writer(csv_file)
+			writer.writerow(('kind', 'name', 'time_s', 'value'))
+			for name, buffer in self.spans.items():
+				for start, duration in buffer.samples():
+					writer.writerow(('span', name, round(start - self.origin, 6), round(1000*duration, 4)))
+			for name, buffer in self.counters.items():
+				for when, value in buffer.samples():
+					writer.writerow(('counter', name, round(when - self.origin, 6), value))
+
+	def writeTrace(self, path):
+		"""Chrome trace event JSON (open in chrome://tracing or Perfetto), one track per span name"""
+		events = []
+		for track, (name, buffer) in enumerate(self.spans.items(), 1):
+			events.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': track, 'args': {'name': name}})
+			for start, duration in buffer.samples():
+				events.append({'name': name, 'ph': 'X', 'pid': 1, 'tid': track, 'ts': round(1e6*(start - self.origin), 1), 'dur': round(1e6*duration, 1)})
+		for name, buffer in self.counters.items():
+			for when, value in buffer.samples():
+				events.append({'name': name, 'ph': 'C', 'pid': 1, 'ts': round(1e6*(when - self.origin), 1), 'args': {name: value}})
+		with open(path, 'w') as trace_file:
+			json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
+
+	def dump(self, path):
+		"""Write the samples as CSV if the path ends in .csv, otherwise as a Chrome trace"""
+		if path.lower().endswith('.csv'):
+			self.writeCSV(path)
+		else:
+			self.writeTrace(path)
@@ -0,0 +1,147 @@
+"""Compact archive of played games, one byte per move, appended to as games finish
+
+An archive is a small file header followed by game records. Each record is a fixed size
+header (time, mode, result, board size, pieces to connect, move count) and then the column of every move,
+so a whole 6x7 game takes at most 53 bytes. Records are only ever appended, and a record
+cut short by a crash is ignored when loading. Version 1 archives, written before the board
+size was configurable, have no connect byte and are read as Connect 4. Before appending, a
+writer cuts such a record off, so the games written after it stay readable.
+
+`python record.py games.c4r` prints a summary of an archive.
+"""
+import os
+import sys
+import mmap
+import time
+import struct
+import argparse
+from collections import namedtuple, Counter
+
+RECORD_MAGIC = b'C4GR'
+RECORD_VERSION = 2
+DEFAULT_RECORD_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'games.c4r')
+FILE_HEADER = struct.Struct('<4sB3x') # Magic, version
+GAME_HEADER = struct.Struct('<IBBBBBH') # Unix time, mode, result, rows, columns, pieces to connect, move count
+GAME_HEADER_V1 = struct.Struct('<IBBBBH') # The same without pieces to connect
+
+ONLINE = 128 # Mode of games played over the network, 0 is a local game and 1 and up are AI levels
+
+# Results, the same numbers the game loop uses for its winner
+UNFINISHED = 0 # Left for the menu before anyone won
+RED_WINS = 1
+YELLOW_WINS = 2
+TIE = 3
+RESULT_NAMES = {UNFINISHED: "unfinished", RED_WINS: "player 1", YELLOW_WINS: "player 2", TIE: "tie"}
+
+GameRecord = namedtuple('GameRecord', 'moves mode result rows columns timestamp k', defaults=(4,))
+
+def encodeGame(record):
+	"""Pack a game record into its bytes in an archive"""
+	return GAME_HEADER.pack(int(record.timestamp), record.mode, record.result, record.rows, record.columns, record.k, len(record.moves)) + bytes(record.moves)
+
+def decodeGames(data):
+	"""Yield every complete GameRecord in the bytes of an archive"""
+	if len(data) < FILE_HEADER.size:
+		return
+	magic, version = FILE_HEADER.unpack_from(data, 0)
+	if magic != RECORD_MAGIC or version not in (1, RECORD_VERSION):
+		raise ValueError("Not a game archive")
+	header = GAME_HEADER if version == RECORD_VERSION else GAME_HEADER_V1
+	offset = FILE_HEADER.size
+	while offset + header.size <= len(data):
+		if version == RECORD_VERSION:
+			timestamp, mode, result, rows, columns, k, count = header.unpack_from(data, offset)
+		else:
+			timestamp, mode, result, rows, columns, count = header.unpack_from(data, offset)
+			k = 4
+		offset += header.size
+		if offset + count > len(data):
+			return # Cut short while it was being written
+		yield GameRecord(data[offset:offset + count], mode, result, rows, columns, timestamp, k)
+		offset += count
+
+def completeSize(data):
+	"""Return how many bytes at the start of an archive hold its header and complete records"""
+	if len(data) < FILE_HEADER.size:
+		return 0
+	header = GAME_HEADER if FILE_HEADER.unpack_from(data, 0)[1] == RECORD_VERSION else GAME_HEADER_V1
+	return FILE_HEADER.size + sum(header.size + len(game.moves) for game in decodeGames(data))
+
+def loadGames(path=DEFAULT_RECORD_PATH):
+	"""Read a whole archive in one go and return its games, an empty list if there is no archive"""
+	try:
+		with open(path, 'rb') as record_file:
+			data = record_file.read()
+	except FileNotFoundError:
+		return []
+	return list(decodeGames(data))
+
+def iterGames(path=DEFAULT_RECORD_PATH):
+	"""Yield the games of an archive one at a time through mmap, without reading the whole file"""
+	try:
+		with open(path, 'rb') as record_file:
+			if os.fstat(record_file.fileno()).st_size == 0:
+				return
+			with mmap.mmap(record_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+				yield from decodeGames(data)
+	except FileNotFoundError:
+		return
+
+def upgradeArchive(path):
+	"""Rewrite an archive in an older format as the current version, leaving others alone"""
+	try:
+		with open(path, 'rb') as record_file:
+			data = record_file.read()
+	except FileNotFoundError:
+		return
+	if len(data) < FILE_HEADER.size or FILE_HEADER.unpack_from(data, 0)[1] == RECORD_VERSION:
+		return
+	games = list(decodeGames(data))
+	with open(path + '.tmp', 'wb') as record_file:
+		record_file.write(FILE_HEADER.pack(RECORD_MAGIC, RECORD_VERSION))
+		for game in games:
+			record_file.write(encodeGame(game))
+	os.replace(path + '.tmp', path)
+
+class RecordWriter:
+	"""Appends finished games to an archive, creating it on the first game
+
+	A version 1 archive is rewritten in the current format first, since its records have no
+	room for the pieces to connect, and a record left cut short by a crash is dropped.
+	"""
+
+	def __init__(self, path=DEFAULT_RECORD_PATH):
+		self.path = path
+		upgradeArchive(path)
+		self.file = open(path, 'a+b')
+		complete = 0
+		if self.file.tell():
+			with mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+				complete = completeSize(data)
+			self.file.truncate(complete)
+		if complete == 0:
+			self.file.write(FILE_HEADER.pack(RECORD_MAGIC, RECORD_VERSION))
+
+	def write(self, moves, mode, result, rows, columns, k=4):
+		"""Append one game, flushed straight away so it survives the program being killed"""
+		self.file.write(encodeGame(GameRecord(bytes(moves), mode, result, rows, columns, time.time(), k)))
+		self.file.flush()
+
+	def close(self):
+		self.file.close()
+
+def main():
+	parser = argparse.ArgumentParser(description="Summarize a Connect 4 game archive")
+	parser.add_argument('path', nargs='?', default=DEFAULT_RECORD_PATH)
+	args = parser.parse_args()
+
+	start = time.perf_counter()
+	games = loadGames(args.path)
+	elapsed = time.perf_counter() - start
+	print(str(len(games)) + " games, " + str(sum(len(game.moves) for game in games)) + " moves loaded in " + str(round(1000*elapsed, 1)) + " ms")
+	results = Counter((game.mode, game.result) for game in games)
+	for mode in sorted({mode for mode, _ in results}):
+		print(("Local" if mode == 0 else "Online" if mode == ONLINE else "AI level " + str(mode)).ljust(12) + ", ".join(RESULT_NAMES.get(result, str(result)) + " " + str(results[(mode, result)]) for result in sorted(RESULT_NAMES) if results[(mode, result)]))
+
+if __name__ == '__main__':
+	sys.exit(main())
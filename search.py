@@ -0,0 +1,263 @@
+"""Negamax alpha-beta search over engine.Position, used by the Expert AI"""
+import time
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+
+from engine import Position
+
+DEFAULT_BUDGET_MS = 1000
+DEFAULT_TABLE_SIZE = 1 << 20 # Entries, about 18 MB
+WIN_SCORE = 1000000
+MATE_SCORE = WIN_SCORE - 10000 # Scores beyond this are forced wins or losses
+EXACT, LOWER, UPPER = 0, 1, 2 # Bound types stored in the transposition table
+WINDOW_WEIGHTS = (0, 1, 4, 16, 0) # Score of a window holding 0-4 pieces of only one player
+CENTER_WEIGHT = 3
+
+SearchResult = namedtuple('SearchResult', 'move score depth nodes seconds')
+
+_window_cache = {}
+
+class SearchTimeout(Exception):
+	"""Raised inside the search once the move budget has run out"""
+
+class TranspositionTable:
+	"""Fixed capacity table of search results indexed by Zobrist hash
+
+	Every field lives in its own preallocated array, so memory stays flat no matter how long
+	the table is in use. A slot is overwritten by results from a newer search or by results
+	searched at least as deep as the one it holds.
+	"""
+
+	def __init__(self, size=DEFAULT_TABLE_SIZE):
+		self.size = size
+		self.keys = array('Q', bytes(8*size))
+		self.scores = array('i', bytes(4*size))
+		self.depths = array('h', bytes(2*size))
+		self.flags = array('B', bytes(size))
+		self.moves = array('b', bytes(size))
+		self.ages = array('H', bytes(2*size))
+		self.age = 0
+		self.hits = 0
+		self.misses = 0
+		self.collisions = 0
+
+	def clear(self):
+		"""Forget every stored entry and reset the counters"""
+		self.__init__(self.size)
+
+	def newSearch(self):
+		"""Mark the entries stored so far as older than the next search's"""
+		self.age = (self.age + 1) & 0xFFFF
+
+	def probe(self, key):
+		"""Return the slot holding the key, or -1 if the position is not stored"""
+		index = key % self.size
+		stored = self.keys[index]
+		if stored == key:
+			self.hits += 1
+			return index
+		if stored:
+			self.collisions += 1
+		else:
+			self.misses += 1
+		return -1
+
+	def store(self, key, depth, flag, score, move):
+		"""Save a search result, keeping the existing entry if it is deeper and from this search"""
+		index = key % self.size
+		if self.keys[index] != key and self.ages[index] == self.age and self.depths[index] > depth:
+			return
+		self.keys[index] = key
+		self.depths[index] = depth
+		self.flags[index] = flag
+		self.scores[index] = score
+		self.moves[index] = move
+		self.ages[index] = self.age
+
+	def stats(self):
+		"""Return the hit/miss/collision counters and the resulting hit rate"""
+		probes = self.hits + self.misses + self.collisions
+		return {'hits': self.hits, 'misses': self.misses, 'collisions': self.collisions, 'hit_rate': self.hits/probes if probes else 0.0}
+
+def windowMasks(rows, columns, k=4):
+	"""Return the bitmask of every k cell window on a board of the given size"""
+	key = (rows, columns, k)
+	if key not in _window_cache:
+		stride = rows + 1
+		masks = []
+		for c in range(columns):
+			for r in range(rows):
+				for dr, dc in ((0, 1), (1, 0), (1, 1), (-1, 1)):
+					if 0 <= r + (k - 1)*dr < rows and c + (k - 1)*dc < columns:
+						masks.append(sum(1 << ((c + i*dc)*stride + r + i*dr) for i in range(k)))
+		_window_cache[key] = masks
+	return _window_cache[key]
+
+@lru_cache(maxsize=None)
+def windowWeights(k):
+	"""Return the score of a window holding 0 to k pieces of only one player, WINDOW_WEIGHTS for k of 4"""
+	return (0,) + tuple(4**(n - 1) for n in range(1, k)) + (0,)
+
+@lru_cache(maxsize=None)
+def moveOrder(columns):
+	"""Return the columns ordered from the center outwards"""
+	return tuple(sorted(range(columns), key=lambda c: abs(2*c - (columns - 1))))
+
+def evaluate(position, piece):
+	"""Heuristic score of a position from the point of view of the piece to move"""
+	own = position.boards[piece]
+	opp = position.boards[3 - piece]
+	weights = WINDOW_WEIGHTS if position.k == 4 else windowWeights(position.k)
+	score = 0
+	for mask in windowMasks(position.rows, position.columns, position.k):
+		o = own & mask
+		p = opp & mask
+		if o and not p:
+			score += weights[o.bit_count()]
+		elif p and not o:
+			score -= weights[p.bit_count()]
+	center = ((1 << position.rows) - 1) << ((position.columns // 2)*position.stride)
+	score += CENTER_WEIGHT*((own & center).bit_count() - (opp & center).bit_count())
+	return score
+
+class Searcher:
+	"""Iterative deepening negamax with alpha-beta pruning under a per-move time budget
+
+	The transposition table is kept between calls, so later moves of a game start from
+	everything learned while searching the earlier ones. Call newGame() between games.
+	Another thread may move the deadline or call stop() while a search is running.
+	"""
+
+	def __init__(self, tableSize=DEFAULT_TABLE_SIZE):
+		self.nodes = 0
+		self.deadline = 0.0
+		self.stopped = False
+		self.table = TranspositionTable(tableSize)
+
+	def stop(self):
+		"""Make the running search (or the next one to start) return as soon as possible"""
+		self.stopped = True
+
+	def predictedMove(self, position):
+		"""Return the best move stored for the position in the table, or None"""
+		index = self.table.probe(position.hash)
+		if index >= 0 and position.canPlay(self.table.moves[index]):
+			return self.table.moves[index]
+		return None
+
+	def newGame(self):
+		"""Drop what was learned in the previous game"""
+		self.table.clear()
+
+	def search(self, position, piece, budgetMs=DEFAULT_BUDGET_MS, maxDepth=None):
+		"""Return the best move found for the piece before the budget runs out
+
+		With a budget of None the search runs until the deadline already set on the
+		searcher, which lets a pondering search be given a real deadline later on.
+		"""
+		start = time.perf_counter()
+		if budgetMs is not None:
+			self.deadline = start + budgetMs/1000
+		self.nodes = 0
+		self.table.newSearch()
+		order = [c for c in moveOrder(position.columns) if position.canPlay(c)]
+		empty = position.rows*position.columns - position.moves
+		maxDepth = empty if maxDepth is None else min(maxDepth, empty)
+
+		for col in order:
+			if position.isWinningMove(col, piece):
+				return SearchResult(col, WIN_SCORE - 1, 1, 1, time.perf_counter() - start)
+
+		best = SearchResult(order[0], 0, 0, 0, 0.0)
+		work = Position.copy(position) # Plain even for a TrackedPosition, the search has no use for line counts
+		for depth in range(1, maxDepth + 1):
+			if self.stopped:
+				break
+			try:
+				move, score = self._root(work, piece, depth, order)
+			except SearchTimeout:
+				break
+			best = SearchResult(move, score, depth, self.nodes, time.perf_counter() - start)
+			order.remove(move)
+			order.insert(0, move) # Search the previous best move first on the next iteration
+			if abs(score) > MATE_SCORE:
+				break # A forced result was found, deeper searches can't change it
+		return best._replace(nodes=self.nodes, seconds=time.perf_counter() - start)
+
+	def _root(self, position, piece, depth, order):
+		"""Search every root move to the given depth and return the best (move, score)"""
+		alpha = -WIN_SCORE
+		bestMove = order[0]
+		for col in order:
+			position.play(col, piece)
+			score = -self._negamax(position, 3 - piece, depth - 1, -WIN_SCORE, -alpha, 1)
+			position.undo(col)
+			if score > alpha:
+				alpha = score
+				bestMove = col
+		return bestMove, alpha
+
+	def _negamax(self, position, piece, depth, alpha, beta, ply):
+		"""Return the score of the position for the piece to move"""
+		self.nodes += 1
+		if not self.nodes & 1023 and (self.stopped or time.perf_counter() > self.deadline):
+			raise SearchTimeout()
+		if position.isFull():
+			return 0
+
+		order = [c for c in moveOrder(position.columns) if position.canPlay(c)]
+		for col in order:
+			if position.isWinningMove(col, piece):
+				return WIN_SCORE - ply - 1
+		if depth <= 0:
+			return evaluate(position, piece)
+
+		table = self.table
+		key = position.hash
+		index = table.probe(key)
+		if index >= 0:
+			if table.depths[index] >= depth:
+				score = table.scores[index]
+				if score > MATE_SCORE: # Stored relative to the entry's own position, see below
+					score -= ply
+				elif score < -MATE_SCORE:
+					score += ply
+				flag = table.flags[index]
+				if flag == EXACT:
+					return score
+				if flag == LOWER and score >= beta or flag == UPPER and score <= alpha:
+					return score
+			hashMove = table.moves[index]
+			if hashMove in order:
+				order.remove(hashMove)
+				order.insert(0, hashMove)
+
+		alphaStart = alpha
+		best = -WIN_SCORE
+		bestMove = order[0]
+		for col in order:
+			position.play(col, piece)
+			score = -self._negamax(position, 3 - piece, depth - 1, -beta, -alpha, ply + 1)
+			position.undo(col)
+			if score > best:
+				best = score
+				bestMove = col
+				if score > alpha:
+					alpha = score
+					if alpha >= beta:
+						break
+
+		if best >= beta:
+			flag = LOWER
+		elif best <= alphaStart:
+			flag = UPPER
+		else:
+			flag = EXACT
+		stored = best
+		if stored > MATE_SCORE: # Make forced results independent of how deep in the tree they were found
+			stored += ply
+		elif stored < -MATE_SCORE:
+			stored -= ply
+		table.store(key, depth, flag, stored, bestMove)
+		return best
@@ -0,0 +1,209 @@
+"""Asyncio match server for online games: pairs players in arrival order and referees their moves
+
+Example: `python server.py --port 4444 --report 10`
+The server keeps the only authoritative board; clients just display what it accepts. One
+process serves thousands of matches since a session is a few small objects, every message
+has a fixed size, and a client that stops reading or stops sending is disconnected. Only the
+player whose turn it is runs against a clock; everyone else just has to keep sending heartbeats.
+"""
+import sys
+import time
+import asyncio
+import argparse
+
+import net
+from engine import Position, NUM_ROWS, NUM_COLUMNS, CONNECT, addBoardArguments, checkBoardArguments
+from record import RED_WINS, YELLOW_WINS, TIE
+
+MOVE_TIMEOUT = 300 # Seconds a player whose turn it is has to move before forfeiting
+HEARTBEAT_TIMEOUT = 3*net.HEARTBEAT_INTERVAL # Seconds any client may go without sending anything
+READ_LIMIT = 64 # Stream buffer size, far above the largest message
+WRITE_LIMIT = 4096 # Bytes queued for a client that isn't reading before it is dropped
+
+class Session:
+	"""One connected client"""
+	__slots__ = ('reader', 'writer', 'match', 'piece')
+
+	def __init__(self, reader, writer):
+		self.reader = reader
+		self.writer = writer
+		self.match = None
+		self.piece = 0
+
+	def send(self, kind, *values):
+		"""Queue a message, disconnecting clients that let too much pile up unread"""
+		if self.writer.is_closing():
+			return
+		self.writer.write(net.encode(kind, *values))
+		if self.writer.transport.get_write_buffer_size() > WRITE_LIMIT:
+			self.writer.close()
+
+class Match:
+	"""The board and players of one game"""
+	__slots__ = ('position', 'players', 'turn', 'turnStarted', 'over')
+
+	def __init__(self, first, second, rows, columns, k):
+		self.position = Position(rows, columns, k)
+		self.players = {1: first, 2: second}
+		self.turn = 1
+		self.turnStarted = time.monotonic()
+		self.over = False
+
+	def broadcast(self, kind, *values):
+		for player in self.players.values():
+			player.send(kind, *values)
+
+class MatchServer:
+	"""Matchmaking and move validation for every session, plus counters for reporting"""
+
+	def __init__(self, rows=NUM_ROWS, columns=NUM_COLUMNS, k=CONNECT):
+		self.rows = rows
+		self.columns = columns
+		self.k = k
+		self.waiting = None
+		self.sessions = 0
+		self.matches = 0 # In progress
+		self.games = 0
+		self.moves = 0
+
+	async def handle(self, reader, writer):
+		"""Serve one client from HELLO until it leaves or the connection drops"""
+		session = Session(reader, writer)
+		self.sessions += 1
+		try:
+			kind, values = await self.read(session)
+			if kind != net.HELLO:
+				session.send(net.ERROR, net.BAD_MESSAGE)
+				return
+			if values[0] != net.PROTOCOL_VERSION:
+				session.send(net.ERROR, net.BAD_VERSION)
+				return
+			self.join(session)
+
+			while True:
+				kind, values = await self.read(session)
+				if kind == net.LEAVE:
+					break
+				elif kind == net.MOVE:
+					self.move(session, values[0])
+				else:
+					session.send(net.ERROR, net.BAD_MESSAGE)
+		except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError, ValueError):
+			pass
+		finally:
+			self.leave(session)
+			self.sessions -= 1
+			writer.close()
+
+	async def read(self, session):
+		"""Wait for the client's next message other than a heartbeat
+
+		Raises asyncio.TimeoutError when the client misses its heartbeats or, if it is its
+		turn, runs out of time to move.
+		"""
+		while True:
+			timeout = HEARTBEAT_TIMEOUT
+			match = session.match
+			if match and match.turn == session.piece:
+				timeout = min(timeout, match.turnStarted + MOVE_TIMEOUT - time.monotonic())
+				if timeout <= 0:
+					raise asyncio.TimeoutError
+			kind = (await asyncio.wait_for(session.reader.readexactly(1), timeout))[0]
+			payload = net.PAYLOADS.get(kind)
+			if payload is None:
+				raise ValueError("Unknown message type " + str(kind))
+			values = payload.unpack(await session.reader.readexactly(payload.size)) if payload.size else ()
+			if kind != net.HEARTBEAT:
+				return kind, values
+
+	def join(self, session):
+		"""Pair the session with the client waiting longest, or make it wait"""
+		opponent = self.waiting
+		if opponent is None or opponent.writer.is_closing():
+			self.waiting = session
+			session.send(net.WAITING)
+			return
+		self.waiting = None
+		match = Match(opponent, session, self.rows, self.columns, self.k)
+		self.matches += 1
+		for piece, player in match.players.items():
+			player.match = match
+			player.piece = piece
+			player.send(net.START, piece, self.rows, self.columns, self.k)
+
+	def move(self, session, col):
+		"""Validate a move against the authoritative board and tell both players about it"""
+		match = session.match
+		if match is None or match.over:
+			session.send(net.ERROR, net.NOT_IN_MATCH)
+			return
+		if match.turn != session.piece:
+			session.send(net.ERROR, net.NOT_YOUR_TURN)
+			return
+		position = match.position
+		if not position.canPlay(col):
+			session.send(net.ERROR, net.INVALID_MOVE)
+			return
+
+		row = position.play(col, session.piece)
+		self.moves += 1
+		match.broadcast(net.MOVED, session.piece, row, col)
+		if position.winningCells(row, col):
+			self.finish(match, RED_WINS if session.piece == 1 else YELLOW_WINS, net.FINISHED)
+		elif position.isFull():
+			self.finish(match, TIE, net.FINISHED)
+		else:
+			match.turn = 3 - match.turn
+			match.turnStarted = time.monotonic()
+
+	def leave(self, session):
+		"""Forget a departing session, awarding an unfinished match to the opponent"""
+		if self.waiting is session:
+			self.waiting = None
+		match = session.match
+		if match and not match.over:
+			self.finish(match, RED_WINS if session.piece == 2 else YELLOW_WINS, net.OPPONENT_LEFT)
+		session.match = None
+
+	def finish(self, match, result, reason):
+		match.over = True
+		self.matches -= 1
+		self.games += 1
+		match.broadcast(net.END, result, reason)
+		for player in match.players.values():
+			player.match = None # Free the board as soon as the game is over
+
+	async def report(self, interval):
+		"""Print load figures every interval seconds"""
+		moves = self.moves
+		last = time.perf_counter()
+		while True:
+			await asyncio.sleep(interval)
+			now = time.perf_counter()
+			print(str(self.sessions) + " sessions, " + str(self.matches) + " matches, " + str(self.games) + " games played, " + str(round((self.moves - moves)/(now - last))) + " moves/sec", flush=True)
+			moves, last = self.moves, now
+
+async def serve(host, port, reportInterval=0, rows=NUM_ROWS, columns=NUM_COLUMNS, k=CONNECT):
+	server = MatchServer(rows, columns, k)
+	listener = await asyncio.start_server(server.handle, host, port, limit=READ_LIMIT, backlog=1024)
+	print("Serving Connect " + str(k) + " on a " + str(rows) + "x" + str(columns) + " board at " + host + ":" + str(port), flush=True)
+	if reportInterval:
+		asyncio.ensure_future(server.report(reportInterval))
+	async with listener:
+		await listener.serve_forever()
+
+def main():
+	parser = argparse.ArgumentParser(description="Connect 4 online match server")
+	parser.add_argument('--host', default=net.DEFAULT_HOST, help="address to listen on (0.0.0.0 for every interface)")
+	parser.add_argument('--port', type=int, default=net.DEFAULT_PORT)
+	parser.add_argument('--report', type=float, default=0, metavar='SECONDS', help="print load figures this often")
+	addBoardArguments(parser)
+	args = parser.parse_args()
+	checkBoardArguments(parser, args)
+	try:
+		asyncio.run(serve(args.host, args.port, args.report, args.rows, args.columns, args.connect))
+	except KeyboardInterrupt:
+		pass
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,240 @@
+"""Exact solver: the game-theoretic value and best move of any position, with perfect play
+
+Scores follow the usual Connect 4 solver convention, from the point of view of the piece to
+move: 0 is a draw, a win scores 1 more for every move the winner still has in hand when it
+lands (so faster wins score higher), and losses are the negatives.
+Positions are searched as two integers, the stones of the side to move and the occupied
+cells, with the same layout as engine.Position. The search is negamax with alpha-beta run
+as a series of null-window probes that binary search the score, and it prunes with
+forced-move detection, never playing under an opponent's winning cell and a transposition
+table of score bounds.
+
+Example: `python solver.py 4453` solves the position after those (1 based) columns.
+"""
+import sys
+import time
+import argparse
+from functools import lru_cache
+
+from engine import NUM_ROWS, NUM_COLUMNS, addBoardArguments, checkBoardArguments, addMovesArgument, replayMovesArgument
+from search import moveOrder
+
+DEFAULT_TABLE_LIMIT = 1 << 21 # Bounds kept before the table is cleared, a few hundred MB at most
+
+@lru_cache(maxsize=None)
+def boardMasks(rows, columns):
+	"""Return (bottom row, every cell, per column cells) masks for a board size"""
+	stride = rows + 1
+	bottom = sum(1 << (c*stride) for c in range(columns))
+	column = tuple(((1 << rows) - 1) << (c*stride) for c in range(columns))
+	return bottom, bottom*((1 << rows) - 1), column
+
+def winningCells(stones, mask, stride, k, cells):
+	"""Return the empty cells where stones would complete k in a row
+
+	A cell completes a line when, for some split a + b = k - 1, the a cells before it and
+	the b cells after it along one direction are all stones. Lines running off the board
+	always cross a column's spare top bit, which is never a stone, so nothing wraps.
+	"""
+	result = 0
+	for shift in (1, stride, stride - 1, stride + 1):
+		before = [-1]
+		run = -1
+		for i in range(1, k):
+			run &= stones << (i*shift)
+			before.append(run)
+		after = -1
+		for b in range(k):
+			if b:
+				after &= stones >> (b*shift)
+			result |= before[k - 1 - b] & after
+	return result & (cells ^ mask)
+
+class Solver:
+	"""Solves positions of one board size exactly, keeping its table between calls
+
+	The table holds lower and upper score bounds by position key; call clear() to drop it.
+	"""
+
+	def __init__(self, rows=NUM_ROWS, columns=NUM_COLUMNS, k=4, tableLimit=DEFAULT_TABLE_LIMIT):
+		self.rows = rows
+		self.columns = columns
+		self.k = k
+		self.stride = rows + 1
+		self.size = rows*columns
+		self.bottom, self.cells, self.columnMasks = boardMasks(rows, columns)
+		self.order = moveOrder(columns)
+		self.tableLimit = tableLimit
+		self.lower = {}
+		self.upper = {}
+		self.nodes = 0
+
+	def clear(self):
+		"""Forget every stored bound"""
+		self.lower.clear()
+		self.upper.clear()
+
+	def _bitboards(self, position, piece):
+		if (position.rows, position.columns, position.k) != (self.rows, self.columns, self.k):
+			raise ValueError("Position does not match the solver's board")
+		return position.boards[piece], position.boards[1] | position.boards[2]
+
+	def solve(self, position, piece, weak=False):
+		"""Return the exact score of the position for the piece to move, or only its sign when weak"""
+		current, mask = self._bitboards(position, piece)
+		return self._solve(current, mask, position.moves, weak)
+
+	def analyze(self, position, piece, weak=False):
+		"""Return the score of playing each column for the piece, None for full columns"""
+		current, mask = self._bitboards(position, piece)
+		possible = (mask + self.bottom) & self.cells
+		wins = winningCells(current, mask, self.stride, self.k, self.cells) & possible
+		scores = []
+		for col in range(self.columns):
+			move = possible & self.columnMasks[col]
+			if not move:
+				scores.append(None)
+			elif move & wins:
+				scores.append(1 if weak else (self.size + 1 - position.moves)//2)
+			elif position.moves + 1 == self.size:
+				scores.append(0)
+			else:
+				scores.append(-self._solve(current ^ mask, mask | move, position.moves + 1, weak))
+		return scores
+
+	def bestMove(self, position, piece):
+		"""Return (column, score) of the best move for the piece, preferring central columns on ties"""
+		scores = self.analyze(position, piece)
+		col = max((c for c in self.order if scores[c] is not None), key=lambda c: scores[c])
+		return col, scores[col]
+
+	def _solve(self, current, mask, moves, weak):
+		"""Narrow the score down with null-window searches"""
+		self.nodes = 0
+		possible = (mask + self.bottom) & self.cells
+		if winningCells(current, mask, self.stride, self.k, self.cells) & possible:
+			return 1 if weak else (self.size + 1 - moves)//2
+		if moves == self.size:
+			return 0
+		low, high = -((self.size - moves)//2), (self.size + 1 - moves)//2
+		if weak:
+			low, high = -1, 1
+		while low < high:
+			middle = low + (high - low)//2
+			if middle <= 0 and low//2 < middle:
+				middle = low//2 # Probe near zero first, most positions are close to a draw
+			elif middle >= 0 and high//2 > middle:
+				middle = high//2
+			score = self._negamax(current, mask, moves, middle, middle + 1)
+			if score <= middle:
+				high = score
+			else:
+				low = score
+		if len(self.lower) + len(self.upper) > self.tableLimit:
+			self.clear()
+		if weak:
+			return (low > 0) - (low < 0) # A probe may have proved more than the sign
+		return low
+
+	def _negamax(self, current, mask, moves, alpha, beta):
+		"""Score of a position where the side to move can't win at once, within (alpha, beta)"""
+		self.nodes += 1
+		stride, k, cells = self.stride, self.k, self.cells
+		possible = (mask + self.bottom) & cells
+		opponentWins = winningCells(current ^ mask, mask, stride, k, cells)
+		forced = possible & opponentWins
+		if forced:
+			if forced & (forced - 1):
+				return -((self.size - moves)//2) # Two threats at once can't both be blocked
+			possible = forced
+		safe = possible & ~(opponentWins >> 1) # Never play right under the opponent's winning cell
+		if not safe:
+			return -((self.size - moves)//2)
+		if moves >= self.size - 2:
+			return 0
+
+		low = -((self.size - 2 - moves)//2)
+		if alpha < low:
+			alpha = low
+			if alpha >= beta:
+				return alpha
+		high = (self.size - 1 - moves)//2
+		key = current + mask
+		bound = self.upper.get(key)
+		if bound is not None and bound < high:
+			high = bound
+		if beta > high:
+			beta = high
+			if alpha >= beta:
+				return beta
+		bound = self.lower.get(key)
+		if bound is not None and bound > alpha:
+			alpha = bound
+			if alpha >= beta:
+				return alpha
+
+		# Try the moves that leave the most winning cells of our own first
+		candidates = []
+		for i, col in enumerate(self.order):
+			move = safe & self.columnMasks[col]
+			if move:
+				threats = (winningCells(current | move, mask, stride, k, cells)).bit_count()
+				candidates.append((-threats, i, move))
+		candidates.sort()
+
+		for _, _, move in candidates:
+			score = -self._negamax(current ^ mask, mask | move, moves + 1, -beta, -alpha)
+			if score >= beta:
+				self.lower[key] = score
+				return score
+			if score > alpha:
+				alpha = score
+		self.upper[key] = alpha
+		return alpha
+
+def solveTree(position, piece, values):
+	"""Exact (move, score) of the position and every position reachable from it, stored by hash in values
+
+	Unlike Solver this visits the whole tree without pruning, since every position needs
+	its own exact value. A position where the side to move can win at once gets that move
+	and is not expanded further.
+	"""
+	entry = values.get(position.hash)
+	if entry is not None:
+		return entry
+	size = position.rows*position.columns
+	order = [c for c in moveOrder(position.columns) if position.canPlay(c)]
+	for col in order:
+		if position.isWinningMove(col, piece):
+			entry = values[position.hash] = (col, (size + 1 - position.moves)//2)
+			return entry
+	best = None
+	for col in order:
+		position.play(col, piece)
+		score = 0 if position.isFull() else -solveTree(position, 3 - piece, values)[1]
+		position.undo(col)
+		if best is None or score > best[1]:
+			best = (col, score)
+	values[position.hash] = best
+	return best
+
+def main():
+	parser = argparse.ArgumentParser(description="Solve a Connect 4 position exactly")
+	addMovesArgument(parser)
+	parser.add_argument('--weak', action='store_true', help="only find out win, draw or loss")
+	addBoardArguments(parser)
+	args = parser.parse_args()
+	checkBoardArguments(parser, args)
+
+	position, piece = replayMovesArgument(parser, args)
+
+	solver = Solver(args.rows, args.columns, args.connect)
+	start = time.perf_counter()
+	scores = solver.analyze(position, piece, args.weak)
+	elapsed = time.perf_counter() - start
+	print("Column scores: " + "  ".join(str(c + 1) + ":" + ("-" if score is None else str(score)) for c, score in enumerate(scores)))
+	best = max((c for c in moveOrder(args.columns) if scores[c] is not None), key=lambda c: scores[c])
+	print("Best move " + str(best + 1) + ", score " + str(scores[best]) + ", " + str(round(elapsed, 2)) + "s")
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,160 @@
+"""Endgame tablebase: the exact best move of positions near the end of a game, read through mmap
+
+Generate one with `python tablebase.py --empty 8 --random 2000`. Every position with at most
+--empty cells left that can be reached from the seed positions is solved exactly and stored.
+The seeds are the positions with exactly that many empty cells in archived games (--games)
+and in random games (--random). Storing every such position on a 6x7 board would take
+trillions of entries, so the tablebase covers the endgames that actually come up instead.
+
+The file has the layout of an opening book (see book.py) with its own magic. Work is split
+into shards solved in parallel and saved as they finish, so an interrupted run picks up
+where it stopped when started again with the same options.
+"""
+import os
+import sys
+import json
+import time
+import zlib
+import random
+import shutil
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from engine import Position, addBoardArguments, checkBoardArguments
+from book import OpeningBook, openBook, writeBook, replay
+from solver import solveTree
+from record import loadGames
+
+TABLEBASE_MAGIC = b'C4TB'
+DEFAULT_TABLEBASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'connect4.tb')
+DEFAULT_EMPTY = 8
+DEFAULT_SHARDS = 64
+
+def openTablebase(path=DEFAULT_TABLEBASE_PATH):
+	"""Return the tablebase at path, or None if there is no usable tablebase there"""
+	return openBook(path, TABLEBASE_MAGIC)
+
+def playable(rows, columns, k, moves):
+	"""Return True if no move in the sequence ended the game"""
+	position = Position(rows, columns, k)
+	for i, col in enumerate(moves):
+		piece = 1 + i % 2
+		if not position.canPlay(col) or position.isWinningMove(col, piece):
+			return False
+		position.play(col, piece)
+	return True
+
+def randomLine(rng, rows, columns, k, plies):
+	"""Return random moves for the given number of plies that never win, or None if that got stuck
+
+	Like a real player, a move that stops the opponent winning at once is always taken.
+	"""
+	position = Position(rows, columns, k)
+	moves = []
+	for ply in range(plies):
+		piece = 1 + ply % 2
+		choices = [c for c in range(columns) if position.canPlay(c) and not position.isWinningMove(c, piece)]
+		blocks = [c for c in choices if position.isWinningMove(c, 3 - piece)]
+		if blocks:
+			choices = blocks
+		if not choices:
+			return None
+		col = rng.choice(choices)
+		position.play(col, piece)
+		moves.append(col)
+	return tuple(moves)
+
+def seedLines(rows, columns, k, empty, archive, randomGames, seed):
+	"""Return the distinct move sequences that leave exactly empty cells, from an archive and random games"""
+	plies = rows*columns - empty
+	lines = []
+	if archive:
+		for game in loadGames(archive):
+			if (game.rows, game.columns, game.k) == (rows, columns, k) and len(game.moves) >= plies:
+				line = tuple(game.moves[:plies])
+				if playable(rows, columns, k, line):
+					lines.append(line)
+	rng = random.Random(seed)
+	for _ in range(randomGames):
+		line = randomLine(rng, rows, columns, k, plies)
+		if line is not None:
+			lines.append(line)
+
+	unique = {}
+	for line in lines:
+		unique.setdefault(replay(rows, columns, line, k).hash, line)
+	return [unique[key] for key in sorted(unique)]
+
+def shardPath(directory, index):
+	return os.path.join(directory, 'shard-' + str(index).rjust(4, '0') + '.tb')
+
+def solveShard(job):
+	"""Solve the trees below one shard's seeds and save them as a tablebase file"""
+	rows, columns, k, lines, path = job
+	values = {} # Shared by the shard's seeds, their endgames overlap a lot
+	for line in lines:
+		solveTree(replay(rows, columns, line, k), 1 + len(line) % 2, values)
+	writeBook(path, rows, columns, [(key, move, score) for key, (move, score) in values.items()], k, TABLEBASE_MAGIC)
+	return len(values)
+
+def prepareShards(directory, manifest):
+	"""Make the shard directory, keeping finished shards only if they came from the same options"""
+	manifestPath = os.path.join(directory, 'manifest.json')
+	try:
+		with open(manifestPath) as manifest_file:
+			if json.load(manifest_file) == manifest:
+				return
+	except (OSError, ValueError):
+		pass
+	shutil.rmtree(directory, ignore_errors=True)
+	os.makedirs(directory)
+	with open(manifestPath, 'w') as manifest_file:
+		json.dump(manifest, manifest_file)
+
+def main():
+	parser = argparse.ArgumentParser(description="Generate the Connect 4 endgame tablebase")
+	parser.add_argument('--empty', type=int, default=DEFAULT_EMPTY, help="store positions with at most this many empty cells")
+	parser.add_argument('--games', metavar='ARCHIVE', help="take seed positions from a game archive (see record.py)")
+	parser.add_argument('--random', type=int, default=1000, metavar='GAMES', help="take seed positions from this many random games")
+	parser.add_argument('--seed', type=int, default=0, help="random seed for the random games")
+	parser.add_argument('--shards', type=int, default=DEFAULT_SHARDS, help="pieces the work is split into and saved in")
+	parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="number of worker processes")
+	parser.add_argument('--keep-shards', action='store_true', help="keep the shard files after merging them")
+	parser.add_argument('-o', '--output', default=DEFAULT_TABLEBASE_PATH)
+	addBoardArguments(parser)
+	args = parser.parse_args()
+	checkBoardArguments(parser, args)
+	if not 0 < args.empty < args.rows*args.columns:
+		parser.error("--empty must be between 1 and the number of cells minus one")
+
+	start = time.perf_counter()
+	lines = seedLines(args.rows, args.columns, args.connect, args.empty, args.games, args.random, args.seed)
+	directory = args.output + '.shards'
+	prepareShards(directory, {'rows': args.rows, 'columns': args.columns, 'k': args.connect, 'empty': args.empty, 'seeds': len(lines), 'crc': zlib.crc32(repr(lines).encode()), 'shards': args.shards})
+	jobs = []
+	for index in range(args.shards):
+		path = shardPath(directory, index)
+		if openTablebase(path) is None: # Not finished on an earlier run
+			jobs.append((args.rows, args.columns, args.connect, lines[index::args.shards], path))
+	print(str(len(lines)) + " seed positions with " + str(args.empty) + " empty cells, " + str(args.shards - len(jobs)) + "/" + str(args.shards) + " shards already done")
+
+	done = args.shards - len(jobs)
+	with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+		for future in as_completed([pool.submit(solveShard, job) for job in jobs]):
+			future.result()
+			done += 1
+			print("\r" + str(done) + "/" + str(args.shards) + " shards", end='', flush=True)
+
+	entries = {}
+	for index in range(args.shards):
+		shard = OpeningBook(shardPath(directory, index), TABLEBASE_MAGIC)
+		for key, move, score in shard.entries():
+			entries[key] = (move, score)
+		shard.close()
+	writeBook(args.output, args.rows, args.columns, [(key, move, score) for key, (move, score) in entries.items()], args.connect, TABLEBASE_MAGIC)
+	if not args.keep_shards:
+		shutil.rmtree(directory)
+	print("\rWrote " + str(len(entries)) + " positions to " + args.output + " in " + str(round(time.perf_counter() - start, 1)) + "s")
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,61 @@
+"""Drop and winning line animations, stepped a frame at a time, against the game's frame budget"""
+import os
+import time
+
+import pytest
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+pytest.importorskip('pygame')
+
+import Connect4
+from engine import Position
+
+@pytest.fixture(scope='module')
+def display():
+	Connect4.args = Connect4.parseArgs([])
+	Connect4.initDisplay()
+	yield
+	Connect4.game_history.clear()
+
+def frameTimes(position, moves, winning_cells=()):
+	"""Play the columns, starting each piece's fall, and time every frame until the animations end"""
+	Connect4.drawBoard(position)
+	Connect4.updateDisplay()
+	renderer = Connect4.getRenderer(position)
+	piece = 1 + position.moves % 2
+	for col in moves:
+		row = Connect4.getNextOpenRow(position, col)
+		Connect4.dropPiece(position, row, col, piece)
+		Connect4.animateDrop(position, row, col, piece, winning_cells if col == moves[-1] else ())
+		piece = 3 - piece
+	Connect4.updateDisplay()
+	frames = []
+	while renderer.animating:
+		start = time.perf_counter()
+		renderer.animate(1/Connect4.FPS)
+		Connect4.updateDisplay()
+		frames.append(time.perf_counter() - start)
+	Connect4.game_history.clear()
+	return frames
+
+def checkBudget(frames):
+	budget = 1/Connect4.FPS
+	assert frames
+	assert max(frames) <= budget, "slowest frame took " + str(round(1000*max(frames), 2)) + " ms of a " + str(round(1000*budget, 2)) + " ms budget"
+
+@pytest.mark.parametrize('col', range(7))
+def test_drop_fits_frame_budget(display, col):
+	checkBudget(frameTimes(Position(6, 7), [col]))
+
+def test_two_drops_in_flight_fit_frame_budget(display):
+	position = Position(6, 7)
+	for col in [3, 3, 2, 4, 2]:
+		position.play(col, 1 + position.moves % 2)
+	checkBudget(frameTimes(position, [0, 6]))
+
+def test_winning_line_fits_frame_budget(display):
+	position = Position(6, 7)
+	for col in [0, 6, 1, 6, 2, 6]:
+		position.play(col, 1 + position.moves % 2)
+	checkBudget(frameTimes(position, [3], [(0, c) for c in range(4)]))
@@ -0,0 +1,40 @@
+"""batch.py against the engine, on boards where k doesn't fit every direction as well"""
+import random
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+import batch
+from engine import Position
+
+SIZES = [(6, 7, 4), (4, 6, 6), (6, 7, 7), (6, 7, 8), (7, 4, 6), (5, 5, 5)]
+
+def randomPositions(rows, columns, k, count, seed):
+	"""Yield (position, piece to move) after random moves, some of them ending the game"""
+	rng = random.Random(seed)
+	for _ in range(count):
+		position = Position(rows, columns, k)
+		piece = 1
+		for _ in range(rng.randrange(rows*columns)):
+			col = rng.choice([c for c in range(columns) if position.canPlay(c)])
+			row = position.play(col, piece)
+			piece = 3 - piece
+			if position.winningCells(row, col) or position.isFull():
+				break
+		yield position, piece
+
+@pytest.mark.parametrize('rows, columns, k', SIZES)
+def test_matches_engine(rows, columns, k):
+	positions = list(randomPositions(rows, columns, k, 200, rows*100 + columns*10 + k))
+	result = batch.evaluate(batch.toArray(position for position, _ in positions), 1, k)
+	for n, (position, _) in enumerate(positions):
+		expected = 1 if position.isWin(1) else 2 if position.isWin(2) else 0
+		assert result.winners[n] == expected
+		if expected:
+			continue # isWinningMove() is true everywhere on a board that is already won
+		for col in range(columns):
+			assert result.legal[n, col] == position.canPlay(col)
+			if position.canPlay(col):
+				assert result.wins[n, col] == position.isWinningMove(col, 1)
+				assert result.blocks[n, col] == position.isWinningMove(col, 2)
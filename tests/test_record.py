@@ -0,0 +1,32 @@
+"""Appending to an archive that a crash left with a record cut short"""
+import os
+
+import record
+
+GAMES = [([3, 3, 4, 4], record.TIE), ([0, 1, 0, 1, 0, 1, 0], record.RED_WINS)]
+MORE = [([6, 5, 4], record.UNFINISHED), ([2, 2, 2], record.YELLOW_WINS)]
+
+def writeGames(path, games):
+	writer = record.RecordWriter(path)
+	for moves, result in games:
+		writer.write(moves, 0, result, 6, 7)
+	writer.close()
+
+def readGames(path):
+	return [(list(game.moves), game.result) for game in record.loadGames(path)]
+
+def test_append_after_cut_record(tmp_path):
+	last = len(record.encodeGame(record.GameRecord(bytes(GAMES[-1][0]), 0, GAMES[-1][1], 6, 7, 0)))
+	for cut in range(1, last):
+		path = str(tmp_path / ('games' + str(cut) + '.c4r'))
+		writeGames(path, GAMES)
+		os.truncate(path, os.path.getsize(path) - cut)
+		writeGames(path, MORE)
+		assert readGames(path) == GAMES[:-1] + MORE
+
+def test_append_after_cut_file_header(tmp_path):
+	path = str(tmp_path / 'games.c4r')
+	writeGames(path, GAMES)
+	os.truncate(path, record.FILE_HEADER.size - 1)
+	writeGames(path, MORE)
+	assert readGames(path) == MORE
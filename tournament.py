@@ -0,0 +1,133 @@
+"""Headless AI vs AI matches, played in parallel and reported as win/draw/loss and Elo
+
+Example: `python tournament.py hard expert --games 200 --output results.jsonl`
+"""
+import os
+import sys
+import math
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from engine import TrackedPosition, addBoardArguments, checkBoardArguments
+from search import DEFAULT_BUDGET_MS
+from book import openBook
+from tablebase import openTablebase
+from ai import AIPlayer, DIFFICULTY_NAMES
+
+LEVELS = {name.lower(): difficulty for difficulty, name in DIFFICULTY_NAMES.items()}
+
+_players = {}
+
+def level(name):
+	"""argparse type accepting a difficulty name or number"""
+	if name.isdigit() and int(name) in DIFFICULTY_NAMES:
+		return int(name)
+	if name.lower() in LEVELS:
+		return LEVELS[name.lower()]
+	raise argparse.ArgumentTypeError("unknown AI level " + repr(name) + ", choose from " + ", ".join(LEVELS))
+
+def getPlayer(difficulty, budgetMs, useBook):
+	"""Return this process's player for the difficulty, so search tables are allocated once"""
+	key = (difficulty, budgetMs, useBook)
+	if key not in _players:
+		# Games already run on every core, so MCTS grows a single tree in the game's own process
+		_players[key] = AIPlayer(difficulty, budgetMs=budgetMs, book=openBook() if useBook else None, tablebase=openTablebase() if useBook else None, mctsJobs=1)
+	return _players[key]
+
+def playGame(job):
+	"""Play one seeded game and return its result record"""
+	game, seed, first, second, budgetMs, useBook, rows, columns, k = job
+	start = time.perf_counter()
+	swapped = game % 2 == 1 # Alternate colors so neither side keeps the first move advantage
+	players = {1: second if swapped else first, 2: first if swapped else second}
+	for piece, difficulty in players.items():
+		getPlayer(difficulty, budgetMs, useBook).newGame(seed*2 + piece)
+
+	position = TrackedPosition(rows, columns, k) # Keeps the line counts the Medium and Hard players read
+	moves = []
+	winner = 0
+	piece = 1
+	while not position.isFull():
+		col = getPlayer(players[piece], budgetMs, useBook).chooseMove(position, piece)
+		row = position.play(col, piece)
+		moves.append(col)
+		if position.winningCells(row, col):
+			winner = piece
+			break
+		piece = 3 - piece
+
+	if not winner:
+		result = 0.5
+	else:
+		result = 1.0 if (winner == 1) != swapped else 0.0
+	return {
+		'game': game,
+		'seed': seed,
+		'red': DIFFICULTY_NAMES[players[1]],
+		'yellow': DIFFICULTY_NAMES[players[2]],
+		'rows': rows,
+		'columns': columns,
+		'k': k,
+		'winner': winner,
+		'first_score': result,
+		'moves': moves,
+		'seconds': round(time.perf_counter() - start, 4),
+	}
+
+def eloDifference(score):
+	"""Elo difference implied by an expected score, clamped to +-800 for shutouts"""
+	if score <= 0.0:
+		return -800.0
+	if score >= 1.0:
+		return 800.0
+	return max(-800.0, min(800.0, -400*math.log10(1/score - 1)))
+
+def main():
+	parser = argparse.ArgumentParser(description="Play AI levels against each other without a display")
+	parser.add_argument('first', type=level, help="first AI level (easy, medium, hard, expert)")
+	parser.add_argument('second', type=level, help="second AI level")
+	parser.add_argument('--games', type=int, default=100)
+	parser.add_argument('--seed', type=int, default=0, help="base seed, game i uses seed+i")
+	parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="number of worker processes")
+	parser.add_argument('--ai-time', type=int, default=DEFAULT_BUDGET_MS//10, metavar='MS', help="Expert and MCTS thinking time per move")
+	parser.add_argument('--no-book', action='store_true', help="don't let the AI use the opening book or the endgame tablebase")
+	parser.add_argument('--output', help="stream per game results to this JSONL file")
+	addBoardArguments(parser)
+	args = parser.parse_args()
+	checkBoardArguments(parser, args)
+
+	jobs = [(game, args.seed + game, args.first, args.second, args.ai_time, not args.no_book, args.rows, args.columns, args.connect) for game in range(args.games)]
+	wins = draws = losses = 0
+	start = time.perf_counter()
+	output = open(args.output, 'w') if args.output else None
+	try:
+		with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+			for future in as_completed([pool.submit(playGame, job) for job in jobs]):
+				record = future.result()
+				if output:
+					output.write(json.dumps(record) + "\n")
+					output.flush()
+				if record['first_score'] == 1.0:
+					wins += 1
+				elif record['first_score'] == 0.0:
+					losses += 1
+				else:
+					draws += 1
+	finally:
+		if output:
+			output.close()
+
+	elapsed = time.perf_counter() - start
+	games = wins + draws + losses
+	score = (wins + draws/2)/games if games else 0.5
+	# Standard error of the mean score, turned into an Elo margin around the estimate
+	deviation = math.sqrt(max((wins*(1 - score)**2 + draws*(0.5 - score)**2 + losses*score**2)/max(games, 1), 0.0)/max(games, 1))
+	low, high = eloDifference(score - 1.96*deviation), eloDifference(score + 1.96*deviation)
+	print(DIFFICULTY_NAMES[args.first] + " vs " + DIFFICULTY_NAMES[args.second] + ": " + str(wins) + " wins, " + str(draws) + " draws, " + str(losses) + " losses")
+	print("Score " + str(round(100*score, 1)) + "%, Elo " + str(round(eloDifference(score))) + " (95% " + str(round(low)) + " to " + str(round(high)) + ")")
+	print(str(games) + " games in " + str(round(elapsed, 1)) + "s (" + str(round(games/elapsed, 2)) + " games/sec)")
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,94 @@
+"""Runs AI moves on a background thread so the game keeps drawing while the AI thinks
+
+While the human is deciding, the worker ponders: it guesses the human's reply from the
+search table and starts searching the position after it. If the guess comes true, that
+search simply gets a real deadline and its result is used; otherwise it is stopped.
+"""
+import time
+import threading
+
+from ai import ENDGAME_EMPTY
+
+class AIWorker:
+	"""Background move computation (and pondering) for one AIPlayer"""
+
+	def __init__(self, player):
+		self.player = player
+		self.thread = None
+		self.result = None
+		self.position = None # Position the current job is searching from, after any guessed reply
+		self.pondering = False
+		self.started = 0.0 # When the position on the board was handed to start()
+		self.seconds = 0.0 # How long the last move took from start() until poll() returned it
+
+	@property
+	def thinking(self):
+		"""True while a move is being computed for the position on the board"""
+		return self.thread is not None and not self.pondering
+
+	def start(self, position, piece):
+		"""Begin choosing a move for the piece, reusing the ponder search if it guessed right"""
+		self.started = time.perf_counter()
+		if self.pondering and self.position.hash == position.hash:
+			self.pondering = False
+			self.player.searcher.deadline = time.perf_counter() + self.player.budgetMs/1000
+			return
+		self.cancel()
+		self.position = position.copy()
+		self._run(self._choose, piece)
+
+	def ponder(self, position, piece):
+		"""Search the piece's answer to the reply the human is expected to play next"""
+		self.cancel()
+		searcher = self.player.searcher
+		if searcher is None or position.isFull():
+			return
+		reply = searcher.predictedMove(position)
+		if reply is None:
+			return
+		guess = position.copy()
+		row = guess.play(reply, 3 - piece)
+		if guess.winningCells(row, reply) or guess.isFull() or any(table and table.lookup(guess) for table in (self.player.book, self.player.tablebase)):
+			return # Nothing worth pondering, the move will be instant anyway
+		if guess.rows*guess.columns - guess.moves <= ENDGAME_EMPTY:
+			return # Solved exactly instead of searched, see AIPlayer.chooseMove()
+		self.position = guess
+		self.pondering = True
+		searcher.deadline = float('inf') # Until the human moves, see start()
+		self._run(self._ponder, piece)
+
+	def poll(self):
+		"""Return the chosen column once the move is ready, otherwise None"""
+		if self.thread is None or self.pondering or self.thread.is_alive():
+			return None
+		self.thread.join()
+		self.thread = None
+		self.seconds = time.perf_counter() - self.started
+		return self.result
+
+	def cancel(self):
+		"""Stop any running search and wait for the thread to finish"""
+		if self.thread is None:
+			return
+		for engine in (self.player.searcher, self.player.mcts):
+			if engine:
+				engine.stop()
+		self.thread.join()
+		self.thread = None
+		self.pondering = False
+
+	def _run(self, target, piece):
+		"""Start target(piece) on a fresh daemon thread"""
+		self.result = None
+		for engine in (self.player.searcher, self.player.mcts):
+			if engine:
+				engine.stopped = False
+		self.thread = threading.Thread(target=target, args=(piece,), daemon=True)
+		self.thread.start()
+
+	def _choose(self, piece):
+		self.result = self.player.chooseMove(self.position, piece)
+
+	def _ponder(self, piece):
+		self.player.lastResult = self.player.searcher.search(self.position, piece, None)
+		self.result = self.player.lastResult.move